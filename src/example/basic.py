@@ -6,10 +6,12 @@ import sys; sys.path.append('../')  # silly hack to get the zalia package
 
 # library imports
 from src.showcase.maker.simple import SimpleMakerFacade, SimpleGraphKey, SimpleGraphMemento
+from src.showcase.maker.autotrace import SimpleModuleTracer
 from src.showcase.database.simple import SimpleGraphDB
 
 # external imports
 import gym
+import torch
 
 '''
 Set up maker facade.
@@ -22,4 +24,11 @@ facade: SimpleMakerFacade[SimpleGraphMemento] = SimpleMakerFacade(graph = graph)
 Set up a computation.
 '''
 
-# @TODO.
\ No newline at end of file
+network: torch.nn.Module = torch.nn.Sequential(torch.nn.Linear(4, 16), torch.nn.ReLU(), torch.nn.Linear(16, 2))
+
+'''
+Trace the computation.
+'''
+
+with SimpleModuleTracer(facade = facade, module = network), torch.no_grad():
+    network(torch.zeros(1, 4))
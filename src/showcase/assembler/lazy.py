@@ -0,0 +1,306 @@
+'''
+Lazy* Collection.
+
+Loads subtrees on demand for front-end drill-down and prefetches the nodes a user is likely to expand next.
+'''
+
+# built-in imports
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from threading import Lock
+from typing import Any, Callable, Generic, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+# library imports
+from ._types import DisplayableComponent
+from .simple import SimpleAssembler, SimpleKey
+
+from ..database import StatefulVertexGraphTraversalInterface
+
+
+'''
+Types.
+'''
+
+class LazySubtree(NamedTuple):
+    '''
+    A loaded vertex with its component and the subtrees loaded beneath it, which are empty past the requested depth.
+    '''
+
+    key: Any
+    component: Any
+    children: List['LazySubtree']
+
+
+'''
+Concrete classes.
+'''
+
+class PrefetchingSubtreeLoader\
+(
+    Generic[DisplayableComponent]
+):
+    '''
+    Class that can expand subtrees through a `SimpleAssembler` while prefetching likely expansions in the background.
+
+    Components and child lists share an LRU cache bounded by `budget`, measured by `sizer`. By default a component is one
+    unit and a child list is a unit a key. A cached child list is checked for children appended since with one
+    `.load_successor_range(..)` from its end, so expanding a vertex that is still being traced shows its new children.
+    Marking nodes as visible prefetches their children and the next `siblings` siblings after each of them on
+    `workers` background threads. A prefetch of a key that is not in the graph is skipped, and any other error a prefetch
+    raises is counted in `_errors` and kept in `_last_error` rather than raised, since nothing waits on its result.
+    '''
+
+    __assembler: SimpleAssembler[DisplayableComponent]
+    __graph: StatefulVertexGraphTraversalInterface[SimpleKey, Any]
+    __budget: int
+    __sizer: Callable[[Any], int]
+    __siblings: int
+    __cache: 'OrderedDict[Tuple[str, SimpleKey], Tuple[Any, int]]'
+    __used: int
+    __lock: Lock
+    __executor: ThreadPoolExecutor
+    __pending: Set[SimpleKey]
+    __futures: Set['Future[None]']
+    __hits: int
+    __misses: int
+    __errors: int
+    __last_error: Optional[BaseException]
+
+    '''
+    Dunder and property methods.
+    '''
+
+    def __init__(self, assembler: SimpleAssembler[DisplayableComponent], graph: StatefulVertexGraphTraversalInterface[SimpleKey, Any], budget: int = 4096, sizer: Optional[Callable[[Any], int]] = None, siblings: int = 2, workers: int = 2, *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up a loader that builds components with this `assembler` and finds children in this `graph`.
+        '''
+        self.__assembler = assembler
+
+        self.__graph = graph
+
+        self.__budget = budget
+
+        self.__sizer = sizer if sizer is not None else _default_size
+
+        self.__siblings = siblings
+
+        self.__cache = OrderedDict()
+
+        self.__used = 0
+
+        self.__lock = Lock()
+
+        self.__executor = ThreadPoolExecutor(max_workers = workers)
+
+        self.__pending = set()
+
+        self.__futures = set()
+
+        self.__hits = 0
+
+        self.__misses = 0
+
+        self.__errors = 0
+
+        self.__last_error = None
+
+        return None
+
+    def __enter__(self) -> 'PrefetchingSubtreeLoader[DisplayableComponent]': return self
+
+    def __exit__(self, *args: Any) -> None: self.close_()
+
+    @property
+    def _hits(self) -> int: return self.__hits
+
+    @property
+    def _misses(self) -> int: return self.__misses
+
+    @property
+    def _used(self) -> int: return self.__used
+
+    @property
+    def _errors(self) -> int: return self.__errors
+
+    @property
+    def _last_error(self) -> Optional[BaseException]: return self.__last_error
+
+    '''
+    Loader logic.
+    '''
+
+    def get_component(self, key: SimpleKey, *args: Any, **kwargs: Any) -> DisplayableComponent:
+        '''
+        Gets the `DisplayableComponent` for this `key` from the cache, or else through the assembler.
+        '''
+        return self.__cached(kind = 'component', key = key, load = self.__assembler.get_component)
+
+    def get_children(self, key: SimpleKey, *args: Any, **kwargs: Any) -> List[SimpleKey]:
+        '''
+        Gets the keys of the children of this `key` from the cache, or else from the graph, with any appended since.
+        '''
+        children: List[SimpleKey] = self.__cached(kind = 'children', key = key, load = self.__load_children)
+
+        appended: List[SimpleKey] = self.__graph.load_successor_range(label = key, start = len(children))
+
+        if not appended: return children
+
+        children = children + appended
+
+        self.__admit(entry = ('children', key), value = children, replace = True)
+
+        return children
+
+    def expand(self, key: SimpleKey, depth: int = 1, *args: Any, **kwargs: Any) -> LazySubtree:
+        '''
+        Loads the subtree under this `key` down to this `depth` and prefetches one level beyond its deepest nodes.
+        '''
+        edge: List[SimpleKey] = list()
+
+        def load(key: SimpleKey, level: int) -> LazySubtree:
+            if level == depth:
+                edge.append(key)
+
+                return LazySubtree(key = key, component = self.get_component(key = key), children = list())
+
+            return LazySubtree(key = key, component = self.get_component(key = key), children = [ load(key = child, level = level + 1) for child in self.get_children(key = key) ])
+
+        subtree: LazySubtree = load(key = key, level = 0)
+
+        self.mark_visible_(keys = edge)
+
+        return subtree
+
+    def mark_visible_(self, keys: Iterable[SimpleKey], *args: Any, **kwargs: Any) -> None:
+        '''
+        Prefetches the children of these visible `keys` and the siblings that follow them in the background.
+        '''
+        for key in keys:
+            with self.__lock:
+                if key in self.__pending: continue
+
+                self.__pending.add(key)
+
+            future: 'Future[None]' = self.__executor.submit(self.__prefetch, key)
+
+            with self.__lock: self.__futures.add(future)
+
+            # a future that is already done runs its callback here, so the lock must not be held.
+
+            future.add_done_callback(self.__forget)
+
+        return None
+
+    def wait_(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Waits for every prefetch that has been scheduled so far.
+        '''
+        with self.__lock: futures: List['Future[None]'] = list(self.__futures)
+
+        wait(futures)
+
+        return None
+
+    def close_(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Cancels any prefetch that has not started and stops the background threads.
+        '''
+        self.__executor.shutdown(wait = True, cancel_futures = True)
+
+        return None
+
+    def __prefetch(self, key: SimpleKey) -> None:
+        '''
+        Loads the children of this `key` and the siblings that follow it into the cache.
+        '''
+        try:
+            for child in self.get_children(key = key): self.get_component(key = child)
+
+            for parent in self.__graph.load_predecessors(label = key):
+                siblings: List[SimpleKey] = self.get_children(key = parent)
+
+                position: int = siblings.index(key) if key in siblings else len(siblings)
+
+                for sibling in siblings[position + 1:position + 1 + self.__siblings]: self.get_component(key = sibling)
+
+        except KeyError: pass
+
+        except Exception as error:
+            with self.__lock:
+                self.__errors += 1
+
+                self.__last_error = error
+
+        finally:
+            with self.__lock: self.__pending.discard(key)
+
+    def __forget(self, future: 'Future[None]') -> None:
+        '''
+        Drops this finished `future` from the scheduled prefetches.
+        '''
+        with self.__lock: self.__futures.discard(future)
+
+    def __load_children(self, key: SimpleKey) -> List[SimpleKey]:
+        '''
+        Loads the keys of the children of this `key` from the graph.
+        '''
+        return list(self.__graph.load_successors(label = key))
+
+    def __cached(self, kind: str, key: SimpleKey, load: Callable[..., Any]) -> Any:
+        '''
+        Gets this `kind` of entry for this `key` from the LRU cache, loading and admitting it on a miss.
+        '''
+        entry: Tuple[str, SimpleKey] = (kind, key)
+
+        with self.__lock:
+            cached: Optional[Tuple[Any, int]] = self.__cache.get(entry)
+
+            if cached is not None:
+                self.__cache.move_to_end(entry)
+
+                self.__hits += 1
+
+                return cached[0]
+
+            self.__misses += 1
+
+        value: Any = load(key = key)
+
+        self.__admit(entry = entry, value = value)
+
+        return value
+
+    def __admit(self, entry: Tuple[str, SimpleKey], value: Any, replace: bool = False) -> None:
+        '''
+        Admits this `value` under this `entry` unless it is already cached or is over budget, evicting down to the budget.
+
+        If `replace` is true, a cached value is replaced, or dropped if the new value is over budget.
+        '''
+        size: int = self.__sizer(value)
+
+        with self.__lock:
+            if entry in self.__cache:
+                if not replace: return None
+
+                self.__used -= self.__cache.pop(entry)[1]
+
+            if size > self.__budget: return None
+
+            self.__cache[entry] = (value, size)
+
+            self.__used += size
+
+            while self.__used > self.__budget: self.__used -= self.__cache.popitem(last = False)[1][1]
+
+        return None
+
+
+'''
+Helper functions.
+'''
+
+def _default_size(value: Any) -> int:
+    '''
+    Sizes a child list as a unit a key and any other cache entry as one unit.
+    '''
+    return max(len(value), 1) if isinstance(value, list) else 1
@@ -0,0 +1,139 @@
+'''
+Tests the Lazy* Collection in the assembler module.
+'''
+
+# built-in imports
+from typing import Any
+
+# library imports
+from ..lazy import LazySubtree, PrefetchingSubtreeLoader
+from ..simple import SimpleAssembler
+
+from ...database.simple import SimpleGraphDB
+
+
+'''
+Mock-ups for testing.
+'''
+
+class MockFailingGraphDB(SimpleGraphDB[int, str]):
+    '''
+    Graph whose predecessors can never be loaded, as if its backend were unreachable.
+    '''
+
+    def load_predecessors(self, label: int, *args: Any, **kwargs: Any) -> Any: raise RuntimeError('unreachable backend')
+
+
+def mock_graph() -> SimpleGraphDB[int, str]:
+    '''
+    Makes a tree where the root `0` has children `1` to `4` and each of those has two children of its own.
+    '''
+    graph_db: SimpleGraphDB[int, str] = SimpleGraphDB()
+
+    graph_db.write_stateful_vertex_(label = 0, data = 'root')
+
+    for child in range(1, 5):
+        graph_db.write_stateful_vertex_(label = child, data = 'child-%d' % child)
+
+        graph_db.write_stateless_directed_edge_(source = 0, destination = child)
+
+        for grandchild in (10 * child, 10 * child + 1):
+            graph_db.write_stateful_vertex_(label = grandchild, data = 'grandchild-%d' % grandchild)
+
+            graph_db.write_stateless_directed_edge_(source = child, destination = grandchild)
+
+    return graph_db
+
+
+'''
+Unit tests for lazy loading.
+'''
+
+def test_prefetching_subtree_loader() -> None:
+    '''
+    Tests that a `PrefetchingSubtreeLoader` expands to a depth and prefetches what is likely to be expanded next.
+    '''
+    graph_db: SimpleGraphDB[int, str] = mock_graph()
+
+    with PrefetchingSubtreeLoader(assembler = SimpleAssembler(database = graph_db), graph = graph_db) as loader:
+
+        # test expanding to a depth
+
+        subtree: LazySubtree = loader.expand(key = 0, depth = 1)
+
+        assert subtree.component == 'root' and [ child.key for child in subtree.children ] == [1, 2, 3, 4], 'expected <%s>.expand(..) to load the children of the key.' % PrefetchingSubtreeLoader.__name__
+
+        assert all(not child.children for child in subtree.children), 'expected <%s>.expand(..) to stop at the depth.' % PrefetchingSubtreeLoader.__name__
+
+        # test that the next level was prefetched
+
+        loader.wait_()
+
+        misses: int = loader._misses  # type: ignore private usage
+
+        assert [ child.component for child in loader.expand(key = 2, depth = 1).children ] == ['grandchild-20', 'grandchild-21'], 'expected <%s>.expand(..) to load grandchildren.' % PrefetchingSubtreeLoader.__name__
+
+        assert loader._misses == misses, 'expected <%s>.mark_visible_(..) to have prefetched the grandchildren.' % PrefetchingSubtreeLoader.__name__  # type: ignore private usage
+
+        # test that siblings of a visible key are prefetched
+
+        loader.mark_visible_(keys = [20]); loader.wait_()
+
+        misses = loader._misses  # type: ignore private usage
+
+        assert loader.get_component(key = 21) == 'grandchild-21' and loader._misses == misses, 'expected <%s>.mark_visible_(..) to prefetch siblings.' % PrefetchingSubtreeLoader.__name__  # type: ignore private usage
+
+    # test the memory budget
+
+    with PrefetchingSubtreeLoader(assembler = SimpleAssembler(database = graph_db), graph = graph_db, budget = 3) as loader:
+        for key in range(1, 5): loader.get_component(key = key)
+
+        assert loader._used == 3, 'expected <%s> to evict down to its budget.' % PrefetchingSubtreeLoader.__name__  # type: ignore private usage
+
+        misses = loader._misses  # type: ignore private usage
+
+        loader.get_component(key = 1)
+
+        assert loader._misses == misses + 1, 'expected <%s> to evict the least recently used component.' % PrefetchingSubtreeLoader.__name__  # type: ignore private usage
+
+        try:
+            loader.get_component(key = 99)
+
+            raise AssertionError('expected <%s>.get_component(..) to raise a key error for an unknown key.' % PrefetchingSubtreeLoader.__name__) # pragma: no cover
+
+        except KeyError: pass # check passed
+
+    # test that a cached child list picks up children appended since, and is sized by its keys
+
+    with PrefetchingSubtreeLoader(assembler = SimpleAssembler(database = graph_db), graph = graph_db, budget = 8) as loader:
+        assert [ child.key for child in loader.expand(key = 1, depth = 1).children ] == [10, 11], 'expected <%s>.expand(..) to load the children of the key.' % PrefetchingSubtreeLoader.__name__
+
+        graph_db.write_stateful_vertex_(label = 12, data = 'grandchild-12')
+
+        graph_db.write_stateless_directed_edge_(source = 1, destination = 12)
+
+        assert [ child.key for child in loader.expand(key = 1, depth = 1).children ] == [10, 11, 12], 'expected <%s>.expand(..) to show children appended since they were cached.' % PrefetchingSubtreeLoader.__name__
+
+        loader.wait_()
+
+        assert loader.get_children(key = 1) == [10, 11, 12] and loader._used <= 8, 'expected <%s> to keep within its budget.' % PrefetchingSubtreeLoader.__name__  # type: ignore private usage
+
+    with PrefetchingSubtreeLoader(assembler = SimpleAssembler(database = graph_db), graph = graph_db) as loader:
+        loader.get_children(key = 0)
+
+        assert loader._used == 4, 'expected <%s> to size a child list by its keys.' % PrefetchingSubtreeLoader.__name__  # type: ignore private usage
+
+    # test that a failing prefetch is counted rather than dropped
+
+    failing_db: MockFailingGraphDB = MockFailingGraphDB()
+
+    failing_db.write_stateful_vertex_(label = 0, data = 'root')
+
+    with PrefetchingSubtreeLoader(assembler = SimpleAssembler(database = failing_db), graph = failing_db) as loader:
+        loader.mark_visible_(keys = [0]); loader.wait_()
+
+        assert loader._errors == 1 and isinstance(loader._last_error, RuntimeError), 'expected <%s> to count a failed prefetch.' % PrefetchingSubtreeLoader.__name__  # type: ignore private usage
+
+    # all tests passed
+
+    return None
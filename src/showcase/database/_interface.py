@@ -6,7 +6,7 @@ See https://github.com/ZaliaFlow/decode-py/issues/5.
 
 # built-in imports
 from abc import abstractmethod, ABC
-from typing import Any, Generic
+from typing import Any, Generic, Iterable, Iterator, List, Optional, Tuple
 
 # library imports
 from ._types import VertexLabel, VertexData
@@ -38,6 +38,61 @@ class StatefulVertexGraphLoaderInterface(Generic[VertexLabel, VertexData], ABC):
         raise NotImplementedError('%s requires a .load_stateful_vertex(..) abstract method.' % StatefulVertexGraphWriterInterface.__name__)
 
 
+class StatefulVertexGraphTraversalInterface(Generic[VertexLabel, VertexData], ABC):
+    '''
+    ABC for objects that can lazily walk a graph-like structure, yielding `(label, data)` pairs.
+    '''
+
+    @abstractmethod
+    def load_successors(self, label: VertexLabel, *args: Any, **kwargs: Any) -> Iterable[VertexLabel]:
+        '''
+        Loads the labels of vertices at the end of edges from the vertex with this `label`.
+        '''
+        raise NotImplementedError('%s requires a .load_successors(..) abstract method.' % StatefulVertexGraphTraversalInterface.__name__)
+
+    @abstractmethod
+    def load_successor_range(self, label: VertexLabel, start: int, stop: Optional[int] = None, *args: Any, **kwargs: Any) -> List[VertexLabel]:
+        '''
+        Loads the labels of the successors of the vertex with this `label` from position `start` up to position `stop`.
+        '''
+        raise NotImplementedError('%s requires a .load_successor_range(..) abstract method.' % StatefulVertexGraphTraversalInterface.__name__)
+
+    @abstractmethod
+    def load_predecessors(self, label: VertexLabel, *args: Any, **kwargs: Any) -> Iterable[VertexLabel]:
+        '''
+        Loads the labels of vertices at the start of edges to the vertex with this `label`.
+        '''
+        raise NotImplementedError('%s requires a .load_predecessors(..) abstract method.' % StatefulVertexGraphTraversalInterface.__name__)
+
+    @abstractmethod
+    def iterate_children(self, label: VertexLabel, *args: Any, **kwargs: Any) -> Iterator[Tuple[VertexLabel, VertexData]]:
+        '''
+        Yields a `(label, data)` pair for each successor of the vertex with this `label`.
+        '''
+        raise NotImplementedError('%s requires an .iterate_children(..) abstract method.' % StatefulVertexGraphTraversalInterface.__name__)
+
+    @abstractmethod
+    def iterate_ancestors(self, label: VertexLabel, *args: Any, **kwargs: Any) -> Iterator[Tuple[VertexLabel, VertexData]]:
+        '''
+        Yields a `(label, data)` pair for each ancestor of the vertex with this `label`, nearest first.
+        '''
+        raise NotImplementedError('%s requires an .iterate_ancestors(..) abstract method.' % StatefulVertexGraphTraversalInterface.__name__)
+
+    @abstractmethod
+    def iterate_depth_first(self, label: VertexLabel, depth: Optional[int] = None, *args: Any, **kwargs: Any) -> Iterator[Tuple[VertexLabel, VertexData]]:
+        '''
+        Yields a `(label, data)` pair for each descendant of the vertex with this `label` in depth-first pre-order, at most `depth` edges away.
+        '''
+        raise NotImplementedError('%s requires an .iterate_depth_first(..) abstract method.' % StatefulVertexGraphTraversalInterface.__name__)
+
+    @abstractmethod
+    def iterate_breadth_first(self, label: VertexLabel, depth: Optional[int] = None, *args: Any, **kwargs: Any) -> Iterator[Tuple[VertexLabel, VertexData]]:
+        '''
+        Yields a `(label, data)` pair for each descendant of the vertex with this `label` in breadth-first order, at most `depth` edges away.
+        '''
+        raise NotImplementedError('%s requires an .iterate_breadth_first(..) abstract method.' % StatefulVertexGraphTraversalInterface.__name__)
+
+
 class StatelessDirectedEdgeGraphWriterInterface(Generic[VertexLabel], ABC):
     '''
     ABC for objects that can write an unlabelled directed edge between a pair of labelled vertices in a graph-like structure.
@@ -66,3 +121,16 @@ class PartiallyStatefulDirectedGraphInterface\
     # See: https://github.com/python/typing/issues/213
 
     pass
+
+
+class EpochPublishingGraphInterface(ABC):
+    '''
+    ABC for objects that can publish the writes made since the last epoch as a new, consistent epoch of a graph-like structure.
+    '''
+
+    @abstractmethod
+    def publish_epoch_(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Publishes every write made since the last epoch so that new readers can see them.
+        '''
+        raise NotImplementedError('%s requires a .publish_epoch(..) abstract method.' % EpochPublishingGraphInterface.__name__)
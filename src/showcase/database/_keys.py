@@ -0,0 +1,21 @@
+'''
+Helpers for keying vertex data in lookup tables.
+'''
+
+# built-in imports
+from typing import Any, Hashable
+
+
+def memento_key(data: Any) -> Hashable:
+    '''
+    Keys this `data` for a lookup table, by type and value if it is hashable and by identity otherwise.
+
+    The type is part of the key because equal values of different types, such as `1`, `True` and `1.0`, must not be
+    interned as the same memento.
+    '''
+    try:
+        hash(data)
+
+        return (type(data), data)
+
+    except TypeError: return (False, id(data))
@@ -0,0 +1,336 @@
+'''
+Columnar* Collection for the database module.
+
+Numeric fields declared up front are extracted from each memento at write time into growable `numpy` columns.
+'''
+
+# built-in imports
+from typing import Any, Callable, Dict, Generic, List, Mapping, Optional, Union
+from typing_extensions import Literal, TypeAlias
+
+# library imports
+from ._types import VertexData
+from .simple import SimpleGraphDB, SimpleVertexLabel
+
+# external imports
+import numpy as np
+
+
+'''
+Types.
+'''
+
+ColumnarField: TypeAlias = Union[str, Callable[[Any], Optional[float]]]
+
+ColumnarReduction: TypeAlias = Literal['count', 'sum', 'mean', 'min', 'max']
+
+
+'''
+Concrete classes.
+'''
+
+class ColumnarAttributeStore:
+    '''
+    Class that can keep declared numeric fields of mementos in growable columns aligned with their vertex labels.
+
+    A field is either the name of a memento attribute or a callable that extracts a number from a memento; a missing
+    value is stored as `nan`. Every row also gets a small integer code for its memento type, or for the memento itself when
+    it is a type, so that group-bys are vectorized.
+    '''
+
+    __fields: Dict[str, Callable[[Any], Optional[float]]]
+    __size: int
+    __labels: np.ndarray
+    __groups: np.ndarray
+    __columns: Dict[str, np.ndarray]
+    __group_codes: Dict[type, int]
+    __group_types: List[type]
+
+    '''
+    Dunder and property methods.
+    '''
+
+    def __init__(self, fields: Mapping[str, ColumnarField], capacity: int = 1024, *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up an empty column for each of these `fields` with room for `capacity` vertices.
+        '''
+        self.__fields = { name: _make_extractor(field = field) for name, field in fields.items() }
+
+        self.__size = 0
+
+        self.__labels = np.empty(capacity, dtype = np.int64)
+
+        self.__groups = np.empty(capacity, dtype = np.int64)
+
+        self.__columns = { name: np.empty(capacity, dtype = np.float64) for name in self.__fields }
+
+        self.__group_codes = dict()
+
+        self.__group_types = list()
+
+        return None
+
+    def __len__(self) -> int: return self.__size
+
+    @property
+    def fields(self) -> List[str]: return list(self.__fields)
+
+    @property
+    def labels(self) -> np.ndarray: return self.__labels[:self.__size]
+
+    @property
+    def groups(self) -> np.ndarray: return self.__groups[:self.__size]
+
+    @property
+    def group_types(self) -> List[type]: return self.__group_types
+
+    '''
+    Store logic.
+    '''
+
+    def column(self, name: str, *args: Any, **kwargs: Any) -> np.ndarray:
+        '''
+        Returns a read-only view of the column for the field with this `name`.
+        '''
+        view: np.ndarray = self.__columns[name][:self.__size]
+
+        view.flags.writeable = False
+
+        return view
+
+    def append_(self, label: int, memento: Any, *args: Any, **kwargs: Any) -> None:
+        '''
+        Appends a row for the vertex with this `label`, extracting every declared field from this `memento`.
+        '''
+        if self.__size == len(self.__labels): self.__grow_()
+
+        row: int = self.__size
+
+        group: type = memento if isinstance(memento, type) else type(memento)
+
+        code: Optional[int] = self.__group_codes.get(group)
+
+        if code is None:
+            code = self.__group_codes[group] = len(self.__group_types)
+
+            self.__group_types.append(group)
+
+        self.__labels[row] = label
+
+        self.__groups[row] = code
+
+        for name, extract in self.__fields.items():
+            value: Optional[float] = extract(memento)
+
+            self.__columns[name][row] = np.nan if value is None else value
+
+        self.__size = row + 1
+
+        return None
+
+    def query(self, *args: Any, **kwargs: Any) -> 'ColumnarQuery':
+        '''
+        Starts a query over every row of this store.
+        '''
+        return ColumnarQuery(store = self, mask = None)
+
+    def __grow_(self) -> None:
+        '''
+        Doubles the capacity of every column.
+        '''
+        capacity: int = max(2 * len(self.__labels), 1)
+
+        self.__labels = np.resize(self.__labels, capacity)
+
+        self.__groups = np.resize(self.__groups, capacity)
+
+        self.__columns = { name: np.resize(column, capacity) for name, column in self.__columns.items() }
+
+
+class ColumnarQuery:
+    '''
+    Class that can filter, group and reduce the columns of a `ColumnarAttributeStore` without a Python loop per row.
+
+    Queries are immutable: each filter returns a new query whose mask is the conjunction of the old one and the filter.
+    '''
+
+    __store: ColumnarAttributeStore
+    __mask: Optional[np.ndarray]
+
+    '''
+    Dunder and property methods.
+    '''
+
+    def __init__(self, store: ColumnarAttributeStore, mask: Optional[np.ndarray], *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up a query over the rows of this `store` selected by this boolean `mask`, or over every row.
+        '''
+        self.__store = store
+
+        self.__mask = mask
+
+        return None
+
+    def __len__(self) -> int: return len(self.__store) if self.__mask is None else int(np.count_nonzero(self.__mask))
+
+    '''
+    Query logic.
+    '''
+
+    def where(self, field: str, predicate: Callable[[np.ndarray], np.ndarray], *args: Any, **kwargs: Any) -> 'ColumnarQuery':
+        '''
+        Keeps the rows where this vectorized `predicate` holds for the column of this `field`.
+        '''
+        return self.__and(mask = np.asarray(predicate(self.__store.column(name = field)), dtype = bool))
+
+    def where_type(self, group: type, *args: Any, **kwargs: Any) -> 'ColumnarQuery':
+        '''
+        Keeps the rows whose memento type is this `group`.
+        '''
+        try: code: int = self.__store.group_types.index(group)
+
+        except ValueError: return self.__and(mask = np.zeros(len(self.__store), dtype = bool))
+
+        return self.__and(mask = self.__store.groups == code)
+
+    def labels(self, *args: Any, **kwargs: Any) -> np.ndarray:
+        '''
+        Returns the vertex labels of the selected rows.
+        '''
+        return self.__select(column = self.__store.labels)
+
+    def values(self, field: str, *args: Any, **kwargs: Any) -> np.ndarray:
+        '''
+        Returns the values of this `field` for the selected rows.
+        '''
+        return self.__select(column = self.__store.column(name = field))
+
+    def reduce(self, field: str, reduction: ColumnarReduction = 'mean', *args: Any, **kwargs: Any) -> float:
+        '''
+        Reduces the values of this `field` over the selected rows, ignoring `nan` values.
+        '''
+        values: np.ndarray = self.values(field = field)
+
+        values = values[~np.isnan(values)]
+
+        if reduction == 'count': return float(len(values))
+
+        if not len(values): return float('nan') if reduction != 'sum' else 0.0
+
+        return float(_REDUCTIONS[reduction](values))
+
+    def group_by_type(self, field: str, reduction: ColumnarReduction = 'mean', *args: Any, **kwargs: Any) -> Dict[type, float]:
+        '''
+        Reduces the values of this `field` for each memento type over the selected rows, ignoring `nan` values.
+        '''
+        values: np.ndarray = self.values(field = field)
+
+        codes: np.ndarray = self.__select(column = self.__store.groups)
+
+        present: np.ndarray = ~np.isnan(values)
+
+        values, codes = values[present], codes[present]
+
+        groups: int = len(self.__store.group_types)
+
+        counts: np.ndarray = np.bincount(codes, minlength = groups)
+
+        if reduction == 'count': result: np.ndarray = counts.astype(np.float64)
+
+        elif reduction in ('sum', 'mean'):
+            result = np.bincount(codes, weights = values, minlength = groups)
+
+            if reduction == 'mean': result = result / np.maximum(counts, 1)
+
+        else:
+            result = np.full(groups, np.inf if reduction == 'min' else -np.inf)
+
+            (np.minimum if reduction == 'min' else np.maximum).at(result, codes, values)
+
+        return { self.__store.group_types[code]: float(result[code]) for code in np.flatnonzero(counts) }
+
+    def __select(self, column: np.ndarray) -> np.ndarray:
+        '''
+        Selects the rows of this `column` under the mask.
+        '''
+        return column if self.__mask is None else column[self.__mask]
+
+    def __and(self, mask: np.ndarray) -> 'ColumnarQuery':
+        '''
+        Makes a new query over the rows selected by both the mask and this `mask`.
+        '''
+        return ColumnarQuery(store = self.__store, mask = mask if self.__mask is None else self.__mask & mask)
+
+
+class ColumnarGraphDB\
+(
+    Generic[SimpleVertexLabel, VertexData],
+    SimpleGraphDB[SimpleVertexLabel, VertexData]
+):
+    '''
+    Class that can write into a `networkx.DiGraph` object while keeping declared numeric fields of each memento in columns.
+
+    Vertex labels must be integers.
+    '''
+
+    __store: ColumnarAttributeStore
+
+    '''
+    Property and dunder methods.
+    '''
+
+    def __init__(self, fields: Mapping[str, ColumnarField], *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up a `networkx.DiGraph` structure and a column for each of these `fields`.
+        '''
+        super().__init__(*args, **kwargs)
+
+        self.__store = ColumnarAttributeStore(fields = fields)
+
+        return None
+
+    @property
+    def store(self) -> ColumnarAttributeStore: return self.__store
+
+    '''
+    ABC extensions.
+    '''
+
+    def write_stateful_vertex_(self, label: SimpleVertexLabel, data: VertexData, *args: Any, **kwargs: Any) -> None:
+        '''
+        Writes a vertex with this `label` associated with this `data` and appends its declared fields to the columns.
+        '''
+        super().write_stateful_vertex_(label = label, data = data)
+
+        self.__store.append_(label = label, memento = data)
+
+        return None
+
+    '''
+    Query logic.
+    '''
+
+    def query(self, *args: Any, **kwargs: Any) -> ColumnarQuery:
+        '''
+        Starts a query over the columns of every vertex written so far.
+        '''
+        return self.__store.query()
+
+
+'''
+Helper functions.
+'''
+
+_REDUCTIONS: Dict[str, Callable[[np.ndarray], Any]] = { 'sum': np.sum, 'mean': np.mean, 'min': np.min, 'max': np.max }
+
+
+def _make_extractor(field: ColumnarField) -> Callable[[Any], Optional[float]]:
+    '''
+    Makes a callable that extracts this `field` from a memento, treating an attribute name as `getattr`.
+    '''
+    if callable(field): return field
+
+    def extract(memento: Any) -> Optional[float]: return getattr(memento, field, None)
+
+    return extract
+
@@ -0,0 +1,364 @@
+'''
+CSR* Collection for the database module.
+
+The topology of a trace is kept as compressed sparse row arrays that are brought up to date incrementally.
+'''
+
+# built-in imports
+from typing import Any, Generic, List, NamedTuple, Optional, Tuple
+from typing_extensions import TypeAlias
+
+# library imports
+from ._types import VertexData
+from .simple import SimpleGraphDB
+
+# external imports
+import numpy as np
+
+
+'''
+Types.
+'''
+
+CSRRun: TypeAlias = Tuple[np.ndarray, np.ndarray]
+
+
+class IncrementalCSR(NamedTuple):
+    '''
+    The edges of an `IncrementalCSRIndex` as a base CSR and a few sorted runs of the edges written since it was built.
+
+    The successors of `label` are `indices[indptr[label]:indptr[label + 1]]`, for labels below `len(indptr) - 1`,
+    followed by the destinations of the edges from `label` in each `(sources, destinations)` run, oldest run first.
+    '''
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    runs: List[CSRRun]
+
+
+'''
+Concrete classes.
+'''
+
+class IncrementalCSRIndex:
+    '''
+    Class that can index directed edges between non-negative integer labels as compressed sparse row arrays.
+
+    Writing an edge appends to growable edge arrays and a parent array in O(1) amortized time. Taking the index with
+    `.to_incremental_csr(..)` sorts only the `k` edges written since the last time into a new run, in O(k log k), and
+    merges runs of similar size like a binary counter, so there are only O(log E) runs and each edge is merged O(log E)
+    times. Once the runs hold more than `merge_fraction` of the base's edges, they are folded into a new base in O(V + E),
+    which is O(1 / merge_fraction) amortized an edge. `.fan_out(..)` and `.reachable_from(..)` read the runs directly.
+
+    `.to_csr(..)` also folds any runs into the base, since plain CSR arrays must hold every edge in one place.
+    '''
+
+    __size: int
+    __sources: np.ndarray
+    __destinations: np.ndarray
+    __parents: np.ndarray
+    __vertices: int
+    __indexed: int
+    __merge_fraction: float
+    __indptr: np.ndarray
+    __indices: np.ndarray
+    __runs: List[CSRRun]
+    __run_edges: int
+
+    '''
+    Dunder and property methods.
+    '''
+
+    def __init__(self, capacity: int = 1024, merge_fraction: float = 0.25, *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up empty edge arrays with room for `capacity` edges, folding runs into the base past this `merge_fraction`.
+        '''
+        self.__size = 0
+
+        self.__sources = np.empty(capacity, dtype = np.int64)
+
+        self.__destinations = np.empty(capacity, dtype = np.int64)
+
+        self.__parents = np.full(capacity, -1, dtype = np.int64)
+
+        self.__vertices = 0
+
+        self.__indexed = 0
+
+        self.__merge_fraction = merge_fraction
+
+        self.__indptr = _read_only(np.zeros(1, dtype = np.int64))
+
+        self.__indices = _read_only(np.empty(0, dtype = np.int64))
+
+        self.__runs = list()
+
+        self.__run_edges = 0
+
+        return None
+
+    def __len__(self) -> int: return self.__size
+
+    @property
+    def vertices(self) -> int: return self.__vertices
+
+    @property
+    def parents(self) -> np.ndarray: return self.__parents[:self.__vertices]
+
+    @property
+    def _runs(self) -> List[CSRRun]: return self.__runs
+
+    '''
+    Index logic.
+    '''
+
+    def append_(self, source: int, destination: int, *args: Any, **kwargs: Any) -> None:
+        '''
+        Appends an edge from this `source` to this `destination`, recording `source` as the parent of `destination`.
+        '''
+        if self.__size == len(self.__sources):
+            self.__sources = np.resize(self.__sources, 2 * len(self.__sources))
+
+            self.__destinations = np.resize(self.__destinations, 2 * len(self.__destinations))
+
+        self.__sources[self.__size] = source
+
+        self.__destinations[self.__size] = destination
+
+        self.__size += 1
+
+        vertices: int = max(source, destination) + 1
+
+        if vertices > len(self.__parents):
+            parents: np.ndarray = np.full(max(vertices, 2 * len(self.__parents)), -1, dtype = np.int64)
+
+            parents[:len(self.__parents)] = self.__parents
+
+            self.__parents = parents
+
+        if vertices > self.__vertices: self.__vertices = vertices
+
+        self.__parents[destination] = source
+
+        return None
+
+    def to_incremental_csr(self, *args: Any, **kwargs: Any) -> IncrementalCSR:
+        '''
+        Returns the base CSR arrays and the sorted runs of newer edges, indexing only the edges written since the last call.
+
+        Successors keep the order their edges were written in. The arrays are shared with the index and must not be
+        written to.
+        '''
+        if self.__indexed < self.__size:
+            sources: np.ndarray = self.__sources[self.__indexed:self.__size]
+
+            order: np.ndarray = np.argsort(sources, kind = 'stable')
+
+            self.__runs.append((_read_only(sources[order]), _read_only(self.__destinations[self.__indexed:self.__size][order])))
+
+            self.__run_edges += self.__size - self.__indexed
+
+            self.__indexed = self.__size
+
+            # merge the newest runs while they are of similar size, so that few runs are ever kept.
+
+            while len(self.__runs) > 1 and len(self.__runs[-2][0]) <= 2 * len(self.__runs[-1][0]):
+                newer: CSRRun = self.__runs.pop()
+
+                self.__runs[-1] = _merge_runs(older = self.__runs[-1], newer = newer)
+
+            if self.__run_edges > self.__merge_fraction * len(self.__indices): self.__fold_()
+
+        return IncrementalCSR(indptr = self.__indptr, indices = self.__indices, runs = list(self.__runs))
+
+    def to_csr(self, *args: Any, **kwargs: Any) -> Tuple[np.ndarray, np.ndarray]:
+        '''
+        Returns `(indptr, indices)` so that the successors of `label` are `indices[indptr[label]:indptr[label + 1]]`.
+
+        Successors keep the order their edges were written in. The arrays are shared with the index and must not be
+        written to. Any runs are folded into the base first, in O(V + E); a call with nothing new to fold is O(1).
+        '''
+        self.to_incremental_csr()
+
+        if self.__runs or len(self.__indptr) < self.__vertices + 1: self.__fold_()
+
+        return self.__indptr, self.__indices
+
+    def to_scipy(self, *args: Any, **kwargs: Any) -> Any:
+        '''
+        Returns the adjacency as a `scipy.sparse.csr_matrix`, which needs `scipy` to be installed.
+        '''
+        from scipy.sparse import csr_matrix
+
+        indptr, indices = self.to_csr()
+
+        return csr_matrix((np.ones(len(indices), dtype = np.int8), indices, indptr), shape = (self.__vertices, self.__vertices))
+
+    def fan_out(self, *args: Any, **kwargs: Any) -> np.ndarray:
+        '''
+        Returns the number of successors of every vertex.
+        '''
+        csr: IncrementalCSR = self.to_incremental_csr()
+
+        counts: np.ndarray = np.zeros(self.__vertices, dtype = np.int64)
+
+        counts[:len(csr.indptr) - 1] = np.diff(csr.indptr)
+
+        for sources, _ in csr.runs: counts += np.bincount(sources, minlength = self.__vertices)
+
+        return counts
+
+    def reachable_from(self, label: int, depth: Optional[int] = None, *args: Any, **kwargs: Any) -> np.ndarray:
+        '''
+        Returns a boolean mask of the vertices reachable from this `label` in at most `depth` steps, a level at a time.
+        '''
+        csr: IncrementalCSR = self.to_incremental_csr()
+
+        rows: int = len(csr.indptr) - 1
+
+        reached: np.ndarray = np.zeros(self.__vertices, dtype = bool)
+
+        frontier: np.ndarray = np.array([label], dtype = np.int64)
+
+        level: int = 0
+
+        while len(frontier) and (depth is None or level < depth):
+            based: np.ndarray = frontier[frontier < rows]
+
+            successors: List[np.ndarray] = [_gather(starts = csr.indptr[based], stops = csr.indptr[based + 1], values = csr.indices)]
+
+            for sources, destinations in csr.runs:
+                successors.append(_gather(starts = np.searchsorted(sources, frontier, side = 'left'), stops = np.searchsorted(sources, frontier, side = 'right'), values = destinations))
+
+            frontier = np.concatenate(successors)
+
+            frontier = np.unique(frontier[~reached[frontier]])
+
+            reached[frontier] = True
+
+            level += 1
+
+        return reached
+
+    def __fold_(self) -> None:
+        '''
+        Folds every run into new base CSR arrays that cover every vertex.
+        '''
+        vertices: int = self.__vertices
+
+        indptr: np.ndarray = np.empty(vertices + 1, dtype = np.int64)
+
+        indptr[:len(self.__indptr)] = self.__indptr
+
+        indptr[len(self.__indptr):] = self.__indptr[-1]
+
+        indices: np.ndarray = self.__indices
+
+        if self.__runs:
+            sources, destinations = self.__runs[0]
+
+            for run in self.__runs[1:]: sources, destinations = _merge_runs(older = (sources, destinations), newer = run)
+
+            indices = np.insert(indices, indptr[sources + 1], destinations)
+
+            indptr[1:] += np.cumsum(np.bincount(sources, minlength = vertices))
+
+        self.__indptr, self.__indices = _read_only(indptr), _read_only(indices)
+
+        self.__runs, self.__run_edges = list(), 0
+
+        return None
+
+
+class CSRGraphDB\
+(
+    Generic[VertexData],
+    SimpleGraphDB[int, VertexData]
+):
+    '''
+    Class that can write into a `networkx.DiGraph` object while keeping an `IncrementalCSRIndex` of its edges.
+
+    Vertex labels must be non-negative integers.
+    '''
+
+    __index: IncrementalCSRIndex
+
+    '''
+    Property and dunder methods.
+    '''
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up a `networkx.DiGraph` structure and an empty CSR index.
+        '''
+        super().__init__(*args, **kwargs)
+
+        self.__index = IncrementalCSRIndex()
+
+        return None
+
+    @property
+    def index(self) -> IncrementalCSRIndex: return self.__index
+
+    '''
+    ABC extensions.
+    '''
+
+    def write_stateless_directed_edge_(self, source: int, destination: int, *args: Any, **kwargs: Any) -> None:
+        '''
+        Writes an unlabelled edge from this `source` to this `destination` and appends it to the CSR index.
+        '''
+        super().write_stateless_directed_edge_(source = source, destination = destination)
+
+        self.__index.append_(source = source, destination = destination)
+
+        return None
+
+    '''
+    Export logic.
+    '''
+
+    def to_csr(self, *args: Any, **kwargs: Any) -> Tuple[np.ndarray, np.ndarray]:
+        '''
+        Returns the `(indptr, indices)` arrays of the edges written so far.
+        '''
+        return self.__index.to_csr()
+
+    def to_incremental_csr(self, *args: Any, **kwargs: Any) -> IncrementalCSR:
+        '''
+        Returns the base CSR arrays and the sorted runs of the edges written since, indexing only the newest edges.
+        '''
+        return self.__index.to_incremental_csr()
+
+
+'''
+Helper functions.
+'''
+
+def _merge_runs(older: CSRRun, newer: CSRRun) -> CSRRun:
+    '''
+    Merges two runs sorted by source into one, keeping the edges of the `older` run first within each source.
+    '''
+    sources: np.ndarray = np.concatenate((older[0], newer[0]))
+
+    order: np.ndarray = np.argsort(sources, kind = 'stable')
+
+    return _read_only(sources[order]), _read_only(np.concatenate((older[1], newer[1]))[order])
+
+
+def _gather(starts: np.ndarray, stops: np.ndarray, values: np.ndarray) -> np.ndarray:
+    '''
+    Gathers `values[start:stop]` for every `(start, stop)` pair at once by offsetting a flat range into each row.
+    '''
+    counts: np.ndarray = stops - starts
+
+    return values[np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())]
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    '''
+    Marks this `array` as read-only, so that arrays shared with callers cannot be written to.
+    '''
+    array.flags.writeable = False
+
+    return array
@@ -0,0 +1,310 @@
+'''
+Export* Collection for the database module.
+
+Streams a trace out of any traversable database in bounded chunks, each ending with a token that resumes the walk.
+'''
+
+# built-in imports
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from json import dumps, loads
+from struct import Struct
+from typing import Any, Callable, Dict, Generic, Hashable, Iterator, List, NamedTuple, Optional, Tuple
+from typing_extensions import Literal, TypeAlias
+
+# library imports
+from ._interface import StatefulVertexGraphTraversalInterface
+from ._types import VertexData
+from .simple import SimpleVertexLabel
+
+# external imports
+import numpy as np
+
+
+'''
+Types.
+'''
+
+ExportFormat: TypeAlias = Literal['ndjson', 'columnar']
+
+ExportRow: TypeAlias = Tuple[Any, Any, Any]
+
+_MAGIC: bytes = b'DCDE'
+
+_COLUMNAR_HEADER: Struct = Struct('<4sII')
+
+_LENGTH: Struct = Struct('<I')
+
+_EXHAUSTED: Any = object()
+
+
+class ExportChunk(NamedTuple):
+    '''
+    A chunk of `(label, parent, memento)` rows in depth-first order, where each row is a vertex and the edge into it.
+
+    `token` resumes the walk after the last row and is `None` once the walk is finished.
+    '''
+
+    rows: List[ExportRow]
+    token: Optional[str]
+
+
+'''
+Concrete classes.
+'''
+
+class StreamingGraphExporter\
+(
+    Generic[SimpleVertexLabel, VertexData]
+):
+    '''
+    Class that can export the tree under a root of a traversable database chunk by chunk, as newline-delimited JSON or as
+    a columnar binary format.
+
+    A token is the path from the root to the last row, with the position reached among each vertex's children, encoded
+    as URL-safe text, so it grows with the depth of the trace. A front-end can hand the token back to get the next chunk,
+    even from another exporter over the same database. Children appended after a token was taken are still visited as
+    long as their parent is on the path.
+
+    Children are loaded a window of at most `chunk_size` at a time with `.load_successor_range(..)`, from the position
+    reached, so a chunk holds at most one window a vertex on the path. On a database that can seek, such as a
+    `SimpleGraphDB`, a chunk then costs time in its rows and the depth of the path however wide its vertices are.
+    `.iterate_chunks(..)` also keeps its windows from one chunk to the next.
+    '''
+
+    __graph: StatefulVertexGraphTraversalInterface[SimpleVertexLabel, VertexData]
+    __root: SimpleVertexLabel
+    __chunk_size: int
+    __encoder: Callable[[VertexData], Any]
+
+    '''
+    Dunder and property methods.
+    '''
+
+    def __init__(self, graph: StatefulVertexGraphTraversalInterface[SimpleVertexLabel, VertexData], root: SimpleVertexLabel = 0, chunk_size: int = 1024, memento_encoder: Optional[Callable[[VertexData], Any]] = None, *args: Any, **kwargs: Any) -> None:  # type: ignore default label
+        '''
+        Sets up an exporter of the tree under this `root`, with at most `chunk_size` rows a chunk.
+
+        Mementos are encoded with `memento_encoder`, which defaults to the qualified name of a memento's class.
+        '''
+        self.__graph = graph
+
+        self.__root = root
+
+        self.__chunk_size = chunk_size
+
+        self.__encoder = memento_encoder if memento_encoder is not None else qualified_name
+
+        return None
+
+    @property
+    def chunk_size(self) -> int: return self.__chunk_size
+
+    '''
+    Export logic.
+    '''
+
+    def read_chunk(self, token: Optional[str] = None, *args: Any, **kwargs: Any) -> ExportChunk:
+        '''
+        Reads the chunk of rows that follows this `token`, or the first chunk if there is no `token`.
+        '''
+        rows, path = self.__resume(token = token)
+
+        return self.__walk(rows = rows, path = path, windows = dict())
+
+    def iterate_chunks(self, token: Optional[str] = None, *args: Any, **kwargs: Any) -> Iterator[ExportChunk]:
+        '''
+        Yields every chunk from this `token` onwards, starting with the first chunk if there is no `token`.
+        '''
+        rows, path = self.__resume(token = token)
+
+        windows: Dict[Hashable, Iterator[SimpleVertexLabel]] = dict()
+
+        while True:
+            chunk: ExportChunk = self.__walk(rows = rows, path = path, windows = windows)
+
+            yield chunk
+
+            if chunk.token is None: return
+
+            rows = list()
+
+    def encode_chunk(self, chunk: ExportChunk, format: ExportFormat = 'ndjson', *args: Any, **kwargs: Any) -> bytes:
+        '''
+        Encodes this `chunk` in this `format`, which is either `'ndjson'` or `'columnar'`.
+        '''
+        if format == 'ndjson': return encode_ndjson(chunk = chunk)
+
+        if format == 'columnar': return encode_columnar(chunk = chunk)
+
+        raise ValueError('%s cannot encode the %r format.' % (StreamingGraphExporter.__name__, format))
+
+    def iterate_encoded(self, format: ExportFormat = 'ndjson', token: Optional[str] = None, *args: Any, **kwargs: Any) -> Iterator[bytes]:
+        '''
+        Yields every chunk from this `token` onwards encoded in this `format`, for writing to a stream as it arrives.
+        '''
+        for chunk in self.iterate_chunks(token = token): yield self.encode_chunk(chunk = chunk, format = format)
+
+    def __resume(self, token: Optional[str]) -> Tuple[List[ExportRow], List[List[Any]]]:
+        '''
+        Decodes the path of this `token`, or starts a path at the root with its row if there is no `token`.
+        '''
+        if token is not None: return list(), decode_token(token = token)
+
+        return [(self.__root, None, self.__load(label = self.__root))], [[self.__root, 0]]
+
+    def __walk(self, rows: List[ExportRow], path: List[List[Any]], windows: Dict[Hashable, Iterator[SimpleVertexLabel]]) -> ExportChunk:
+        '''
+        Walks on from the end of this `path` until these `rows` fill a chunk, taking children from these `windows`.
+        '''
+        while path and len(rows) < self.__chunk_size:
+            frame: List[Any] = path[-1]
+
+            label: SimpleVertexLabel = frame[0]
+
+            child: Any = next(windows[label], _EXHAUSTED) if label in windows else _EXHAUSTED
+
+            # an exhausted window is reloaded from the position reached, which also finds children appended since.
+
+            if child is _EXHAUSTED:
+                windows[label] = iter(self.__graph.load_successor_range(label = label, start = frame[1], stop = frame[1] + self.__chunk_size))
+
+                child = next(windows[label], _EXHAUSTED)
+
+            if child is not _EXHAUSTED:
+                frame[1] += 1
+
+                rows.append((child, label, self.__load(label = child)))
+
+                path.append([child, 0])
+
+            else:
+                path.pop()
+
+                windows.pop(label)
+
+        return ExportChunk(rows = rows, token = encode_token(path = path) if path else None)
+
+    def __load(self, label: SimpleVertexLabel) -> Any:
+        '''
+        Loads and encodes the memento of the vertex with this `label`.
+        '''
+        return self.__encoder(self.__graph.load_stateful_vertex(label = label))  # type: ignore loader mixin
+
+
+'''
+Helper functions.
+'''
+
+def qualified_name(data: Any) -> Optional[str]:
+    '''
+    Names a memento by the module and qualified name of its class, or of itself if it is a class, keeping `None` as `None`.
+    '''
+    if data is None: return None
+
+    owner: type = data if isinstance(data, type) else type(data)
+
+    return '%s.%s' % (owner.__module__, owner.__qualname__)
+
+
+def encode_token(path: List[List[Any]]) -> str:
+    '''
+    Encodes the `[label, next child]` frames of this `path` as a URL-safe token.
+    '''
+    return urlsafe_b64encode(dumps(path, separators = (',', ':')).encode('utf-8')).decode('ascii')
+
+
+def decode_token(token: str) -> List[List[Any]]:
+    '''
+    Decodes a token made by `encode_token(..)`, raising a `ValueError` if it is malformed.
+    '''
+    try: path: Any = loads(urlsafe_b64decode(token.encode('ascii')))
+
+    except Exception as error: raise ValueError('%r is not an export token.' % token) from error
+
+    if not isinstance(path, list) or not all(isinstance(frame, list) and len(frame) == 2 and isinstance(frame[1], int) for frame in path):  # type: ignore partially unknown
+        raise ValueError('%r is not an export token.' % token)
+
+    return path  # type: ignore partially unknown
+
+
+def encode_ndjson(chunk: ExportChunk) -> bytes:
+    '''
+    Encodes this `chunk` as one JSON object a row followed by a `{"next": token}` line.
+    '''
+    lines: List[str] = [ dumps({ 'label': label, 'parent': parent, 'memento': memento }) for label, parent, memento in chunk.rows ]
+
+    lines.append(dumps({ 'next': chunk.token }))
+
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def encode_columnar(chunk: ExportChunk) -> bytes:
+    '''
+    Encodes this `chunk` of integer labels as a header, little-endian label, parent and memento index columns, a table of
+    distinct mementos and the token.
+
+    A root without a parent is stored with a parent of `-1` and the memento table is JSON.
+    '''
+    mementos: Dict[Hashable, int] = dict()
+
+    table: List[Any] = list()
+
+    indices: List[int] = list()
+
+    for _, _, memento in chunk.rows:
+        key: str = dumps(memento)
+
+        if key not in mementos:
+            mementos[key] = len(table)
+
+            table.append(memento)
+
+        indices.append(mementos[key])
+
+    labels: np.ndarray = np.array([ label for label, _, _ in chunk.rows ], dtype = '<i8')
+
+    parents: np.ndarray = np.array([ -1 if parent is None else parent for _, parent, _ in chunk.rows ], dtype = '<i8')
+
+    encoded_table: bytes = dumps(table).encode('utf-8')
+
+    encoded_token: bytes = (chunk.token or '').encode('ascii')
+
+    return b''.join\
+    ((
+        _COLUMNAR_HEADER.pack(_MAGIC, len(chunk.rows), len(encoded_table)),
+        labels.tobytes(),
+        parents.tobytes(),
+        np.array(indices, dtype = '<u4').tobytes(),
+        encoded_table,
+        _LENGTH.pack(len(encoded_token)),
+        encoded_token
+    ))
+
+
+def decode_columnar(payload: bytes) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Any], Optional[str]]:
+    '''
+    Decodes a chunk made by `encode_columnar(..)` into its label, parent and memento index columns, memento table and token.
+    '''
+    magic, count, table_size = _COLUMNAR_HEADER.unpack_from(payload)
+
+    if magic != _MAGIC: raise ValueError('payload is not a columnar export chunk.')
+
+    offset: int = _COLUMNAR_HEADER.size
+
+    labels: np.ndarray = np.frombuffer(payload, dtype = '<i8', count = count, offset = offset)
+
+    parents: np.ndarray = np.frombuffer(payload, dtype = '<i8', count = count, offset = offset + 8 * count)
+
+    indices: np.ndarray = np.frombuffer(payload, dtype = '<u4', count = count, offset = offset + 16 * count)
+
+    offset += 20 * count
+
+    table: List[Any] = loads(payload[offset:offset + table_size])
+
+    offset += table_size
+
+    (token_size,) = _LENGTH.unpack_from(payload, offset)
+
+    token: bytes = payload[offset + _LENGTH.size:offset + _LENGTH.size + token_size]
+
+    return labels, parents, indices, table, token.decode('ascii') or None
@@ -0,0 +1,230 @@
+'''
+Interning* Collection for the database module.
+
+Each distinct memento is stored once in a table and vertices in the underlying database hold only its integer id.
+'''
+
+# built-in imports
+from threading import Lock
+from typing import Any, Dict, Generic, Hashable, Iterable, List, Optional
+from typing_extensions import TypeAlias
+
+# library imports
+from ._interface import EpochPublishingGraphInterface, PartiallyStatefulDirectedGraphInterface, StatefulVertexGraphLoaderInterface
+from ._keys import memento_key
+from ._types import VertexData
+from .simple import SimpleVertexLabel
+from .traversal import SimpleGraphTraversal
+
+
+'''
+Types.
+'''
+
+MementoId: TypeAlias = int
+
+
+'''
+Concrete classes and ABC extensions.
+'''
+
+class MementoInternTable\
+(
+    Generic[VertexData]
+):
+    '''
+    Class that can map each distinct memento to a small integer id and back.
+
+    Hashable mementos are interned by value and unhashable ones by identity. Ids are handed out densely from zero, so
+    resolving an id is a list index and never needs the lock.
+    '''
+
+    __ids: Dict[Hashable, MementoId]
+    __mementos: List[VertexData]
+    __lock: Lock
+
+    '''
+    Dunder and property methods.
+    '''
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up an empty table.
+        '''
+        self.__ids = dict()
+
+        self.__mementos = list()
+
+        self.__lock = Lock()
+
+        return None
+
+    def __len__(self) -> int: return len(self.__mementos)
+
+    @property
+    def mementos(self) -> List[VertexData]: return self.__mementos
+
+    '''
+    Table logic.
+    '''
+
+    def intern_(self, data: VertexData, *args: Any, **kwargs: Any) -> MementoId:
+        '''
+        Gets the id of this `data`, giving it the next id if it has not been seen before.
+        '''
+        key: Hashable = memento_key(data)
+
+        identifier: Optional[MementoId] = self.__ids.get(key)
+
+        if identifier is not None: return identifier
+
+        with self.__lock:
+            identifier = self.__ids.get(key)
+
+            if identifier is None:
+                identifier = len(self.__mementos)
+
+                self.__mementos.append(data)
+
+                self.__ids[key] = identifier
+
+        return identifier
+
+    def find(self, data: VertexData, *args: Any, **kwargs: Any) -> Optional[MementoId]:
+        '''
+        Gets the id of this `data` without interning it, or `None` if it has not been seen.
+        '''
+        return self.__ids.get(memento_key(data))
+
+    def resolve(self, identifier: MementoId, *args: Any, **kwargs: Any) -> VertexData:
+        '''
+        Gets the memento with this `identifier`.
+        '''
+        return self.__mementos[identifier]
+
+
+class InterningGraphDB\
+(
+    Generic[SimpleVertexLabel, VertexData],
+    PartiallyStatefulDirectedGraphInterface[SimpleVertexLabel, VertexData],
+    SimpleGraphTraversal[SimpleVertexLabel, VertexData],
+    StatefulVertexGraphLoaderInterface[SimpleVertexLabel, VertexData],
+    EpochPublishingGraphInterface
+):
+    '''
+    Class that can intern mementos in front of any database, so that the database only stores integer ids.
+
+    Loads resolve ids back to mementos, and an endpoint-only vertex that loads as `None` stays `None`. Traversals and
+    epoch publishing pass through to the `backend` where it supports them.
+    '''
+
+    __backend: Any
+    __table: MementoInternTable[VertexData]
+
+    '''
+    Property and dunder methods.
+    '''
+
+    def __init__(self, backend: Any, table: Optional[MementoInternTable[VertexData]] = None, *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up interning in front of this `backend`, optionally sharing an existing `table`.
+        '''
+        self.__backend = backend
+
+        self.__table = table if table is not None else MementoInternTable()
+
+        return None
+
+    @property
+    def backend(self) -> Any: return self.__backend
+
+    @property
+    def table(self) -> MementoInternTable[VertexData]: return self.__table
+
+    '''
+    ABC extensions.
+    '''
+
+    def write_stateful_vertex_(self, label: SimpleVertexLabel, data: VertexData, *args: Any, **kwargs: Any) -> None:
+        '''
+        Writes the interned id of this `data` into the backend for the vertex with this `label`.
+        '''
+        self.__backend.write_stateful_vertex_(label = label, data = self.__table.intern_(data = data))
+
+        return None
+
+    def write_stateless_directed_edge_(self, source: SimpleVertexLabel, destination: SimpleVertexLabel, *args: Any, **kwargs: Any) -> None:
+        '''
+        Writes an unlabelled edge from this `source` to this `destination` into the backend.
+        '''
+        self.__backend.write_stateless_directed_edge_(source = source, destination = destination)
+
+        return None
+
+    def load_stateful_vertex(self, label: SimpleVertexLabel, *args: Any, **kwargs: Any) -> VertexData:
+        '''
+        Loads the memento of the vertex with this `label` by resolving its id.
+        '''
+        identifier: Optional[MementoId] = self.__backend.load_stateful_vertex(label = label)
+
+        return None if identifier is None else self.__table.resolve(identifier = identifier)  # type: ignore endpoint-only vertex
+
+    def load_successors(self, label: SimpleVertexLabel, *args: Any, **kwargs: Any) -> Iterable[SimpleVertexLabel]:
+        '''
+        Loads the successors of the vertex with this `label` from the backend.
+        '''
+        return self.__backend.load_successors(label = label)
+
+    def load_successor_range(self, label: SimpleVertexLabel, start: int, stop: Optional[int] = None, *args: Any, **kwargs: Any) -> List[SimpleVertexLabel]:
+        '''
+        Loads a range of the successors of the vertex with this `label` from the backend.
+        '''
+        return self.__backend.load_successor_range(label = label, start = start, stop = stop)
+
+    def load_predecessors(self, label: SimpleVertexLabel, *args: Any, **kwargs: Any) -> Iterable[SimpleVertexLabel]:
+        '''
+        Loads the predecessors of the vertex with this `label` from the backend.
+        '''
+        return self.__backend.load_predecessors(label = label)
+
+    def publish_epoch_(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Publishes an epoch on the backend if it is an `EpochPublishingGraphInterface` type.
+        '''
+        if isinstance(self.__backend, EpochPublishingGraphInterface): self.__backend.publish_epoch_()
+
+        return None
+
+    '''
+    Id logic.
+    '''
+
+    def load_memento_id(self, label: SimpleVertexLabel, *args: Any, **kwargs: Any) -> Optional[MementoId]:
+        '''
+        Loads the interned id of the vertex with this `label` without resolving it, for integer comparisons.
+        '''
+        return self.__backend.load_stateful_vertex(label = label)
+
+    def iterate_labels_with(self, data: VertexData, labels: Iterable[SimpleVertexLabel], *args: Any, **kwargs: Any) -> Iterable[SimpleVertexLabel]:
+        '''
+        Yields each of these `labels` whose memento is this `data`, comparing ids rather than mementos.
+        '''
+        identifier: Optional[MementoId] = self.__table.find(data = data)
+
+        if identifier is None: return
+
+        for label in labels:
+            if self.__backend.load_stateful_vertex(label = label) == identifier: yield label
+
+    def count_by_memento(self, labels: Iterable[SimpleVertexLabel], *args: Any, **kwargs: Any) -> Dict[MementoId, int]:
+        '''
+        Counts these `labels` by the id of their memento, which `.table.resolve(..)` turns back into the memento.
+        '''
+        counts: Dict[MementoId, int] = dict()
+
+        for label in labels:
+            identifier: Optional[MementoId] = self.__backend.load_stateful_vertex(label = label)
+
+            if identifier is not None: counts[identifier] = counts.get(identifier, 0) + 1
+
+        return counts
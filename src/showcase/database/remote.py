@@ -0,0 +1,760 @@
+'''
+Remote* Collection for the database module.
+
+A `GraphServer` owns a graph in one process and serves it over a Unix or TCP socket to `RemoteGraphDB` clients in others.
+
+Frames are length-prefixed pickles, so both ends must trust each other. A server refuses a TCP address that is not a
+loopback address unless it has an `authkey`, and with an `authkey` both ends prove they hold it with an HMAC challenge
+before any frame is unpickled, as `multiprocessing.connection` does.
+'''
+
+# built-in imports
+from contextlib import nullcontext
+from hmac import compare_digest, new as hmac_new
+from ipaddress import ip_address
+from itertools import count, islice
+from multiprocessing import AuthenticationError
+from os import unlink, urandom
+from os.path import exists
+from pickle import dumps, loads, HIGHEST_PROTOCOL
+from queue import LifoQueue, Empty
+from socket import socket, AF_INET, AF_UNIX, SOCK_STREAM, IPPROTO_TCP, TCP_NODELAY
+from socketserver import BaseRequestHandler, ThreadingTCPServer, ThreadingUnixStreamServer
+from struct import Struct
+from threading import Lock, Thread
+from typing import Any, BinaryIO, Callable, ContextManager, Dict, Generic, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from typing_extensions import TypeAlias
+
+# library imports
+from ._interface import EpochPublishingGraphInterface, PartiallyStatefulDirectedGraphInterface, StatefulVertexGraphLoaderInterface, StatefulVertexGraphTraversalInterface
+from ._types import VertexData
+from .simple import SimpleVertexLabel
+
+
+'''
+Types.
+'''
+
+RemoteAddress: TypeAlias = Union[str, Tuple[str, int]]
+
+RemoteRequest: TypeAlias = Tuple[str, Tuple[Any, ...]]
+
+RemoteResponse: TypeAlias = Tuple[bool, Any]
+
+RemoteConnection: TypeAlias = Tuple[socket, BinaryIO]
+
+RemoteCursor: TypeAlias = int
+
+RemoteSession: TypeAlias = Set[RemoteCursor]
+
+
+'''
+Framing.
+'''
+
+_HEADER: Struct = Struct('!I')
+
+_CHALLENGE_SIZE: int = 32
+
+_DIGEST: str = 'sha256'
+
+_WELCOME: bytes = b'#WELCOME#'
+
+_FAILURE: bytes = b'#FAILURE#'
+
+_HANDSHAKE_TIMEOUT: float = 10.0
+
+
+def _encode_frame(message: Any) -> bytes:
+    '''
+    Encodes this `message` as a length-prefixed pickle.
+    '''
+    payload: bytes = dumps(message, protocol = HIGHEST_PROTOCOL)
+
+    return _HEADER.pack(len(payload)) + payload
+
+
+def _read_frame(stream: BinaryIO) -> Any:
+    '''
+    Reads one length-prefixed pickle from this `stream`, raising a `ConnectionError` if the peer hung up.
+    '''
+    header: bytes = stream.read(_HEADER.size)
+
+    if len(header) < _HEADER.size: raise ConnectionError('remote graph connection closed.')
+
+    return loads(stream.read(_HEADER.unpack(header)[0]))
+
+
+def _deliver_challenge(connection: RemoteConnection, authkey: bytes) -> None:
+    '''
+    Sends a random challenge over this `connection` and checks that the peer answers it with this `authkey`, raising an
+    `AuthenticationError` if it does not.
+    '''
+    challenge: bytes = urandom(_CHALLENGE_SIZE)
+
+    connection[0].sendall(challenge)
+
+    expected: bytes = hmac_new(authkey, challenge, _DIGEST).digest()
+
+    if not compare_digest(connection[1].read(len(expected)), expected):
+        connection[0].sendall(_FAILURE)
+
+        raise AuthenticationError('remote graph peer did not answer the challenge.')
+
+    connection[0].sendall(_WELCOME)
+
+    return None
+
+
+def _answer_challenge(connection: RemoteConnection, authkey: bytes) -> None:
+    '''
+    Answers a challenge sent over this `connection` with this `authkey`, raising an `AuthenticationError` if it is refused.
+    '''
+    challenge: bytes = connection[1].read(_CHALLENGE_SIZE)
+
+    if len(challenge) < _CHALLENGE_SIZE: raise AuthenticationError('remote graph peer closed the connection during the challenge.')
+
+    connection[0].sendall(hmac_new(authkey, challenge, _DIGEST).digest())
+
+    if connection[1].read(len(_WELCOME)) != _WELCOME: raise AuthenticationError('remote graph peer refused the answer to its challenge.')
+
+    return None
+
+
+def _is_loopback(host: str) -> bool:
+    '''
+    Checks whether this `host` is `localhost` or a loopback IP address, without resolving any other name.
+    '''
+    if host == 'localhost': return True
+
+    try: return ip_address(host).is_loopback
+
+    except ValueError: return False
+
+
+def _connect(address: RemoteAddress, authkey: Optional[bytes] = None) -> RemoteConnection:
+    '''
+    Opens a connection to a `GraphServer` at this `address`, proving that both ends hold this `authkey` if given.
+    '''
+    if isinstance(address, str):
+        connection: socket = socket(AF_UNIX, SOCK_STREAM)
+
+    else:
+        connection = socket(AF_INET, SOCK_STREAM)
+
+        connection.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+
+    connection.connect(address)
+
+    opened: RemoteConnection = (connection, connection.makefile('rb'))
+
+    if authkey is not None:
+        try:
+            connection.settimeout(_HANDSHAKE_TIMEOUT)
+
+            _answer_challenge(connection = opened, authkey = authkey)
+
+            _deliver_challenge(connection = opened, authkey = authkey)
+
+            connection.settimeout(None)
+
+        except BaseException:
+            opened[1].close(); connection.close()
+
+            raise
+
+    return opened
+
+
+'''
+Concrete classes and ABC extensions.
+'''
+
+class _ThreadingTCPGraphServer(ThreadingTCPServer):
+    '''
+    Class that can accept TCP connections for a `GraphServer` on daemon threads.
+    '''
+
+    daemon_threads = True
+
+    allow_reuse_address = True
+
+    graph_server: 'GraphServer[Any, Any]'
+
+
+class _ThreadingUnixGraphServer(ThreadingUnixStreamServer):
+    '''
+    Class that can accept Unix socket connections for a `GraphServer` on daemon threads.
+    '''
+
+    daemon_threads = True
+
+    graph_server: 'GraphServer[Any, Any]'
+
+
+class _GraphRequestHandler(BaseRequestHandler):
+    '''
+    Class that can answer every request that a `RemoteGraphDB` pipelines over one connection.
+    '''
+
+    server: Union[_ThreadingTCPGraphServer, _ThreadingUnixGraphServer]
+
+    def handle(self) -> None:
+        '''
+        Answers requests in order until the client hangs up, then drops any cursor it opened and left unfinished.
+        '''
+        if self.server.address_family == AF_INET: self.request.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+
+        stream: BinaryIO = self.request.makefile('rb')
+
+        authkey: Optional[bytes] = self.server.graph_server.authkey
+
+        # a peer that fails the challenge is hung up on before anything it sent is unpickled.
+
+        if authkey is not None:
+            try:
+                self.request.settimeout(_HANDSHAKE_TIMEOUT)
+
+                _deliver_challenge(connection = (self.request, stream), authkey = authkey)
+
+                _answer_challenge(connection = (self.request, stream), authkey = authkey)
+
+                self.request.settimeout(None)
+
+            except (AuthenticationError, OSError): return None
+
+        dispatch: Callable[..., RemoteResponse] = self.server.graph_server.dispatch
+
+        session: RemoteSession = set()
+
+        try:
+            while True:
+                try: request: RemoteRequest = _read_frame(stream)
+
+                except ConnectionError: break
+
+                self.request.sendall(_encode_frame(dispatch(request, session = session)))
+
+        finally: self.server.graph_server.close_session_(session = session)
+
+        return None
+
+
+class GraphServer\
+(
+    Generic[SimpleVertexLabel, VertexData]
+):
+    '''
+    Class that can serve the writer and loader interfaces of a graph over a Unix or TCP socket.
+
+    A string `address` is a Unix socket path and a `(host, port)` pair is a TCP address. Traversals of a
+    `StatefulVertexGraphTraversalInterface` graph run on the server behind cursors that clients page through. A cursor
+    can be paged over any connection, but is dropped when the connection that opened it hangs up.
+
+    Writes hold a lock, and so do reads unless `lock_reads` is false. That is only safe for graphs whose readers never
+    race a writer, such as a `SnapshotGraphDB` read through pinned snapshots.
+
+    A TCP `address` that is not a loopback address raises a `ValueError` unless an `authkey` is given. With an `authkey`,
+    every connection must answer an HMAC challenge before its requests are read.
+    '''
+
+    __graph: Any
+    __authkey: Optional[bytes]
+    __handlers: Dict[str, Callable[..., Any]]
+    __cursors: Dict[RemoteCursor, Tuple[Iterator[Any], Optional[RemoteSession]]]
+    __cursor_ids: Iterator[RemoteCursor]
+    __cursor_lock: Lock
+    __lock: Lock
+    __read_lock: ContextManager[Any]
+    __server: Union[_ThreadingTCPGraphServer, _ThreadingUnixGraphServer]
+    __thread: Optional[Thread]
+
+    '''
+    Property and dunder methods.
+    '''
+
+    def __init__(self, graph: PartiallyStatefulDirectedGraphInterface[SimpleVertexLabel, VertexData], address: RemoteAddress, lock_reads: bool = True, authkey: Optional[bytes] = None, *args: Any, **kwargs: Any) -> None:
+        '''
+        Binds a socket at this `address` for serving this `graph`, which must also be a `StatefulVertexGraphLoaderInterface` type.
+        '''
+        if not isinstance(address, str) and authkey is None and not _is_loopback(host = address[0]):
+            raise ValueError('%s will not serve pickles on %r without an authkey.' % (GraphServer.__name__, address[0]))
+
+        self.__graph = graph
+
+        self.__authkey = authkey
+
+        self.__lock = Lock()
+
+        self.__read_lock = self.__lock if lock_reads else nullcontext()
+
+        self.__cursors = dict()
+
+        self.__cursor_ids = count()
+
+        self.__cursor_lock = Lock()
+
+        # handlers are resolved once so that dispatching a request is a single dictionary lookup.
+
+        self.__handlers = \
+        {
+            'write_vertex': self.__write_vertex,
+            'write_edge': self.__write_edge,
+            'publish': self.__publish,
+            'load': self.__load,
+            'load_many': self.__load_many,
+            'successors': self.__load_successors,
+            'successor_range': self.__load_successor_range,
+            'predecessors': self.__load_predecessors,
+            'next_chunk': self.__next_chunk,
+            'close_cursor': self.__close_cursor,
+        }
+
+        if isinstance(address, str): self.__server = _ThreadingUnixGraphServer(address, _GraphRequestHandler)
+
+        else: self.__server = _ThreadingTCPGraphServer(address, _GraphRequestHandler)
+
+        self.__server.graph_server = self
+
+        self.__thread = None
+
+        return None
+
+    def __enter__(self) -> 'GraphServer[SimpleVertexLabel, VertexData]': return self.start_()
+
+    def __exit__(self, *args: Any) -> None: self.shutdown_()
+
+    @property
+    def address(self) -> RemoteAddress: return self.__server.server_address
+
+    @property
+    def graph(self) -> Any: return self.__graph
+
+    @property
+    def authkey(self) -> Optional[bytes]: return self.__authkey
+
+    '''
+    Server logic.
+    '''
+
+    def start_(self, *args: Any, **kwargs: Any) -> 'GraphServer[SimpleVertexLabel, VertexData]':
+        '''
+        Starts serving requests on a background thread.
+        '''
+        self.__thread = Thread(target = self.__server.serve_forever, daemon = True)
+
+        self.__thread.start()
+
+        return self
+
+    def shutdown_(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Stops serving requests and closes the listening socket.
+        '''
+        if self.__thread is not None:
+            self.__server.shutdown()
+
+            self.__thread.join()
+
+            self.__thread = None
+
+        self.__server.server_close()
+
+        if isinstance(self.__server, _ThreadingUnixGraphServer) and exists(self.__server.server_address): unlink(self.__server.server_address)
+
+        return None
+
+    @property
+    def _cursors(self) -> Dict[RemoteCursor, Tuple[Iterator[Any], Optional[RemoteSession]]]: return self.__cursors
+
+    def dispatch(self, request: RemoteRequest, session: Optional[RemoteSession] = None, *args: Any, **kwargs: Any) -> RemoteResponse:
+        '''
+        Runs this `request` against the graph and returns `(True, result)` or `(False, error)`.
+
+        Cursors opened by the request are tracked in this `session`, if given, so that `.close_session_(..)` can drop them.
+        '''
+        operation, arguments = request
+
+        try:
+            if operation == 'open_cursor': return True, self.__open_cursor(*arguments, session = session)
+
+            return True, self.__handlers[operation](*arguments)
+
+        except Exception as error: return False, error
+
+    def close_session_(self, session: RemoteSession, *args: Any, **kwargs: Any) -> None:
+        '''
+        Drops every cursor still open in this `session`, such as when its connection hangs up.
+        '''
+        with self.__cursor_lock:
+            for cursor in list(session): self.__cursors.pop(cursor, None)
+
+            session.clear()
+
+        return None
+
+    def __write_vertex(self, label: SimpleVertexLabel, data: VertexData) -> None:
+        '''
+        Writes a vertex while holding the write lock.
+        '''
+        with self.__lock: self.__graph.write_stateful_vertex_(label = label, data = data)
+
+    def __write_edge(self, source: SimpleVertexLabel, destination: SimpleVertexLabel) -> None:
+        '''
+        Writes an edge while holding the write lock.
+        '''
+        with self.__lock: self.__graph.write_stateless_directed_edge_(source = source, destination = destination)
+
+    def __publish(self) -> None:
+        '''
+        Publishes an epoch if the graph is an `EpochPublishingGraphInterface` type.
+        '''
+        if isinstance(self.__graph, EpochPublishingGraphInterface):
+            with self.__lock: self.__graph.publish_epoch_()
+
+    def __load(self, label: SimpleVertexLabel) -> VertexData:
+        '''
+        Loads the data for this `label` while holding the read lock.
+        '''
+        with self.__read_lock: return self.__graph.load_stateful_vertex(label = label)
+
+    def __load_many(self, labels: List[SimpleVertexLabel]) -> List[VertexData]:
+        '''
+        Loads the data for each of these `labels` while holding the read lock.
+        '''
+        load: Callable[..., VertexData] = self.__graph.load_stateful_vertex
+
+        with self.__read_lock: return [ load(label) for label in labels ]
+
+    def __load_successors(self, label: SimpleVertexLabel) -> List[SimpleVertexLabel]:
+        '''
+        Loads the successors of this `label` as a list while holding the read lock.
+        '''
+        with self.__read_lock: return list(self.__graph.load_successors(label = label))
+
+    def __load_successor_range(self, label: SimpleVertexLabel, start: int, stop: Optional[int]) -> List[SimpleVertexLabel]:
+        '''
+        Loads a range of the successors of this `label` while holding the read lock.
+        '''
+        with self.__read_lock: return list(self.__graph.load_successor_range(label = label, start = start, stop = stop))
+
+    def __load_predecessors(self, label: SimpleVertexLabel) -> List[SimpleVertexLabel]:
+        '''
+        Loads the predecessors of this `label` as a list while holding the read lock.
+        '''
+        with self.__read_lock: return list(self.__graph.load_predecessors(label = label))
+
+    def __open_cursor(self, walk: str, label: SimpleVertexLabel, depth: Optional[int], session: Optional[RemoteSession] = None) -> RemoteCursor:
+        '''
+        Starts this `walk` of the graph from this `label` and returns a cursor for paging through it.
+        '''
+        if walk == 'children': iterator: Iterator[Any] = self.__graph.iterate_children(label = label)
+
+        elif walk == 'ancestors': iterator = self.__graph.iterate_ancestors(label = label)
+
+        elif walk == 'depth_first': iterator = self.__graph.iterate_depth_first(label = label, depth = depth)
+
+        elif walk == 'breadth_first': iterator = self.__graph.iterate_breadth_first(label = label, depth = depth)
+
+        else: raise ValueError('unknown walk %s.' % walk)
+
+        with self.__cursor_lock:
+            cursor: RemoteCursor = next(self.__cursor_ids)
+
+            self.__cursors[cursor] = (iterator, session)
+
+            if session is not None: session.add(cursor)
+
+        return cursor
+
+    def __next_chunk(self, cursor: RemoteCursor, chunk_size: int) -> List[Any]:
+        '''
+        Loads at most `chunk_size` items from this `cursor` while holding the read lock, dropping the cursor once it is exhausted.
+        '''
+        with self.__read_lock: chunk: List[Any] = list(islice(self.__cursors[cursor][0], chunk_size))
+
+        if len(chunk) < chunk_size: self.__close_cursor(cursor = cursor)
+
+        return chunk
+
+    def __close_cursor(self, cursor: RemoteCursor) -> None:
+        '''
+        Drops this `cursor` before it is exhausted.
+        '''
+        with self.__cursor_lock:
+            _, session = self.__cursors.pop(cursor, (None, None))
+
+            if session is not None: session.discard(cursor)
+
+
+class RemoteGraphDB\
+(
+    Generic[SimpleVertexLabel, VertexData],
+    PartiallyStatefulDirectedGraphInterface[SimpleVertexLabel, VertexData],
+    StatefulVertexGraphLoaderInterface[SimpleVertexLabel, VertexData],
+    StatefulVertexGraphTraversalInterface[SimpleVertexLabel, VertexData],
+    EpochPublishingGraphInterface
+):
+    '''
+    Class that can write to and load from a graph served by a `GraphServer`.
+
+    Writes are buffered and pipelined over one pooled connection in batches of `batch_size`, and are flushed before
+    every load so that a client always reads its own writes. Traversals page through server-side cursors in chunks
+    of `chunk_size`. A server started with an `authkey` must be given the same `authkey`.
+    '''
+
+    __address: RemoteAddress
+    __authkey: Optional[bytes]
+    __pool: 'LifoQueue[RemoteConnection]'
+    __connections: List[RemoteConnection]
+    __batch: List[RemoteRequest]
+    __batch_size: int
+    __chunk_size: int
+    __batch_lock: Lock
+    __pool_lock: Lock
+
+    '''
+    Property and dunder methods.
+    '''
+
+    def __init__(self, address: RemoteAddress, pool_size: int = 4, batch_size: int = 256, chunk_size: int = 256, authkey: Optional[bytes] = None, *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up a pool of at most `pool_size` lazily-opened connections to the `GraphServer` at this `address`.
+        '''
+        self.__address = address
+
+        self.__authkey = authkey
+
+        self.__pool = LifoQueue(maxsize = pool_size)
+
+        self.__connections = list()
+
+        self.__batch = list()
+
+        self.__batch_size = batch_size
+
+        self.__chunk_size = chunk_size
+
+        self.__batch_lock = Lock()
+
+        self.__pool_lock = Lock()
+
+        return None
+
+    def __enter__(self) -> 'RemoteGraphDB[SimpleVertexLabel, VertexData]': return self
+
+    def __exit__(self, *args: Any) -> None: self.close_()
+
+    @property
+    def address(self) -> RemoteAddress: return self.__address
+
+    '''
+    ABC extensions.
+    '''
+
+    def write_stateful_vertex_(self, label: SimpleVertexLabel, data: VertexData, *args: Any, **kwargs: Any) -> None:
+        '''
+        Buffers a write of a vertex with this `label` associated with this `data`.
+        '''
+        self.__buffer_(request = ('write_vertex', (label, data)))
+
+        return None
+
+    def write_stateless_directed_edge_(self, source: SimpleVertexLabel, destination: SimpleVertexLabel, *args: Any, **kwargs: Any) -> None:
+        '''
+        Buffers a write of an unlabelled edge from this `source` to this `destination`.
+        '''
+        self.__buffer_(request = ('write_edge', (source, destination)))
+
+        return None
+
+    def publish_epoch_(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Buffers a request to publish an epoch, which the server ignores if its graph does not publish epochs.
+        '''
+        self.__buffer_(request = ('publish', ()))
+
+        return None
+
+    def load_stateful_vertex(self, label: SimpleVertexLabel, *args: Any, **kwargs: Any) -> VertexData:
+        '''
+        Loads the `VertexData` associated with this `label` from the remote graph.
+        '''
+        self.flush_()
+
+        return self.pipeline([('load', (label,))])[0]
+
+    def load_successors(self, label: SimpleVertexLabel, *args: Any, **kwargs: Any) -> List[SimpleVertexLabel]:
+        '''
+        Loads the labels of successors of this `label` from the remote graph.
+        '''
+        self.flush_()
+
+        return self.pipeline([('successors', (label,))])[0]
+
+    def load_successor_range(self, label: SimpleVertexLabel, start: int, stop: Optional[int] = None, *args: Any, **kwargs: Any) -> List[SimpleVertexLabel]:
+        '''
+        Loads a range of the successors of this `label` from the remote graph, so only that range is sent.
+        '''
+        self.flush_()
+
+        return self.pipeline([('successor_range', (label, start, stop))])[0]
+
+    def load_predecessors(self, label: SimpleVertexLabel, *args: Any, **kwargs: Any) -> List[SimpleVertexLabel]:
+        '''
+        Loads the labels of predecessors of this `label` from the remote graph.
+        '''
+        self.flush_()
+
+        return self.pipeline([('predecessors', (label,))])[0]
+
+    def iterate_children(self, label: SimpleVertexLabel, *args: Any, **kwargs: Any) -> Iterator[Tuple[SimpleVertexLabel, VertexData]]:
+        '''
+        Yields a `(label, data)` pair for each successor of this `label`, paged from the server.
+        '''
+        return self.__stream(walk = 'children', label = label, depth = None)
+
+    def iterate_ancestors(self, label: SimpleVertexLabel, *args: Any, **kwargs: Any) -> Iterator[Tuple[SimpleVertexLabel, VertexData]]:
+        '''
+        Yields a `(label, data)` pair for each ancestor of this `label`, paged from the server.
+        '''
+        return self.__stream(walk = 'ancestors', label = label, depth = None)
+
+    def iterate_depth_first(self, label: SimpleVertexLabel, depth: Optional[int] = None, *args: Any, **kwargs: Any) -> Iterator[Tuple[SimpleVertexLabel, VertexData]]:
+        '''
+        Yields a `(label, data)` pair for each descendant of this `label` in depth-first pre-order, paged from the server.
+        '''
+        return self.__stream(walk = 'depth_first', label = label, depth = depth)
+
+    def iterate_breadth_first(self, label: SimpleVertexLabel, depth: Optional[int] = None, *args: Any, **kwargs: Any) -> Iterator[Tuple[SimpleVertexLabel, VertexData]]:
+        '''
+        Yields a `(label, data)` pair for each descendant of this `label` in breadth-first order, paged from the server.
+        '''
+        return self.__stream(walk = 'breadth_first', label = label, depth = depth)
+
+    '''
+    Client logic.
+    '''
+
+    def load_stateful_vertices(self, labels: Iterable[SimpleVertexLabel], *args: Any, **kwargs: Any) -> List[VertexData]:
+        '''
+        Loads the `VertexData` associated with each of these `labels` in one round trip.
+        '''
+        self.flush_()
+
+        return self.pipeline([('load_many', (list(labels),))])[0]
+
+    def pipeline(self, requests: List[RemoteRequest], *args: Any, **kwargs: Any) -> List[Any]:
+        '''
+        Sends all of these `requests` before reading any response and returns the results in order.
+
+        Raises the first error that the server reported, after every response has been read.
+        '''
+        connection: RemoteConnection = self.__acquire()
+
+        try:
+            connection[0].sendall(b''.join([ _encode_frame(request) for request in requests ]))
+
+            responses: List[RemoteResponse] = [ _read_frame(connection[1]) for _ in requests ]
+
+        except BaseException:
+            self.__discard(connection = connection)
+
+            raise
+
+        self.__pool.put(connection)
+
+        for success, result in responses:
+            if not success: raise result
+
+        return [ result for _, result in responses ]
+
+    def flush_(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Pipelines every buffered write to the server and waits for them to be acknowledged.
+        '''
+        with self.__batch_lock: self.__flush_locked()
+
+        return None
+
+    def close_(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Flushes buffered writes and closes every pooled connection.
+        '''
+        self.flush_()
+
+        while True:
+            try: self.__discard(connection = self.__pool.get_nowait())
+
+            except Empty: break
+
+        return None
+
+    def __stream(self, walk: str, label: SimpleVertexLabel, depth: Optional[int]) -> Iterator[Any]:
+        '''
+        Pages through a server-side cursor for this `walk`, closing the cursor if the caller stops early.
+        '''
+        self.flush_()
+
+        cursor: Optional[RemoteCursor] = self.pipeline([('open_cursor', (walk, label, depth))])[0]
+
+        try:
+            while cursor is not None:
+                chunk: List[Any] = self.pipeline([('next_chunk', (cursor, self.__chunk_size))])[0]
+
+                if len(chunk) < self.__chunk_size: cursor = None
+
+                yield from chunk
+
+        finally:
+            if cursor is not None: self.pipeline([('close_cursor', (cursor,))])
+
+    def __buffer_(self, request: RemoteRequest) -> None:
+        '''
+        Appends this `request` to the write buffer and flushes a full buffer.
+        '''
+        with self.__batch_lock:
+            self.__batch.append(request)
+
+            if len(self.__batch) >= self.__batch_size: self.__flush_locked()
+
+    def __flush_locked(self) -> None:
+        '''
+        Pipelines the write buffer, which the caller must have locked so that batches reach the server in order.
+        '''
+        if not self.__batch: return None
+
+        batch: List[RemoteRequest] = self.__batch
+
+        self.__batch = list()
+
+        self.pipeline(batch)
+
+    def __acquire(self) -> RemoteConnection:
+        '''
+        Takes an idle connection from the pool, opening a new one while the pool is below its size.
+        '''
+        try: return self.__pool.get_nowait()
+
+        except Empty: pass
+
+        with self.__pool_lock:
+            if len(self.__connections) < self.__pool.maxsize:
+                connection: RemoteConnection = _connect(address = self.__address, authkey = self.__authkey)
+
+                self.__connections.append(connection)
+
+                return connection
+
+        return self.__pool.get()
+
+    def __discard(self, connection: RemoteConnection) -> None:
+        '''
+        Closes this `connection` and frees its slot in the pool.
+        '''
+        connection[1].close()
+
+        connection[0].close()
+
+        with self.__pool_lock:
+            if connection in self.__connections: self.__connections.remove(connection)
@@ -3,11 +3,12 @@ Simple* Collection for the database module.
 '''
 
 # built-in imports
-from typing import Any, Generic, Hashable, TypeVar
+from typing import Any, Dict, Generic, Hashable, Iterable, List, Optional, TypeVar
 
 # library imports
 from ._interface import PartiallyStatefulDirectedGraphInterface, StatefulVertexGraphLoaderInterface
 from ._types import VertexData
+from .traversal import SimpleGraphTraversal
 
 # external imports
 from networkx.classes.digraph import DiGraph
@@ -27,13 +28,18 @@ class SimpleGraphDB\
 (
     Generic[SimpleVertexLabel, VertexData], 
     PartiallyStatefulDirectedGraphInterface[SimpleVertexLabel, VertexData],
+    SimpleGraphTraversal[SimpleVertexLabel, VertexData],
     StatefulVertexGraphLoaderInterface[SimpleVertexLabel, VertexData]
 ):
     '''
     Class that can write stateful vertices and stateless directed edges into a graph-like structure.
+
+    Successors are also kept in a list a vertex, in the order their edges were written, so that a range of them can be
+    loaded without walking the ones before it.
     '''
 
     __graph: DiGraph
+    __successors: Dict[SimpleVertexLabel, List[SimpleVertexLabel]]
 
     '''
     Property and dunder methods
@@ -45,6 +51,8 @@ class SimpleGraphDB\
         '''
         self.__graph = DiGraph()
 
+        self.__successors = dict()
+
         return None
 
     @property
@@ -66,8 +74,12 @@ class SimpleGraphDB\
         '''
         Writes an unlabelled edge between a vertex with this `source` label and one with this `destination` label into a `networkx.DiGraph` object.
         '''
+        if self.__graph.has_edge(source, destination): return None
+
         self.__graph.add_edge(u_of_edge = source, v_of_edge = destination)
 
+        self.__successors.setdefault(source, list()).append(destination)
+
         return None
 
     def load_stateful_vertex(self, label: SimpleVertexLabel, *args: Any, **kwargs: Any) -> VertexData:
@@ -75,3 +87,27 @@ class SimpleGraphDB\
         Loads the `VertexData` associated with this `label` from a `networkx.DiGraph` object.
         '''
         return self.__graph.nodes[label].get('data')
+
+    def load_successors(self, label: SimpleVertexLabel, *args: Any, **kwargs: Any) -> Iterable[SimpleVertexLabel]:
+        '''
+        Loads the labels of successors of this `label` from the adjacency of a `networkx.DiGraph` object.
+
+        The labels are copied, so a walk that holds them across yields is not broken by later writes to this vertex.
+        '''
+        return tuple(self.__graph.succ[label])
+
+    def load_successor_range(self, label: SimpleVertexLabel, start: int, stop: Optional[int] = None, *args: Any, **kwargs: Any) -> List[SimpleVertexLabel]:
+        '''
+        Loads the successors of this `label` from position `start` up to position `stop` by slicing its successor list.
+        '''
+        if label not in self.__graph: raise KeyError(label)
+
+        return self.__successors.get(label, list())[start:stop]
+
+    def load_predecessors(self, label: SimpleVertexLabel, *args: Any, **kwargs: Any) -> Iterable[SimpleVertexLabel]:
+        '''
+        Loads the labels of predecessors of this `label` from the adjacency of a `networkx.DiGraph` object.
+
+        The labels are copied, so a walk that holds them across yields is not broken by later writes to this vertex.
+        '''
+        return tuple(self.__graph.pred[label])
@@ -0,0 +1,321 @@
+'''
+Snapshot* Collection for the database module.
+
+A writer publishes epochs at consistent boundaries and readers pin an epoch to get an immutable view of the graph.
+'''
+
+# built-in imports
+from bisect import bisect_right
+from threading import Lock
+from typing import Any, Dict, Generic, List, Optional, Set, Tuple
+from typing_extensions import TypeAlias
+
+# library imports
+from ._interface import EpochPublishingGraphInterface, PartiallyStatefulDirectedGraphInterface, StatefulVertexGraphLoaderInterface
+from ._types import VertexData
+from .simple import SimpleVertexLabel
+from .traversal import SimpleGraphTraversal
+
+
+'''
+Types.
+'''
+
+SnapshotEpoch: TypeAlias = int
+
+
+'''
+Concrete classes and ABC extensions.
+'''
+
+class SnapshotGraphDB\
+(
+    Generic[SimpleVertexLabel, VertexData],
+    PartiallyStatefulDirectedGraphInterface[SimpleVertexLabel, VertexData],
+    SimpleGraphTraversal[SimpleVertexLabel, VertexData],
+    StatefulVertexGraphLoaderInterface[SimpleVertexLabel, VertexData],
+    EpochPublishingGraphInterface
+):
+    '''
+    Class that can write stateful vertices and stateless directed edges with epoch-based snapshot isolation.
+
+    Writes are tagged with the pending epoch and stay invisible until `.publish_epoch_(..)` is called. Readers pin the
+    latest published epoch with `.pin_snapshot_(..)` and never block the writer. A single writer is assumed.
+    '''
+
+    __epoch: SnapshotEpoch
+    __versions: Dict[SimpleVertexLabel, List[Tuple[SnapshotEpoch, VertexData]]]
+    __successors: Dict[SimpleVertexLabel, List[SimpleVertexLabel]]
+    __successor_epochs: Dict[SimpleVertexLabel, List[SnapshotEpoch]]
+    __predecessors: Dict[SimpleVertexLabel, List[SimpleVertexLabel]]
+    __predecessor_epochs: Dict[SimpleVertexLabel, List[SnapshotEpoch]]
+    __superseded: Set[SimpleVertexLabel]
+    __pins: Dict[SnapshotEpoch, int]
+    __lock: Lock
+
+    '''
+    Property and dunder methods.
+    '''
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up an empty version store at epoch zero.
+        '''
+        self.__epoch = 0
+
+        self.__versions = dict()
+
+        self.__successors = dict()
+
+        self.__successor_epochs = dict()
+
+        self.__predecessors = dict()
+
+        self.__predecessor_epochs = dict()
+
+        self.__superseded = set()
+
+        self.__pins = dict()
+
+        self.__lock = Lock()
+
+        return None
+
+    @property
+    def epoch(self) -> SnapshotEpoch: return self.__epoch
+
+    @property
+    def _versions(self) -> Dict[SimpleVertexLabel, List[Tuple[SnapshotEpoch, VertexData]]]: return self.__versions
+
+    @property
+    def _pins(self) -> Dict[SnapshotEpoch, int]: return self.__pins
+
+    '''
+    ABC extensions.
+    '''
+
+    def write_stateful_vertex_(self, label: SimpleVertexLabel, data: VertexData, *args: Any, **kwargs: Any) -> None:
+        '''
+        Writes a new version of the vertex with this `label` and `data` into the pending epoch.
+        '''
+        pending: SnapshotEpoch = self.__epoch + 1
+
+        versions: Optional[List[Tuple[SnapshotEpoch, VertexData]]] = self.__versions.get(label)
+
+        if versions is None: self.__versions[label] = [(pending, data)]
+
+        elif versions[-1][0] == pending: versions[-1] = (pending, data)
+
+        else:
+            versions.append((pending, data))
+
+            self.__superseded.add(label)
+
+        return None
+
+    def write_stateless_directed_edge_(self, source: SimpleVertexLabel, destination: SimpleVertexLabel, *args: Any, **kwargs: Any) -> None:
+        '''
+        Writes an unlabelled edge from this `source` to this `destination` into the pending epoch.
+        '''
+        # labels go in before their epochs so a concurrent reader never slices past the end of a list.
+
+        pending: SnapshotEpoch = self.__epoch + 1
+
+        self.__successors.setdefault(source, list()).append(destination)
+
+        self.__successor_epochs.setdefault(source, list()).append(pending)
+
+        self.__predecessors.setdefault(destination, list()).append(source)
+
+        self.__predecessor_epochs.setdefault(destination, list()).append(pending)
+
+        return None
+
+    def load_stateful_vertex(self, label: SimpleVertexLabel, *args: Any, **kwargs: Any) -> VertexData:
+        '''
+        Loads the `VertexData` associated with this `label` as of the latest published epoch.
+        '''
+        return self.load_stateful_vertex_at(label = label, epoch = self.__epoch)
+
+    def load_successors(self, label: SimpleVertexLabel, *args: Any, **kwargs: Any) -> List[SimpleVertexLabel]:
+        '''
+        Loads the destinations of edges from the vertex with this `label` as of the latest published epoch.
+        '''
+        return self.load_successors_at(label = label, epoch = self.__epoch)
+
+    def load_predecessors(self, label: SimpleVertexLabel, *args: Any, **kwargs: Any) -> List[SimpleVertexLabel]:
+        '''
+        Loads the sources of edges to the vertex with this `label` as of the latest published epoch.
+        '''
+        return self.load_predecessors_at(label = label, epoch = self.__epoch)
+
+    def publish_epoch_(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Publishes the pending epoch and reclaims versions that no pinned epoch can see.
+        '''
+        self.__epoch += 1
+
+        self.reclaim_()
+
+        return None
+
+    '''
+    Snapshot logic.
+    '''
+
+    def load_stateful_vertex_at(self, label: SimpleVertexLabel, epoch: SnapshotEpoch, *args: Any, **kwargs: Any) -> VertexData:
+        '''
+        Loads the `VertexData` associated with this `label` as it was at this `epoch`.
+
+        Like a `SimpleGraphDB`, a vertex that only exists as the end of an edge has `None` data. Raises a `KeyError` if
+        the vertex did not exist at this `epoch`.
+        '''
+        for version, data in reversed(self.__versions.get(label, ())):
+            if version <= epoch: return data
+
+        if self.load_successors_at(label = label, epoch = epoch) or self.load_predecessors_at(label = label, epoch = epoch): return None  # type: ignore endpoint-only vertex
+
+        raise KeyError(label)
+
+    def load_successors_at(self, label: SimpleVertexLabel, epoch: SnapshotEpoch, *args: Any, **kwargs: Any) -> List[SimpleVertexLabel]:
+        '''
+        Loads the destinations of edges from the vertex with this `label` as they were at this `epoch`.
+        '''
+        epochs: Optional[List[SnapshotEpoch]] = self.__successor_epochs.get(label)
+
+        if epochs is None: return list()
+
+        return self.__successors[label][:bisect_right(epochs, epoch)]
+
+    def load_predecessors_at(self, label: SimpleVertexLabel, epoch: SnapshotEpoch, *args: Any, **kwargs: Any) -> List[SimpleVertexLabel]:
+        '''
+        Loads the sources of edges to the vertex with this `label` as they were at this `epoch`.
+        '''
+        epochs: Optional[List[SnapshotEpoch]] = self.__predecessor_epochs.get(label)
+
+        if epochs is None: return list()
+
+        return self.__predecessors[label][:bisect_right(epochs, epoch)]
+
+    def pin_snapshot_(self, *args: Any, **kwargs: Any) -> 'GraphSnapshot[SimpleVertexLabel, VertexData]':
+        '''
+        Pins the latest published epoch and returns an immutable view of the graph at that epoch.
+        '''
+        with self.__lock:
+            epoch: SnapshotEpoch = self.__epoch
+
+            self.__pins[epoch] = self.__pins.get(epoch, 0) + 1
+
+        return GraphSnapshot(database = self, epoch = epoch)
+
+    def release_snapshot_(self, epoch: SnapshotEpoch, *args: Any, **kwargs: Any) -> None:
+        '''
+        Releases one pin on this `epoch`, leaving its versions to be reclaimed when the writer next publishes.
+        '''
+        with self.__lock:
+            count: int = self.__pins[epoch] - 1
+
+            if count: self.__pins[epoch] = count
+
+            else: del self.__pins[epoch]
+
+        return None
+
+    def reclaim_(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Drops vertex versions that are superseded at or before the oldest pinned epoch.
+
+        Only the writer may call this, since it swaps out version lists that the writer appends to.
+        '''
+        with self.__lock:
+            horizon: SnapshotEpoch = min(self.__pins) if self.__pins else self.__epoch
+
+            for label in list(self.__superseded):
+                versions: List[Tuple[SnapshotEpoch, VertexData]] = self.__versions[label]
+
+                oldest: int = len(versions) - 1
+
+                while oldest > 0 and versions[oldest][0] > horizon: oldest -= 1
+
+                # readers may be iterating the old list, so it is swapped rather than mutated.
+
+                if oldest > 0: self.__versions[label] = versions[oldest:]
+
+                if len(versions) - oldest == 1: self.__superseded.discard(label)
+
+        return None
+
+
+class GraphSnapshot\
+(
+    Generic[SimpleVertexLabel, VertexData],
+    SimpleGraphTraversal[SimpleVertexLabel, VertexData],
+    StatefulVertexGraphLoaderInterface[SimpleVertexLabel, VertexData]
+):
+    '''
+    Class that can load an immutable view of a `SnapshotGraphDB` at a pinned epoch.
+    '''
+
+    __database: SnapshotGraphDB[SimpleVertexLabel, VertexData]
+    __epoch: SnapshotEpoch
+    __released: bool
+
+    '''
+    Property and dunder methods.
+    '''
+
+    def __init__(self, database: SnapshotGraphDB[SimpleVertexLabel, VertexData], epoch: SnapshotEpoch, *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up a view of this `database` at this pinned `epoch`.
+        '''
+        self.__database = database
+
+        self.__epoch = epoch
+
+        self.__released = False
+
+        return None
+
+    def __enter__(self) -> 'GraphSnapshot[SimpleVertexLabel, VertexData]': return self
+
+    def __exit__(self, *args: Any) -> None: self.release_()
+
+    @property
+    def epoch(self) -> SnapshotEpoch: return self.__epoch
+
+    '''
+    ABC extensions.
+    '''
+
+    def load_stateful_vertex(self, label: SimpleVertexLabel, *args: Any, **kwargs: Any) -> VertexData:
+        '''
+        Loads the `VertexData` associated with this `label` at the pinned epoch.
+        '''
+        return self.__database.load_stateful_vertex_at(label = label, epoch = self.__epoch)
+
+    def load_successors(self, label: SimpleVertexLabel, *args: Any, **kwargs: Any) -> List[SimpleVertexLabel]:
+        '''
+        Loads the destinations of edges from the vertex with this `label` at the pinned epoch.
+        '''
+        return self.__database.load_successors_at(label = label, epoch = self.__epoch)
+
+    def load_predecessors(self, label: SimpleVertexLabel, *args: Any, **kwargs: Any) -> List[SimpleVertexLabel]:
+        '''
+        Loads the sources of edges to the vertex with this `label` at the pinned epoch.
+        '''
+        return self.__database.load_predecessors_at(label = label, epoch = self.__epoch)
+
+    '''
+    Snapshot logic.
+    '''
+
+    def release_(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Releases the pinned epoch so that the database can reclaim it, at most once.
+        '''
+        if not self.__released:
+            self.__released = True
+
+            self.__database.release_snapshot_(epoch = self.__epoch)
+
+        return None
@@ -0,0 +1,89 @@
+'''
+Tests for the Columnar* Collection in the database module.
+'''
+
+# library imports
+from ..columnar import ColumnarGraphDB, ColumnarQuery
+
+# external imports
+import numpy as np
+
+
+'''
+Mock-ups for testing.
+'''
+
+class MockConvolution:
+    '''
+    Memento with a numeric `activation_norm` field.
+    '''
+
+    def __init__(self, activation_norm: float) -> None: self.activation_norm = activation_norm
+
+
+class MockActivation:
+    '''
+    Memento with a numeric `activation_norm` field.
+    '''
+
+    def __init__(self, activation_norm: float) -> None: self.activation_norm = activation_norm
+
+
+def mock_graph() -> ColumnarGraphDB[int, object]:
+    '''
+    Makes a graph with three convolutions, two activations and one memento without the declared field.
+    '''
+    graph_db: ColumnarGraphDB[int, object] = ColumnarGraphDB(fields = { 'norm': 'activation_norm', 'double': lambda memento: 2 * getattr(memento, 'activation_norm', 0.0) })
+
+    for label, memento in enumerate([MockConvolution(1.0), MockActivation(4.0), MockConvolution(2.0), MockActivation(6.0), MockConvolution(6.0), None]):
+        graph_db.write_stateful_vertex_(label = label, data = memento)
+
+    return graph_db
+
+
+'''
+Unit tests for columnar queries.
+'''
+
+def test_columns_for_columnar_graph_database() -> None:
+    '''
+    Tests that a `ColumnarGraphDB` extracts declared fields into columns aligned with labels.
+    '''
+    graph_db: ColumnarGraphDB[int, object] = mock_graph()
+
+    assert graph_db.store.labels.tolist() == [0, 1, 2, 3, 4, 5], 'expected <%s> to align a row with each label.' % ColumnarGraphDB.__name__
+
+    assert np.isnan(graph_db.store.column(name = 'norm')[-1]), 'expected <%s> to store a missing field as nan.' % ColumnarGraphDB.__name__
+
+    assert graph_db.store.column(name = 'double')[:2].tolist() == [2.0, 8.0], 'expected <%s> to extract a callable field.' % ColumnarGraphDB.__name__
+
+    assert graph_db.load_stateful_vertex(label = 5) is None, 'expected <%s> to keep writing into the graph.' % ColumnarGraphDB.__name__
+
+    # all tests passed
+
+    return None
+
+
+def test_queries_for_columnar_graph_database() -> None:
+    '''
+    Tests that a `ColumnarQuery` can filter, group and reduce columns.
+    '''
+    graph_db: ColumnarGraphDB[int, object] = mock_graph()
+
+    # test reductions and filters
+
+    assert graph_db.query().reduce(field = 'norm', reduction = 'sum') == 19.0, 'expected <%s>.reduce(..) to ignore nan values.' % ColumnarQuery.__name__
+
+    assert graph_db.query().where(field = 'norm', predicate = lambda norm: norm > 3.0).labels().tolist() == [1, 3, 4], 'expected <%s>.where(..) to filter rows.' % ColumnarQuery.__name__
+
+    # test group-bys by memento type
+
+    assert graph_db.query().group_by_type(field = 'norm', reduction = 'mean') == { MockConvolution: 3.0, MockActivation: 5.0 }, 'expected <%s>.group_by_type(..) to reduce each memento type and skip nan-only groups.' % ColumnarQuery.__name__
+
+    assert graph_db.query().where_type(group = MockActivation).reduce(field = 'norm', reduction = 'max') == 6.0, 'expected <%s>.where_type(..) to filter by memento type.' % ColumnarQuery.__name__
+
+    assert graph_db.query().where(field = 'norm', predicate = lambda norm: norm < 5.0).group_by_type(field = 'norm', reduction = 'count') == { MockConvolution: 2.0, MockActivation: 1.0 }, 'expected <%s>.group_by_type(..) to respect filters.' % ColumnarQuery.__name__
+
+    # all tests passed
+
+    return None
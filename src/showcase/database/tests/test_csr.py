@@ -0,0 +1,134 @@
+'''
+Tests for the CSR* Collection in the database module.
+'''
+
+# built-in imports
+from typing import List, Tuple
+
+# library imports
+from ..csr import CSRGraphDB, IncrementalCSR, IncrementalCSRIndex
+
+from ...maker.simple import SimpleMakerFacade
+
+# external imports
+import numpy as np
+
+
+'''
+Unit tests for incremental CSR export.
+'''
+
+def test_incremental_csr_index() -> None:
+    '''
+    Tests that an `IncrementalCSRIndex` splices new edges into its cached arrays in write order.
+    '''
+    index: IncrementalCSRIndex = IncrementalCSRIndex(capacity = 1)
+
+    for source, destination in [(0, 1), (1, 2), (0, 3)]:
+        index.append_(source = source, destination = destination)
+
+    indptr, indices = index.to_csr()
+
+    assert indptr.tolist() == [0, 2, 3, 3, 3] and indices.tolist() == [1, 3, 2], 'expected <%s>.to_csr(..) to group successors by source.' % IncrementalCSRIndex.__name__
+
+    assert index.to_csr()[0] is indptr, 'expected <%s>.to_csr(..) to reuse its arrays when nothing was written.' % IncrementalCSRIndex.__name__
+
+    # test that new edges and vertices are spliced in
+
+    for source, destination in [(1, 4), (4, 5), (0, 6)]:
+        index.append_(source = source, destination = destination)
+
+    indptr, indices = index.to_csr()
+
+    assert indptr.tolist() == [0, 3, 5, 5, 5, 6, 6, 6] and indices.tolist() == [1, 3, 6, 2, 4, 5], 'expected <%s>.to_csr(..) to splice new edges after old ones.' % IncrementalCSRIndex.__name__
+
+    assert index.parents.tolist() == [-1, 0, 1, 0, 1, 4, 0], 'expected <%s> to keep a parent for each vertex.' % IncrementalCSRIndex.__name__
+
+    # test the vectorized helpers
+
+    assert index.fan_out().tolist() == [3, 2, 0, 0, 1, 0, 0], 'expected <%s>.fan_out(..) to count successors.' % IncrementalCSRIndex.__name__
+
+    assert index.reachable_from(label = 1).nonzero()[0].tolist() == [2, 4, 5], 'expected <%s>.reachable_from(..) to find every descendant.' % IncrementalCSRIndex.__name__
+
+    assert index.reachable_from(label = 0, depth = 1).nonzero()[0].tolist() == [1, 3, 6], 'expected <%s>.reachable_from(..) to stop at the depth limit.' % IncrementalCSRIndex.__name__
+
+    # all tests passed
+
+    return None
+
+
+def test_incremental_csr_runs() -> None:
+    '''
+    Tests that an `IncrementalCSRIndex` taken after every edge keeps few runs and agrees with a full rebuild.
+    '''
+    index: IncrementalCSRIndex = IncrementalCSRIndex(capacity = 1)
+
+    edges: List[Tuple[int, int]] = [ (label // 3, label) for label in range(1, 2000) ]
+
+    for source, destination in edges:
+        index.append_(source = source, destination = destination)
+
+        csr: IncrementalCSR = index.to_incremental_csr()
+
+        assert len(csr.runs) <= 12, 'expected <%s>.to_incremental_csr(..) to merge runs of similar size.' % IncrementalCSRIndex.__name__
+
+        assert sum(len(sources) for sources, _ in csr.runs) <= 0.25 * len(csr.indices) + 1, 'expected <%s> to fold runs into the base past its fraction.' % IncrementalCSRIndex.__name__
+
+    # test that queries over runs agree with the folded arrays
+
+    index.append_(source = 0, destination = 2000)
+
+    assert index._runs, 'expected <%s> to keep the newest edge in a run.' % IncrementalCSRIndex.__name__  # type: ignore private usage
+
+    fan_out: List[int] = index.fan_out().tolist()
+
+    reached: List[int] = index.reachable_from(label = 1).nonzero()[0].tolist()
+
+    indptr, indices = index.to_csr()
+
+    assert not index._runs and fan_out == np.diff(indptr).tolist() and fan_out[:2] == [3, 3], 'expected <%s>.fan_out(..) to count successors in runs.' % IncrementalCSRIndex.__name__  # type: ignore private usage
+
+    assert indices[indptr[0]:indptr[1]].tolist() == [1, 2, 2000], 'expected <%s>.to_csr(..) to keep write order within a row.' % IncrementalCSRIndex.__name__
+
+    assert reached == sorted(set(range(3, 2000)) - { label for label in range(3, 2000) if _root_of(label = label) != 1 }), 'expected <%s>.reachable_from(..) to follow edges in runs.' % IncrementalCSRIndex.__name__
+
+    # all tests passed
+
+    return None
+
+
+def _root_of(label: int) -> int:
+    '''
+    Finds the child of the root that this `label` descends from in a tree where the parent of `label` is `label // 3`.
+    '''
+    while label // 3 > 0: label //= 3
+
+    return label
+
+
+def test_csr_graph_database() -> None:
+    '''
+    Tests that a `CSRGraphDB` indexes the edges that the maker writes.
+    '''
+    graph_db: CSRGraphDB[type] = CSRGraphDB()
+
+    facade: SimpleMakerFacade[type] = SimpleMakerFacade(graph = graph_db)
+
+    for memento in (int, str):
+        facade.trace_(data = list)
+
+        facade.trace_(data = memento)
+
+        facade.untrace_()
+
+        facade.untrace_()
+
+    indptr, indices = graph_db.to_csr()
+
+    assert indptr.tolist() == [0, 2, 3, 3, 4, 4] and indices.tolist() == [1, 3, 2, 4], 'expected <%s>.to_csr(..) to match the traced tree.' % CSRGraphDB.__name__
+
+    assert graph_db.load_stateful_vertex(label = 4) is str, 'expected <%s> to keep writing into the graph.' % CSRGraphDB.__name__
+
+    # all tests passed
+
+    return None
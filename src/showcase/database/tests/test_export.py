@@ -0,0 +1,157 @@
+'''
+Tests for the Export* Collection in the database module.
+'''
+
+# built-in imports
+from json import loads
+from typing import Any, List
+
+# library imports
+from ..export import ExportChunk, ExportRow, StreamingGraphExporter, decode_columnar
+from ..simple import SimpleGraphDB
+
+from ...maker.simple import SimpleMakerFacade
+
+
+'''
+Mock-ups for testing.
+'''
+
+class MockLinear:
+    '''
+    Memento class for a linear layer.
+    '''
+
+    pass
+
+
+def mock_graph() -> SimpleGraphDB[int, object]:
+    '''
+    Makes a trace where the root has three children and the first child has two children of its own.
+    '''
+    graph_db: SimpleGraphDB[int, object] = SimpleGraphDB()
+
+    facade: SimpleMakerFacade[object] = SimpleMakerFacade(graph = graph_db)
+
+    facade.trace_(data = MockLinear); facade.trace_(data = MockLinear); facade.untrace_(); facade.trace_(data = MockLinear()); facade.untrace_(); facade.untrace_()
+
+    facade.trace_(data = MockLinear); facade.untrace_(); facade.trace_(data = MockLinear); facade.untrace_()
+
+    return graph_db
+
+
+'''
+Unit tests for streaming exports.
+'''
+
+def test_streaming_graph_exporter() -> None:
+    '''
+    Tests that a `StreamingGraphExporter` walks a trace in bounded, resumable chunks.
+    '''
+    graph_db: SimpleGraphDB[int, object] = mock_graph()
+
+    exporter: StreamingGraphExporter[int, object] = StreamingGraphExporter(graph = graph_db, chunk_size = 2)
+
+    chunks: List[ExportChunk] = list(exporter.iterate_chunks())
+
+    assert all(len(chunk.rows) <= 2 for chunk in chunks) and chunks[-1].token is None, 'expected <%s>.iterate_chunks(..) to bound each chunk and end without a token.' % StreamingGraphExporter.__name__
+
+    rows: List[ExportRow] = [ row for chunk in chunks for row in chunk.rows ]
+
+    assert [ (label, parent) for label, parent, _ in rows ] == [(0, None), (1, 0), (2, 1), (3, 1), (4, 0), (5, 0)], 'expected <%s> to walk depth-first with each parent.' % StreamingGraphExporter.__name__
+
+    assert rows[0][2] is None and rows[1][2] == rows[3][2] == '%s.%s' % (MockLinear.__module__, MockLinear.__qualname__), 'expected <%s> to encode mementos by qualified name.' % StreamingGraphExporter.__name__
+
+    # test resuming from a token with another exporter
+
+    token: str = chunks[1].token  # type: ignore optional token
+
+    assert StreamingGraphExporter(graph = graph_db, chunk_size = 10).read_chunk(token = token).rows == rows[4:], 'expected <%s>.read_chunk(..) to resume from a token.' % StreamingGraphExporter.__name__
+
+    try:
+        exporter.read_chunk(token = 'not a token')
+
+        raise AssertionError('expected <%s>.read_chunk(..) to reject a malformed token.' % StreamingGraphExporter.__name__) # pragma: no cover
+
+    except ValueError: pass # check passed
+
+    # all tests passed
+
+    return None
+
+
+def test_streaming_graph_exporter_wide_vertex() -> None:
+    '''
+    Tests that a `StreamingGraphExporter` resumes a wide vertex by seeking rather than by loading all of its children.
+    '''
+    graph_db: SimpleGraphDB[int, object] = SimpleGraphDB()
+
+    graph_db.write_stateful_vertex_(label = 0, data = None)
+
+    for label in range(1, 5001):
+        graph_db.write_stateful_vertex_(label = label, data = MockLinear)
+
+        graph_db.write_stateless_directed_edge_(source = 0, destination = label)
+
+    assert graph_db.load_successor_range(label = 0, start = 4998) == [4999, 5000] and graph_db.load_successor_range(label = 1, start = 0) == [], 'expected <%s>.load_successor_range(..) to slice successors.' % SimpleGraphDB.__name__
+
+    # count what the exporter takes from the graph while resuming from a token every chunk
+
+    windows: List[int] = list()
+
+    load_successor_range: Any = graph_db.load_successor_range
+
+    def counted_range(*args: Any, **kwargs: Any) -> List[int]:
+        window: List[int] = load_successor_range(*args, **kwargs)
+
+        windows.append(len(window))
+
+        return window
+
+    graph_db.load_successor_range = counted_range  # type: ignore instance override
+
+    exporter: StreamingGraphExporter[int, object] = StreamingGraphExporter(graph = graph_db, chunk_size = 64)
+
+    chunk: ExportChunk = exporter.read_chunk()
+
+    labels: List[int] = [ label for label, _, _ in chunk.rows ]
+
+    while chunk.token is not None:
+        chunk = exporter.read_chunk(token = chunk.token)
+
+        labels.extend([ label for label, _, _ in chunk.rows ])
+
+    assert labels == list(range(5001)), 'expected <%s> to export every child of a wide vertex once.' % StreamingGraphExporter.__name__
+
+    assert max(windows) <= 64 and sum(windows) <= 2 * 5000, 'expected <%s> to load a bounded window of children a chunk.' % StreamingGraphExporter.__name__
+
+    assert [ row for chunk in exporter.iterate_chunks() for row in chunk.rows ] == [ (label, None if label == 0 else 0, None if label == 0 else '%s.%s' % (MockLinear.__module__, MockLinear.__qualname__)) for label in range(5001) ], 'expected <%s>.iterate_chunks(..) to walk the same rows.' % StreamingGraphExporter.__name__
+
+    # all tests passed
+
+    return None
+
+
+def test_streaming_graph_exporter_formats() -> None:
+    '''
+    Tests that a `StreamingGraphExporter` encodes chunks as newline-delimited JSON and as columns.
+    '''
+    exporter: StreamingGraphExporter[int, object] = StreamingGraphExporter(graph = mock_graph(), chunk_size = 4)
+
+    chunk: ExportChunk = exporter.read_chunk()
+
+    lines: List[str] = exporter.encode_chunk(chunk = chunk, format = 'ndjson').decode('utf-8').splitlines()
+
+    assert [ loads(line)['label'] for line in lines[:-1] ] == [0, 1, 2, 3] and loads(lines[-1]) == { 'next': chunk.token }, 'expected <%s> to write a JSON line a row and then the token.' % StreamingGraphExporter.__name__
+
+    labels, parents, indices, table, token = decode_columnar(payload = exporter.encode_chunk(chunk = chunk, format = 'columnar'))
+
+    assert labels.tolist() == [0, 1, 2, 3] and parents.tolist() == [-1, 0, 1, 1] and token == chunk.token, 'expected <%s> to write label and parent columns and the token.' % StreamingGraphExporter.__name__
+
+    assert len(table) == 2 and [ table[index] for index in indices ] == [ memento for _, _, memento in chunk.rows ], 'expected <%s> to write each distinct memento once.' % StreamingGraphExporter.__name__
+
+    assert len(b''.join(exporter.iterate_encoded(format = 'ndjson')).splitlines()) == 6 + 2, 'expected <%s>.iterate_encoded(..) to encode every chunk.' % StreamingGraphExporter.__name__
+
+    # all tests passed
+
+    return None
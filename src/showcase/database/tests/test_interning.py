@@ -0,0 +1,103 @@
+'''
+Tests for the Interning* Collection in the database module.
+'''
+
+# library imports
+from ..interning import InterningGraphDB, MementoInternTable
+from ..simple import SimpleGraphDB
+from ..snapshot import SnapshotGraphDB
+
+from ...maker.simple import SimpleMakerFacade
+
+
+'''
+Mock-ups for testing.
+'''
+
+class MockConvolution:
+    '''
+    Memento class for a convolution layer.
+    '''
+
+    pass
+
+
+class MockActivation:
+    '''
+    Memento class for an activation layer.
+    '''
+
+    pass
+
+
+'''
+Unit tests for interning mementos.
+'''
+
+def test_memento_intern_table() -> None:
+    '''
+    Tests that a `MementoInternTable` gives equal mementos one id and unhashable mementos an id each.
+    '''
+    table: MementoInternTable[object] = MementoInternTable()
+
+    assert [ table.intern_(data = data) for data in (MockConvolution, MockActivation, MockConvolution) ] == [0, 1, 0], 'expected <%s>.intern_(..) to hand out dense ids by value.' % MementoInternTable.__name__
+
+    first: list = list(); second: list = list()
+
+    assert table.intern_(data = first) != table.intern_(data = second), 'expected <%s>.intern_(..) to intern unhashable mementos by identity.' % MementoInternTable.__name__
+
+    assert table.resolve(identifier = 2) is first and table.find(data = MockActivation) == 1 and table.find(data = 'missing') is None, 'expected <%s> to resolve and find ids.' % MementoInternTable.__name__
+
+    # test that equal values of different types are interned apart
+
+    graph_db: InterningGraphDB[int, object] = InterningGraphDB(backend = SimpleGraphDB())
+
+    for label, data in enumerate((1, True, 1.0)): graph_db.write_stateful_vertex_(label = label, data = data)
+
+    assert [ type(graph_db.load_stateful_vertex(label = label)) for label in range(3) ] == [int, bool, float], 'expected <%s>.intern_(..) to key mementos by type and value.' % MementoInternTable.__name__
+
+    # all tests passed
+
+    return None
+
+
+def test_interning_graph_database() -> None:
+    '''
+    Tests that an `InterningGraphDB` stores ids in its backend and resolves them on every read path.
+    '''
+    graph_db: InterningGraphDB[int, object] = InterningGraphDB(backend = SimpleGraphDB())
+
+    facade: SimpleMakerFacade[object] = SimpleMakerFacade(graph = graph_db)
+
+    for memento in (MockConvolution, MockActivation, MockConvolution, MockActivation):
+        facade.trace_(data = memento)
+
+        facade.untrace_()
+
+    # test that the backend only holds ids
+
+    assert [ graph_db.backend.load_stateful_vertex(label = label) for label in range(1, 5) ] == [0, 1, 0, 1], 'expected <%s> to write ids into its backend.' % InterningGraphDB.__name__
+
+    assert [ data for _, data in graph_db.iterate_children(label = 0) ] == [MockConvolution, MockActivation, MockConvolution, MockActivation], 'expected <%s> to resolve ids in traversals.' % InterningGraphDB.__name__
+
+    # test integer scans and group-bys
+
+    assert list(graph_db.iterate_labels_with(data = MockActivation, labels = range(1, 5))) == [2, 4], 'expected <%s>.iterate_labels_with(..) to match by id.' % InterningGraphDB.__name__
+
+    assert graph_db.count_by_memento(labels = range(1, 5)) == { 0: 2, 1: 2 }, 'expected <%s>.count_by_memento(..) to count by id.' % InterningGraphDB.__name__
+
+    # test that publishing passes through to a snapshot backend
+
+    snapshot_db: InterningGraphDB[int, object] = InterningGraphDB(backend = SnapshotGraphDB())
+
+    SimpleMakerFacade(graph = snapshot_db).trace_(data = MockConvolution)
+
+    snapshot_db.publish_epoch_()
+
+    assert snapshot_db.backend.epoch == 1 and snapshot_db.load_stateful_vertex(label = 1) is MockConvolution, 'expected <%s>.publish_epoch_(..) to publish on its backend.' % InterningGraphDB.__name__
+
+    assert snapshot_db.load_stateful_vertex(label = 0) is None, 'expected <%s> to keep endpoint-only vertices as None.' % InterningGraphDB.__name__
+
+    # all tests passed
+
+    return None
@@ -0,0 +1,182 @@
+'''
+Tests for the Remote* Collection in the database module.
+'''
+
+# built-in imports
+from multiprocessing import AuthenticationError
+from os.path import join
+from tempfile import TemporaryDirectory
+from time import sleep
+from typing import Iterator, Tuple
+
+# library imports
+from ..remote import GraphServer, RemoteConnection, RemoteGraphDB, _connect, _encode_frame, _read_frame
+from ..simple import SimpleGraphDB
+from ..snapshot import SnapshotGraphDB
+
+from ...assembler.simple import SimpleAssembler
+from ...maker.simple import SimpleMakerFacade
+
+
+'''
+Unit tests for serving a graph over a socket.
+'''
+
+def test_remote_graph_database_over_unix_socket() -> None:
+    '''
+    Tests that a `RemoteGraphDB` can write to and load from a `SimpleGraphDB` served over a Unix socket.
+    '''
+    with TemporaryDirectory() as directory:
+        graph_db: SimpleGraphDB[int, type] = SimpleGraphDB()
+
+        with GraphServer(graph = graph_db, address = join(directory, 'graph.sock')) as server, RemoteGraphDB(address = server.address, batch_size = 2, chunk_size = 1) as remote:
+            # test that the maker can write through the client
+
+            facade: SimpleMakerFacade[type] = SimpleMakerFacade(graph = remote)
+
+            facade.trace_(data = int)
+
+            facade.trace_(data = str)
+
+            facade.untrace_()
+
+            facade.untrace_()
+
+            remote.flush_()
+
+            assert set(graph_db._graph.edges) == { (0, 1), (1, 2) }, 'expected <%s>.flush(..) to write every buffered edge.' % RemoteGraphDB.__name__ # type: ignore private usage
+
+            # test that the assembler can load through the client
+
+            assembler: SimpleAssembler[type] = SimpleAssembler(database = remote)
+
+            assert assembler.get_component(key = 2) is str, 'expected <%s>.get_component(..) to load through a <%s>.' % (SimpleAssembler.__name__, RemoteGraphDB.__name__)
+
+            assert remote.load_stateful_vertices(labels = [1, 2]) == [int, str], 'expected <%s>.load_stateful_vertices(..) to load every label in order.' % RemoteGraphDB.__name__
+
+            assert remote.load_successor_range(label = 0, start = 0) == [1] and remote.load_successor_range(label = 0, start = 1) == [], 'expected <%s>.load_successor_range(..) to load a range on the server.' % RemoteGraphDB.__name__
+
+            # test that a bad label raises the same error as a local graph
+
+            try:
+                assembler.get_component(key = 9)
+
+                raise AssertionError('expected <%s>.load_stateful_vertex(..) to raise an error on a bad label.' % RemoteGraphDB.__name__) # pragma: no cover
+
+            except KeyError: pass
+
+            # test that the connection is still usable after an error
+
+            assert remote.pipeline([('load', (1,)), ('load', (2,))]) == [int, str], 'expected <%s>.pipeline(..) to answer requests in order.' % RemoteGraphDB.__name__
+
+            # test that traversals page through the server
+
+            remote_walk = list(remote.iterate_depth_first(label = 0))
+
+            assert remote_walk == [(1, int), (2, str)], 'expected <%s>.iterate_depth_first(..) to page through a server-side walk.' % RemoteGraphDB.__name__
+
+            assert list(remote.iterate_ancestors(label = 2)) == [(1, int), (0, None)], 'expected <%s>.iterate_ancestors(..) to page through a server-side walk.' % RemoteGraphDB.__name__
+
+            # test that a cursor survives writes between chunks
+
+            children: Iterator[Tuple[int, type]] = remote.iterate_children(label = 1)
+
+            assert next(children) == (2, str), 'expected <%s>.iterate_children(..) to page the first child.' % RemoteGraphDB.__name__
+
+            remote.write_stateful_vertex_(label = 9, data = float); remote.write_stateless_directed_edge_(source = 1, destination = 9); remote.flush_()
+
+            assert list(children) == [ ], 'expected <%s>.iterate_children(..) to keep paging after a write.' % RemoteGraphDB.__name__
+
+            # test that a client hanging up mid-walk drops its cursors
+
+            connection: RemoteConnection = _connect(address = server.address)
+
+            connection[0].sendall(_encode_frame(('open_cursor', ('depth_first', 0, None))))
+
+            assert _read_frame(connection[1])[0] and len(server._cursors) == 1, 'expected <%s> to open a cursor.' % GraphServer.__name__  # type: ignore private usage
+
+            connection[1].close(); connection[0].close()
+
+            for _ in range(100):
+                if not server._cursors: break  # type: ignore private usage
+
+                sleep(0.01)
+
+            assert not server._cursors, 'expected <%s> to drop the cursors of a client that hung up.' % GraphServer.__name__  # type: ignore private usage
+
+    # all tests passed
+
+    return None
+
+
+def test_remote_graph_database_over_tcp() -> None:
+    '''
+    Tests that a `RemoteGraphDB` forwards epoch publishing to a `SnapshotGraphDB` served over TCP.
+    '''
+    graph_db: SnapshotGraphDB[int, str] = SnapshotGraphDB()
+
+    with GraphServer(graph = graph_db, address = ('127.0.0.1', 0)) as server, RemoteGraphDB(address = server.address) as remote:
+        remote.write_stateful_vertex_(label = 0, data = 'data')
+
+        try:
+            remote.load_stateful_vertex(label = 0)
+
+            raise AssertionError('expected <%s>.load_stateful_vertex(..) to hide an unpublished vertex.' % RemoteGraphDB.__name__) # pragma: no cover
+
+        except KeyError: pass
+
+        remote.publish_epoch_()
+
+        assert remote.load_stateful_vertex(label = 0) == 'data', 'expected <%s>.publish_epoch(..) to publish on the served graph.' % RemoteGraphDB.__name__
+
+    # test that a server refuses to serve pickles beyond loopback without an authkey
+
+    try:
+        GraphServer(graph = graph_db, address = ('0.0.0.0', 0))
+
+        raise AssertionError('expected <%s> to refuse a non-loopback address without an authkey.' % GraphServer.__name__) # pragma: no cover
+
+    except ValueError: pass # check passed
+
+    # all tests passed
+
+    return None
+
+
+def test_remote_graph_database_authentication() -> None:
+    '''
+    Tests that a `GraphServer` with an authkey only answers clients that prove they hold it.
+    '''
+    graph_db: SimpleGraphDB[int, str] = SimpleGraphDB()
+
+    with GraphServer(graph = graph_db, address = ('127.0.0.1', 0), authkey = b'secret') as server:
+        with RemoteGraphDB(address = server.address, authkey = b'secret') as remote:
+            remote.write_stateful_vertex_(label = 0, data = 'data')
+
+            assert remote.load_stateful_vertex(label = 0) == 'data', 'expected <%s> to answer a client with the authkey.' % GraphServer.__name__
+
+        try:
+            RemoteGraphDB(address = server.address, authkey = b'wrong').load_stateful_vertex(label = 0)
+
+            raise AssertionError('expected <%s> to refuse a client with the wrong authkey.' % GraphServer.__name__) # pragma: no cover
+
+        except AuthenticationError: pass # check passed
+
+        # test that a frame sent instead of an answer to the challenge is never unpickled
+
+        connection: RemoteConnection = _connect(address = server.address)
+
+        try:
+            assert len(connection[1].read(32)) == 32, 'expected <%s> to challenge a new connection.' % GraphServer.__name__
+
+            connection[0].sendall(_encode_frame(('write_vertex', (1, 'intruder' * 8))))
+
+            assert connection[1].read() == b'#FAILURE#', 'expected <%s> to refuse and hang up on a client that skips the challenge.' % GraphServer.__name__
+
+        finally: connection[1].close(); connection[0].close()
+
+    assert 1 not in graph_db._graph, 'expected <%s> not to run requests from an unauthenticated client.' % GraphServer.__name__  # type: ignore private usage
+
+    # all tests passed
+
+    return None
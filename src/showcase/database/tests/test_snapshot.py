@@ -0,0 +1,127 @@
+'''
+Tests for the Snapshot* Collection in the database module.
+'''
+
+# library imports
+from ..snapshot import SnapshotGraphDB, GraphSnapshot
+
+from ...maker.simple import SimpleMakerFacade
+
+
+'''
+Unit tests for snapshot isolation.
+'''
+
+def test_pinned_snapshot_isolation_for_snapshot_graph_database() -> None:
+    '''
+    Tests that a `GraphSnapshot` only sees the writes published before it was pinned.
+    '''
+    graph_db: SnapshotGraphDB[int, str] = SnapshotGraphDB()
+
+    # test that unpublished writes are invisible
+
+    graph_db.write_stateful_vertex_(label = 0, data = 'old')
+
+    graph_db.write_stateless_directed_edge_(source = 0, destination = 1)
+
+    before: GraphSnapshot[int, str] = graph_db.pin_snapshot_()
+
+    try:
+        before.load_stateful_vertex(label = 0)
+
+        raise AssertionError('expected <%s>.load_stateful_vertex(..) to raise an error on an unpublished vertex.' % GraphSnapshot.__name__) # pragma: no cover
+
+    except KeyError: pass
+
+    assert before.load_successors(label = 0) == [ ], 'expected <%s>.load_successors(..) to hide unpublished edges.' % GraphSnapshot.__name__
+
+    # test that published writes are visible to new snapshots only
+
+    graph_db.publish_epoch_()
+
+    with graph_db.pin_snapshot_() as after:
+        assert after.load_stateful_vertex(label = 0) == 'old', 'expected <%s>.load_stateful_vertex(..) to see a published vertex.' % GraphSnapshot.__name__
+
+        assert after.load_successors(label = 0) == [1], 'expected <%s>.load_successors(..) to see a published edge.' % GraphSnapshot.__name__
+
+        # test that a pinned snapshot does not see a newer version
+
+        graph_db.write_stateful_vertex_(label = 0, data = 'new')
+
+        graph_db.publish_epoch_()
+
+        assert after.load_stateful_vertex(label = 0) == 'old', 'expected <%s>.load_stateful_vertex(..) to keep the pinned version.' % GraphSnapshot.__name__
+
+        assert graph_db.load_stateful_vertex(label = 0) == 'new', 'expected <%s>.load_stateful_vertex(..) to load the latest published version.' % SnapshotGraphDB.__name__
+
+    before.release_()
+
+    # all tests passed
+
+    return None
+
+
+def test_epoch_reclamation_for_snapshot_graph_database() -> None:
+    '''
+    Tests that a `SnapshotGraphDB` reclaims versions once no pinned epoch can see them.
+    '''
+    graph_db: SnapshotGraphDB[int, str] = SnapshotGraphDB()
+
+    graph_db.write_stateful_vertex_(label = 0, data = 'first')
+
+    graph_db.publish_epoch_()
+
+    snapshot: GraphSnapshot[int, str] = graph_db.pin_snapshot_()
+
+    graph_db.write_stateful_vertex_(label = 0, data = 'second')
+
+    graph_db.publish_epoch_()
+
+    assert len(graph_db._versions[0]) == 2, 'expected <%s> to keep a version that a pinned epoch can see.' % SnapshotGraphDB.__name__ # type: ignore private usage
+
+    snapshot.release_()
+
+    snapshot.release_()
+
+    assert graph_db._pins == { }, 'expected <%s>.release(..) to unpin its epoch exactly once.' % GraphSnapshot.__name__ # type: ignore private usage
+
+    graph_db.publish_epoch_()
+
+    assert graph_db._versions[0] == [(2, 'second')], 'expected <%s> to reclaim versions that no pinned epoch can see.' % SnapshotGraphDB.__name__ # type: ignore private usage
+
+    # all tests passed
+
+    return None
+
+
+'''
+Integration tests with the maker module.
+'''
+
+def test_maker_publishes_epochs_at_subtree_boundaries() -> None:
+    '''
+    Tests that a `SimpleMakerFacade` publishes a new epoch each time it retreats from a subtree.
+    '''
+    graph_db: SnapshotGraphDB[int, type] = SnapshotGraphDB()
+
+    facade: SimpleMakerFacade[type] = SimpleMakerFacade(graph = graph_db)
+
+    facade.trace_(data = int)
+
+    facade.trace_(data = str)
+
+    with graph_db.pin_snapshot_() as snapshot:
+        assert snapshot.load_successors(label = 0) == [ ], 'expected <%s> to hide a half-extended path.' % SnapshotGraphDB.__name__
+
+    facade.untrace_()
+
+    with graph_db.pin_snapshot_() as snapshot:
+        assert snapshot.load_successors(label = 1) == [2], 'expected <%s> to publish a finished subtree.' % SnapshotGraphDB.__name__
+
+        assert snapshot.load_stateful_vertex(label = 2) is str, 'expected <%s> to publish the vertices of a finished subtree.' % SnapshotGraphDB.__name__
+
+        assert list(snapshot.iterate_ancestors(label = 2)) == [(1, int), (0, None)], 'expected <%s>.iterate_ancestors(..) to walk up to the root.' % GraphSnapshot.__name__
+
+    # all tests passed
+
+    return None
@@ -0,0 +1,148 @@
+'''
+Tests for the Tiered* Collection in the database module.
+'''
+
+# built-in imports
+from threading import Thread
+from typing import List
+
+# library imports
+from ..tiered import TieredGraphDB
+
+from ...maker.simple import SimpleMakerFacade
+
+
+'''
+Mock-ups for testing.
+'''
+
+def mock_episode(graph_db: TieredGraphDB[type], subtrees: int) -> None:
+    '''
+    Traces this many root subtrees, each a call to `list` with nested calls to `int` and `str`.
+    '''
+    facade: SimpleMakerFacade[type] = SimpleMakerFacade(graph = graph_db)
+
+    for _ in range(subtrees):
+        facade.trace_(data = list)
+
+        for memento in (int, str):
+            facade.trace_(data = memento)
+
+            facade.untrace_()
+
+        facade.untrace_()
+
+    return None
+
+
+'''
+Unit tests for tiered storage.
+'''
+
+def test_compaction_for_tiered_graph_database() -> None:
+    '''
+    Tests that a `TieredGraphDB` compacts older root subtrees and loads them back on demand.
+    '''
+    graph_db: TieredGraphDB[type] = TieredGraphDB(hot_subtrees = 2, cached_blocks = 1)
+
+    mock_episode(graph_db = graph_db, subtrees = 5)
+
+    # test that only the newest subtrees stay hot
+
+    assert len(graph_db._blocks) == 3, 'expected <%s> to compact all but the two newest root subtrees.' % TieredGraphDB.__name__ # type: ignore private usage
+
+    assert sorted(graph_db._hot_vertices) == list(range(10, 16)), 'expected <%s> to keep the two newest root subtrees hot.' % TieredGraphDB.__name__ # type: ignore private usage
+
+    # test that cold vertices load through a bounded cache
+
+    assert [ graph_db.load_stateful_vertex(label = label) for label in range(1, 7) ] == [list, int, str] * 2, 'expected <%s>.load_stateful_vertex(..) to load from cold blocks.' % TieredGraphDB.__name__
+
+    assert list(graph_db._cache) == [1], 'expected <%s> to evict the least recently used block.' % TieredGraphDB.__name__ # type: ignore private usage
+
+    # test that traversals cross the tiers
+
+    assert [ label for label, _ in graph_db.iterate_depth_first(label = 0) ] == list(range(1, 16)), 'expected <%s>.iterate_depth_first(..) to walk both tiers.' % TieredGraphDB.__name__
+
+    assert list(graph_db.iterate_ancestors(label = 6)) == [(4, list), (0, None)], 'expected <%s>.iterate_ancestors(..) to walk up from a cold block.' % TieredGraphDB.__name__
+
+    # test that a bad label raises an error
+
+    try:
+        graph_db.load_stateful_vertex(label = 99)
+
+        raise AssertionError('expected <%s>.load_stateful_vertex(..) to raise an error on a bad label.' % TieredGraphDB.__name__) # pragma: no cover
+
+    except KeyError: pass
+
+    # test that equal values of different types survive compaction
+
+    values_db: TieredGraphDB[object] = TieredGraphDB(hot_subtrees = 1)
+
+    values_db.write_stateful_vertex_(label = 0, data = None)
+
+    for label, data in enumerate((1, True, 1.0), start = 1):
+        values_db.write_stateful_vertex_(label = label, data = data)
+
+        values_db.write_stateless_directed_edge_(source = 0 if label == 1 else 1, destination = label)
+
+    values_db.write_stateful_vertex_(label = 4, data = None); values_db.write_stateless_directed_edge_(source = 0, destination = 4)
+
+    assert len(values_db._blocks) == 1, 'expected <%s> to compact the first root subtree.' % TieredGraphDB.__name__ # type: ignore private usage
+
+    assert [ type(values_db.load_stateful_vertex(label = label)) for label in (1, 2, 3) ] == [int, bool, float], 'expected <%s>.compact_(..) to key mementos by type and value.' % TieredGraphDB.__name__
+
+    # all tests passed
+
+    return None
+
+
+def test_archiving_for_tiered_graph_database() -> None:
+    '''
+    Tests that a `TieredGraphDB` can archive a whole episode with the `lzma` codec.
+    '''
+    graph_db: TieredGraphDB[type] = TieredGraphDB(codec = 'lzma')
+
+    mock_episode(graph_db = graph_db, subtrees = 3)
+
+    graph_db.compact_all_()
+
+    assert graph_db._hot_vertices == { } and len(graph_db._blocks) == 3, 'expected <%s>.compact_all(..) to empty the hot tier.' % TieredGraphDB.__name__ # type: ignore private usage
+
+    assert list(graph_db.iterate_children(label = 4)) == [(5, int), (6, str)], 'expected <%s>.iterate_children(..) to load from an archived block.' % TieredGraphDB.__name__
+
+    # all tests passed
+
+    return None
+
+
+def test_concurrent_reads_for_tiered_graph_database() -> None:
+    '''
+    Tests that a reader never misses a written vertex while a `TieredGraphDB` compacts subtrees underneath it.
+    '''
+    graph_db: TieredGraphDB[type] = TieredGraphDB(hot_subtrees = 1, cached_blocks = 2)
+
+    facade: SimpleMakerFacade[type] = SimpleMakerFacade(graph = graph_db)
+
+    written: List[int] = [0]; missed: List[int] = list(); done: List[bool] = [False]
+
+    def read() -> None:
+        while not done[0]:
+            for label in range(max(1, written[0] - 8), written[0] + 1):
+                try: graph_db.load_stateful_vertex(label = label)
+
+                except KeyError: missed.append(label)
+
+    reader: Thread = Thread(target = read); reader.start()
+
+    for _ in range(2000):
+        facade.trace_(data = list); facade.trace_(data = int); facade.untrace_(); facade.untrace_()
+
+        written[0] = facade._strategy._nodes  # type: ignore private usage
+
+    done[0] = True; reader.join()
+
+    assert not missed, 'expected <%s> to keep every vertex readable while compacting, but missed %s.' % (TieredGraphDB.__name__, missed[:8])
+
+    # all tests passed
+
+    return None
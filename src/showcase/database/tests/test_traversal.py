@@ -0,0 +1,117 @@
+'''
+Tests for the Traversal* Collection in the database module.
+'''
+
+# built-in imports
+from typing import Iterator, List, Tuple
+
+# library imports
+from ..simple import SimpleGraphDB
+from ..traversal import SimpleGraphTraversal, chunk_vertices
+
+
+'''
+Mock-ups for testing.
+'''
+
+def mock_tree() -> SimpleGraphDB[int, str]:
+    '''
+    Makes a tree with edges `0 -> 1, 4, 6`, `1 -> 2, 3` and `4 -> 5`, where each vertex stores its label as a string.
+    '''
+    graph_db: SimpleGraphDB[int, str] = SimpleGraphDB()
+
+    for source, destination in [(0, 1), (1, 2), (1, 3), (0, 4), (4, 5), (0, 6)]:
+        graph_db.write_stateful_vertex_(label = destination, data = str(destination))
+
+        graph_db.write_stateless_directed_edge_(source = source, destination = destination)
+
+    return graph_db
+
+
+'''
+Unit tests for lazy traversal.
+'''
+
+def test_depth_and_breadth_first_traversal() -> None:
+    '''
+    Tests that a `SimpleGraphTraversal` walks descendants lazily in the expected orders.
+    '''
+    graph_db: SimpleGraphDB[int, str] = mock_tree()
+
+    # test that the walks are lazy
+
+    walk: Iterator[Tuple[int, str]] = graph_db.iterate_depth_first(label = 0)
+
+    assert next(walk) == (1, '1'), 'expected <%s>.iterate_depth_first(..) to yield one (label, data) pair at a time.' % SimpleGraphTraversal.__name__
+
+    # test the orders of full and depth-limited walks
+
+    assert [ label for label, _ in graph_db.iterate_depth_first(label = 0) ] == [1, 2, 3, 4, 5, 6], 'expected <%s>.iterate_depth_first(..) to walk in pre-order.' % SimpleGraphTraversal.__name__
+
+    assert [ label for label, _ in graph_db.iterate_breadth_first(label = 0) ] == [1, 4, 6, 2, 3, 5], 'expected <%s>.iterate_breadth_first(..) to walk level by level.' % SimpleGraphTraversal.__name__
+
+    assert [ label for label, _ in graph_db.iterate_depth_first(label = 0, depth = 1) ] == [1, 4, 6], 'expected <%s>.iterate_depth_first(..) to stop at the depth limit.' % SimpleGraphTraversal.__name__
+
+    assert [ label for label, _ in graph_db.iterate_breadth_first(label = 1, depth = 1) ] == [2, 3], 'expected <%s>.iterate_breadth_first(..) to stop at the depth limit.' % SimpleGraphTraversal.__name__
+
+    assert list(graph_db.iterate_depth_first(label = 0, depth = 0)) == [ ], 'expected <%s>.iterate_depth_first(..) to yield nothing at depth zero.' % SimpleGraphTraversal.__name__
+
+    # all tests passed
+
+    return None
+
+
+def test_children_and_ancestors_traversal() -> None:
+    '''
+    Tests that a `SimpleGraphTraversal` can iterate children and ancestors.
+    '''
+    graph_db: SimpleGraphDB[int, str] = mock_tree()
+
+    assert list(graph_db.iterate_children(label = 1)) == [(2, '2'), (3, '3')], 'expected <%s>.iterate_children(..) to yield each successor.' % SimpleGraphTraversal.__name__
+
+    assert list(graph_db.iterate_ancestors(label = 5)) == [(4, '4'), (0, None)], 'expected <%s>.iterate_ancestors(..) to yield the nearest ancestor first.' % SimpleGraphTraversal.__name__
+
+    # all tests passed
+
+    return None
+
+
+def test_chunked_traversal() -> None:
+    '''
+    Tests that `chunk_vertices` pages a walk into bounded chunks.
+    '''
+    graph_db: SimpleGraphDB[int, str] = mock_tree()
+
+    chunks: List[List[Tuple[int, str]]] = list(chunk_vertices(vertices = graph_db.iterate_depth_first(label = 0), chunk_size = 4))
+
+    assert [ len(chunk) for chunk in chunks ] == [4, 2], 'expected %s(..) to page a walk into chunks of at most four.' % chunk_vertices.__name__
+
+    # all tests passed
+
+    return None
+
+
+def test_traversal_during_writes() -> None:
+    '''
+    Tests that a walk over a `SimpleGraphDB` survives writes to the vertices it is part way through.
+    '''
+    graph_db: SimpleGraphDB[int, str] = mock_tree()
+
+    walk: Iterator[Tuple[int, str]] = graph_db.iterate_depth_first(label = 0)
+
+    children: Iterator[Tuple[int, str]] = graph_db.iterate_children(label = 0)
+
+    assert next(walk) == (1, '1') and next(children) == (1, '1'), 'expected <%s> to start walking.' % SimpleGraphTraversal.__name__
+
+    for label in (7, 8):
+        graph_db.write_stateful_vertex_(label = label, data = str(label))
+
+        graph_db.write_stateless_directed_edge_(source = 0, destination = label)
+
+    assert [ label for label, _ in walk ] == [2, 3, 4, 5, 6], 'expected <%s>.iterate_depth_first(..) to keep walking the adjacency it loaded.' % SimpleGraphTraversal.__name__
+
+    assert [ label for label, _ in children ] == [4, 6], 'expected <%s>.iterate_children(..) to keep walking the adjacency it loaded.' % SimpleGraphTraversal.__name__
+
+    # all tests passed
+
+    return None
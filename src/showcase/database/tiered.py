@@ -0,0 +1,353 @@
+'''
+Tiered* Collection for the database module.
+
+Recent root subtrees stay in an in-memory hot tier and older ones are compacted into compressed, delta-encoded blocks.
+'''
+
+# built-in imports
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from lzma import compress as lzma_compress, decompress as lzma_decompress
+from pickle import dumps, loads, HIGHEST_PROTOCOL
+from threading import Lock
+from typing import Any, Callable, Deque, Dict, Generic, List, NamedTuple, Optional, Tuple
+from typing_extensions import Literal, TypeAlias
+from zlib import compress as zlib_compress, decompress as zlib_decompress
+
+# library imports
+from ._interface import PartiallyStatefulDirectedGraphInterface, StatefulVertexGraphLoaderInterface
+from ._keys import memento_key
+from ._types import VertexData
+from .traversal import SimpleGraphTraversal
+
+
+'''
+Types.
+'''
+
+TieredVertexLabel: TypeAlias = int
+
+TieredCodec: TypeAlias = Literal['zlib', 'lzma']
+
+
+class _DecodedBlock(NamedTuple):
+    '''
+    A decompressed block, indexed for loading vertices, successors and parents.
+    '''
+
+    vertices: Dict[TieredVertexLabel, Any]
+    successors: Dict[TieredVertexLabel, List[TieredVertexLabel]]
+    parents: Dict[TieredVertexLabel, TieredVertexLabel]
+
+
+_CODECS: Dict[str, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = \
+{
+    'zlib': (zlib_compress, zlib_decompress),
+    'lzma': (lzma_compress, lzma_decompress),
+}
+
+
+'''
+Concrete classes and ABC extensions.
+'''
+
+class TieredGraphDB\
+(
+    Generic[VertexData],
+    PartiallyStatefulDirectedGraphInterface[TieredVertexLabel, VertexData],
+    SimpleGraphTraversal[TieredVertexLabel, VertexData],
+    StatefulVertexGraphLoaderInterface[TieredVertexLabel, VertexData]
+):
+    '''
+    Class that can write a tree-shaped trace into a hot tier and compact finished root subtrees into cold blocks.
+
+    A root subtree is finished once the writer adds a newer child to the `root`; only the newest `hot_subtrees` stay
+    hot. A cold block stores its labels and parent offsets as delta-encoded integer arrays and its data as a table of
+    distinct values, so the data must be picklable. Loading from a cold block decompresses it into a cache that holds at
+    most `cached_blocks` blocks.
+
+    A single writer is assumed, but readers may run alongside it: a compacted subtree stays hot until its block is
+    published, so a reader always finds a vertex in one tier or the other.
+    '''
+
+    __root: TieredVertexLabel
+    __hot_subtrees: int
+    __codec: TieredCodec
+    __vertices: Dict[TieredVertexLabel, VertexData]
+    __successors: Dict[TieredVertexLabel, List[TieredVertexLabel]]
+    __parents: Dict[TieredVertexLabel, TieredVertexLabel]
+    __open_subtrees: Deque[TieredVertexLabel]
+    __block_starts: List[TieredVertexLabel]
+    __block_stops: List[TieredVertexLabel]
+    __blocks: List[bytes]
+    __cache: 'OrderedDict[int, _DecodedBlock]'
+    __cache_lock: Lock
+    __cached_blocks: int
+
+    '''
+    Property and dunder methods.
+    '''
+
+    def __init__(self, root: TieredVertexLabel = 0, hot_subtrees: int = 4, cached_blocks: int = 8, codec: TieredCodec = 'zlib', *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up empty hot and cold tiers for a trace under this `root`.
+        '''
+        if codec not in _CODECS: raise ValueError('%s expects a codec in %s, but got %s.' % (TieredGraphDB.__name__, sorted(_CODECS), codec))
+
+        self.__root = root
+
+        self.__hot_subtrees = hot_subtrees
+
+        self.__codec = codec
+
+        self.__vertices = dict()
+
+        self.__successors = dict()
+
+        self.__parents = dict()
+
+        self.__open_subtrees = deque()
+
+        self.__block_starts = list()
+
+        self.__block_stops = list()
+
+        self.__blocks = list()
+
+        self.__cache = OrderedDict()
+
+        self.__cache_lock = Lock()
+
+        self.__cached_blocks = cached_blocks
+
+        return None
+
+    @property
+    def _hot_vertices(self) -> Dict[TieredVertexLabel, VertexData]: return self.__vertices
+
+    @property
+    def _blocks(self) -> List[bytes]: return self.__blocks
+
+    @property
+    def _cache(self) -> 'OrderedDict[int, _DecodedBlock]': return self.__cache
+
+    '''
+    ABC extensions.
+    '''
+
+    def write_stateful_vertex_(self, label: TieredVertexLabel, data: VertexData, *args: Any, **kwargs: Any) -> None:
+        '''
+        Writes a vertex with this `label` associated with this `data` into the hot tier.
+        '''
+        self.__vertices[label] = data
+
+        return None
+
+    def write_stateless_directed_edge_(self, source: TieredVertexLabel, destination: TieredVertexLabel, *args: Any, **kwargs: Any) -> None:
+        '''
+        Writes an unlabelled edge from this `source` to this `destination` into the hot tier.
+
+        An edge from the root opens a new root subtree, which may push the oldest hot subtree into the cold tier.
+        '''
+        self.__successors.setdefault(source, list()).append(destination)
+
+        self.__parents[destination] = source
+
+        if source == self.__root:
+            self.__open_subtrees.append(destination)
+
+            if len(self.__open_subtrees) > self.__hot_subtrees: self.compact_(label = self.__open_subtrees.popleft())
+
+        return None
+
+    def load_stateful_vertex(self, label: TieredVertexLabel, *args: Any, **kwargs: Any) -> VertexData:
+        '''
+        Loads the `VertexData` associated with this `label` from the hot tier, or else from its cold block.
+        '''
+        try: return self.__vertices[label]
+
+        except KeyError: pass
+
+        block: Optional[_DecodedBlock] = self.__find_block(label = label)
+
+        if block is not None: return block.vertices[label]
+
+        if label in self.__successors or label in self.__parents: return None  # type: ignore endpoint-only vertex
+
+        raise KeyError(label)
+
+    def load_successors(self, label: TieredVertexLabel, *args: Any, **kwargs: Any) -> List[TieredVertexLabel]:
+        '''
+        Loads the labels of successors of this `label` from whichever tier holds it.
+        '''
+        successors: Optional[List[TieredVertexLabel]] = self.__successors.get(label)
+
+        if successors is not None: return successors
+
+        block: Optional[_DecodedBlock] = self.__find_block(label = label)
+
+        if block is not None: return block.successors.get(label, list())
+
+        if label in self.__vertices or label in self.__parents: return list()
+
+        raise KeyError(label)
+
+    def load_predecessors(self, label: TieredVertexLabel, *args: Any, **kwargs: Any) -> List[TieredVertexLabel]:
+        '''
+        Loads the label of the parent of this `label` from whichever tier holds it.
+        '''
+        parent: Optional[TieredVertexLabel] = self.__parents.get(label)
+
+        if parent is None:
+            block: Optional[_DecodedBlock] = self.__find_block(label = label)
+
+            if block is not None: parent = block.parents.get(label)
+
+            elif label not in self.__vertices and label not in self.__successors: raise KeyError(label)
+
+        return list() if parent is None else [parent]
+
+    '''
+    Tiering logic.
+    '''
+
+    def compact_(self, label: TieredVertexLabel, *args: Any, **kwargs: Any) -> None:
+        '''
+        Moves the root subtree under this `label` out of the hot tier into a compressed block.
+
+        Labels and parent offsets are delta-encoded, which shrinks to almost nothing for the contiguous labels that the
+        maker allocates.
+        '''
+        labels: List[TieredVertexLabel] = list()
+
+        stack: List[TieredVertexLabel] = [label]
+
+        while stack:
+            vertex: TieredVertexLabel = stack.pop()
+
+            labels.append(vertex)
+
+            stack.extend(self.__successors.get(vertex, ()))
+
+        labels.sort()
+
+        if self.__blocks and labels[0] <= self.__block_stops[-1]: raise ValueError('%s can only compact root subtrees in label order.' % TieredGraphDB.__name__)
+
+        mementos: List[Any] = list()
+
+        memento_indices: Dict[Any, int] = dict()
+
+        label_deltas: 'array[int]' = array('q')
+
+        parent_offsets: 'array[int]' = array('q')
+
+        memento_ids: 'array[int]' = array('q')
+
+        previous: TieredVertexLabel = 0
+
+        for vertex in labels:
+            data: Any = self.__vertices.get(vertex)
+
+            key: Any = memento_key(data)
+
+            index: Optional[int] = memento_indices.get(key)
+
+            if index is None:
+                index = memento_indices[key] = len(mementos)
+
+                mementos.append(data)
+
+            label_deltas.append(vertex - previous)
+
+            parent_offsets.append(vertex - self.__parents[vertex])
+
+            memento_ids.append(index)
+
+            previous = vertex
+
+        payload: bytes = dumps((label_deltas.tobytes(), parent_offsets.tobytes(), memento_ids.tobytes(), mementos), protocol = HIGHEST_PROTOCOL)
+
+        # the block is published before the hot entries are dropped, and its start last because readers bisect on starts.
+
+        self.__blocks.append(_CODECS[self.__codec][0](payload))
+
+        self.__block_stops.append(labels[-1])
+
+        self.__block_starts.append(labels[0])
+
+        for vertex in labels:
+            self.__vertices.pop(vertex, None)
+
+            self.__parents.pop(vertex, None)
+
+            self.__successors.pop(vertex, None)
+
+        return None
+
+    def compact_all_(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Compacts every root subtree, such as when archiving a finished episode.
+        '''
+        while self.__open_subtrees: self.compact_(label = self.__open_subtrees.popleft())
+
+        return None
+
+    def __find_block(self, label: TieredVertexLabel) -> Optional[_DecodedBlock]:
+        '''
+        Finds the cold block that holds this `label`, decompressing it into the cache if needed.
+        '''
+        index: int = bisect_right(self.__block_starts, label) - 1
+
+        if index < 0 or label > self.__block_stops[index]: return None
+
+        with self.__cache_lock:
+            block: Optional[_DecodedBlock] = self.__cache.get(index)
+
+            if block is not None:
+                self.__cache.move_to_end(index)
+
+                return block
+
+        # blocks are decoded outside the lock, so two readers may both decode the same block and the later one wins.
+
+        block = self.__decode(index = index)
+
+        if label not in block.vertices: return None
+
+        with self.__cache_lock:
+            self.__cache[index] = block
+
+            if len(self.__cache) > self.__cached_blocks: self.__cache.popitem(last = False)
+
+        return block
+
+    def __decode(self, index: int) -> _DecodedBlock:
+        '''
+        Decompresses and indexes the block at this `index`.
+        '''
+        label_bytes, parent_bytes, memento_bytes, mementos = loads(_CODECS[self.__codec][1](self.__blocks[index]))
+
+        label_deltas: 'array[int]' = array('q'); label_deltas.frombytes(label_bytes)
+
+        parent_offsets: 'array[int]' = array('q'); parent_offsets.frombytes(parent_bytes)
+
+        memento_ids: 'array[int]' = array('q'); memento_ids.frombytes(memento_bytes)
+
+        block: _DecodedBlock = _DecodedBlock(vertices = dict(), successors = dict(), parents = dict())
+
+        vertex: TieredVertexLabel = 0
+
+        for delta, offset, memento in zip(label_deltas, parent_offsets, memento_ids):
+            vertex += delta
+
+            parent: TieredVertexLabel = vertex - offset
+
+            block.vertices[vertex] = mementos[memento]
+
+            block.parents[vertex] = parent
+
+            block.successors.setdefault(parent, list()).append(vertex)
+
+        return block
+
@@ -0,0 +1,126 @@
+'''
+Traversal* Collection for the database module.
+
+Generator-based walks over any backend that can load successors, predecessors and vertex data.
+
+Walks keep no visited set so that memory stays bounded by the walk's frontier; they assume tree-shaped traces.
+'''
+
+# built-in imports
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+# library imports
+from ._interface import StatefulVertexGraphLoaderInterface, StatefulVertexGraphTraversalInterface
+from ._types import VertexData, VertexLabel
+
+
+'''
+Types.
+'''
+
+ChunkedItem = TypeVar('ChunkedItem')
+
+_EXHAUSTED: Any = object()
+
+
+'''
+Helper functions.
+'''
+
+def chunk_vertices(vertices: Iterable[ChunkedItem], chunk_size: int) -> Iterator[List[ChunkedItem]]:
+    '''
+    Lazily groups these `vertices` into lists of at most `chunk_size` items.
+    '''
+    iterator: Iterator[ChunkedItem] = iter(vertices)
+
+    while True:
+        chunk: List[ChunkedItem] = list(islice(iterator, chunk_size))
+
+        if not chunk: return
+
+        yield chunk
+
+
+'''
+ABC extensions.
+'''
+
+class SimpleGraphTraversal\
+(
+    Generic[VertexLabel, VertexData],
+    StatefulVertexGraphTraversalInterface[VertexLabel, VertexData],
+    StatefulVertexGraphLoaderInterface[VertexLabel, VertexData]
+):
+    '''
+    Class that can walk a graph-like structure lazily given its `.load_successors(..)`, `.load_predecessors(..)` and
+    `.load_stateful_vertex(..)` methods.
+    '''
+
+    def load_successor_range(self, label: VertexLabel, start: int, stop: Optional[int] = None, *args: Any, **kwargs: Any) -> List[VertexLabel]:
+        '''
+        Loads the successors of the vertex with this `label` from position `start` up to position `stop`.
+
+        This skips the first `start` successors one by one, so backends that can seek should override it.
+        '''
+        return list(islice(self.load_successors(label = label), start, stop))
+
+    def iterate_children(self, label: VertexLabel, *args: Any, **kwargs: Any) -> Iterator[Tuple[VertexLabel, VertexData]]:
+        '''
+        Yields a `(label, data)` pair for each successor of the vertex with this `label`.
+        '''
+        for child in self.load_successors(label = label):
+            yield child, self.load_stateful_vertex(label = child)
+
+    def iterate_ancestors(self, label: VertexLabel, *args: Any, **kwargs: Any) -> Iterator[Tuple[VertexLabel, VertexData]]:
+        '''
+        Yields a `(label, data)` pair for each ancestor of the vertex with this `label`, nearest first.
+        '''
+        frontier: Deque[VertexLabel] = deque(self.load_predecessors(label = label))
+
+        while frontier:
+            ancestor: VertexLabel = frontier.popleft()
+
+            yield ancestor, self.load_stateful_vertex(label = ancestor)
+
+            frontier.extend(self.load_predecessors(label = ancestor))
+
+    def iterate_depth_first(self, label: VertexLabel, depth: Optional[int] = None, *args: Any, **kwargs: Any) -> Iterator[Tuple[VertexLabel, VertexData]]:
+        '''
+        Yields a `(label, data)` pair for each descendant of the vertex with this `label` in depth-first pre-order, at most `depth` edges away.
+
+        Only the successors of one vertex per level are held, so memory grows with the depth and fan-out of the walk rather
+        than with the graph.
+        '''
+        if depth is not None and depth < 1: return
+
+        stack: List[Iterator[VertexLabel]] = [iter(self.load_successors(label = label))]
+
+        while stack:
+            child: VertexLabel = next(stack[-1], _EXHAUSTED)
+
+            if child is _EXHAUSTED:
+                stack.pop()
+
+                continue
+
+            yield child, self.load_stateful_vertex(label = child)
+
+            if depth is None or len(stack) < depth: stack.append(iter(self.load_successors(label = child)))
+
+    def iterate_breadth_first(self, label: VertexLabel, depth: Optional[int] = None, *args: Any, **kwargs: Any) -> Iterator[Tuple[VertexLabel, VertexData]]:
+        '''
+        Yields a `(label, data)` pair for each descendant of the vertex with this `label` in breadth-first order, at most `depth` edges away.
+        '''
+        frontier: Deque[Tuple[VertexLabel, int]] = deque([(label, 0)])
+
+        while frontier:
+            parent, level = frontier.popleft()
+
+            if depth is not None and level >= depth: continue
+
+            for child in self.load_successors(label = parent):
+                yield child, self.load_stateful_vertex(label = child)
+
+                frontier.append((child, level + 1))
@@ -0,0 +1,25 @@
+'''
+ABC types for the diff module.
+'''
+
+# built-in imports
+from abc import abstractmethod, ABC
+from typing import Any, Generic
+
+# library imports
+from ._types import NodeKey, NodeMemento, TraceDelta
+
+from ..database import StatefulVertexGraphTraversalInterface
+
+
+class TraceDifferInterface(Generic[NodeKey, NodeMemento, TraceDelta], ABC):
+    '''
+    ABC for objects that can compare two traces and describe how they differ as a `TraceDelta`.
+    '''
+
+    @abstractmethod
+    def diff(self, left: StatefulVertexGraphTraversalInterface[NodeKey, NodeMemento], right: StatefulVertexGraphTraversalInterface[NodeKey, NodeMemento], *args: Any, **kwargs: Any) -> TraceDelta:
+        '''
+        Compares the `left` trace against the `right` trace.
+        '''
+        raise NotImplementedError('%s requires a .diff(..) abstract method.' % TraceDifferInterface.__name__)
@@ -0,0 +1,284 @@
+'''
+Simple* Collection for the diff module.
+'''
+
+# built-in imports
+from bisect import bisect_left
+from hashlib import blake2b
+from typing import Any, Callable, Dict, Generic, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+# library imports
+from ._interface import TraceDifferInterface
+from ._types import NodeKey, NodeMemento
+
+from ..database import StatefulVertexGraphTraversalInterface
+
+
+'''
+Types.
+'''
+
+class SimpleTraceDelta(NamedTuple):
+    '''
+    Subtrees that differ between a left and a right trace.
+
+    `inserted` holds right-hand labels with no left-hand counterpart, `removed` holds left-hand labels with no right-hand
+    counterpart and `changed` holds aligned `(left, right)` pairs whose own mementos differ. `skipped` counts the aligned
+    subtrees that were identical and never walked.
+    '''
+
+    inserted: List[Any]
+    removed: List[Any]
+    changed: List[Tuple[Any, Any]]
+    skipped: int
+
+
+'''
+Concrete classes and ABC extensions.
+'''
+
+class SimpleTraceDiffer\
+(
+    Generic[NodeKey, NodeMemento],
+    TraceDifferInterface[NodeKey, NodeMemento, SimpleTraceDelta]
+):
+    '''
+    Class that can align two trace trees by per-subtree structural digests.
+
+    Identical subtrees digest equally and are skipped in O(1) each, so aligning two traces only walks the parts that
+    differ. Digests are 128-bit BLAKE2b digests over the ordered digests of a vertex's children and an id for its memento
+    key, where ids are handed out by equality and type within a diff, so unequal mementos never share an id.
+    Children are aligned in call order by `align_hashes(..)`, which matches identical subtrees first and pairs the rest
+    by position. Both traces must also be `StatefulVertexGraphLoaderInterface` types.
+    '''
+
+    __memento_key: Callable[[NodeMemento], Hashable]
+
+    '''
+    Dunder and property methods.
+    '''
+
+    def __init__(self, memento_key: Optional[Callable[[NodeMemento], Hashable]] = None, *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up a differ that compares mementos by this `memento_key`, or by the mementos themselves.
+        '''
+        self.__memento_key = memento_key if memento_key is not None else _identity
+
+        return None
+
+    '''
+    ABC extensions.
+    '''
+
+    def diff(self, left: StatefulVertexGraphTraversalInterface[NodeKey, NodeMemento], right: StatefulVertexGraphTraversalInterface[NodeKey, NodeMemento], left_root: Any = 0, right_root: Any = 0, *args: Any, **kwargs: Any) -> SimpleTraceDelta:
+        '''
+        Aligns the subtree of `left` under `left_root` against the subtree of `right` under `right_root`.
+        '''
+        ids: Dict[Hashable, int] = dict()
+
+        left_hashes: Dict[NodeKey, bytes] = self.hash_subtrees(graph = left, root = left_root, ids = ids)
+
+        right_hashes: Dict[NodeKey, bytes] = self.hash_subtrees(graph = right, root = right_root, ids = ids)
+
+        delta: SimpleTraceDelta = SimpleTraceDelta(inserted = list(), removed = list(), changed = list(), skipped = 0)
+
+        skipped: int = 0
+
+        pairs: List[Tuple[NodeKey, NodeKey]] = [(left_root, right_root)]
+
+        while pairs:
+            left_label, right_label = pairs.pop()
+
+            if left_hashes[left_label] == right_hashes[right_label]:
+                skipped += 1
+
+                continue
+
+            if self.__memento_key(left.load_stateful_vertex(label = left_label)) != self.__memento_key(right.load_stateful_vertex(label = right_label)):  # type: ignore loader interface
+                delta.changed.append((left_label, right_label))
+
+            left_children: List[NodeKey] = list(left.load_successors(label = left_label))
+
+            right_children: List[NodeKey] = list(right.load_successors(label = right_label))
+
+            left_sequence: List[bytes] = [ left_hashes[child] for child in left_children ]
+
+            right_sequence: List[bytes] = [ right_hashes[child] for child in right_children ]
+
+            aligned, removed, inserted = align_hashes(left = left_sequence, right = right_sequence)
+
+            differing: List[Tuple[NodeKey, NodeKey]] = list()
+
+            for left_index, right_index in aligned:
+                if left_sequence[left_index] == right_sequence[right_index]: skipped += 1
+
+                else: differing.append((left_children[left_index], right_children[right_index]))
+
+            # pairs are pushed in reverse so that changes are reported in call order.
+
+            pairs.extend(reversed(differing))
+
+            delta.removed.extend([ left_children[index] for index in removed ])
+
+            delta.inserted.extend([ right_children[index] for index in inserted ])
+
+        return delta._replace(skipped = skipped)
+
+    '''
+    Diff logic.
+    '''
+
+    def hash_subtrees(self, graph: StatefulVertexGraphTraversalInterface[NodeKey, NodeMemento], root: Any = 0, ids: Optional[Dict[Hashable, int]] = None, *args: Any, **kwargs: Any) -> Dict[NodeKey, bytes]:
+        '''
+        Digests every subtree under `root` from its memento and the ordered digests of its children, without recursion.
+
+        Memento keys are numbered in `ids`, which must be shared by every graph whose digests are compared.
+        '''
+        ids = ids if ids is not None else dict()
+
+        hashes: Dict[NodeKey, bytes] = dict()
+
+        stack: List[Tuple[NodeKey, Optional[List[NodeKey]]]] = [(root, None)]
+
+        while stack:
+            label, children = stack[-1]
+
+            if children is None:
+                children = list(graph.load_successors(label = label))
+
+                stack[-1] = (label, children)
+
+                stack.extend([ (child, None) for child in reversed(children) ])
+
+                continue
+
+            stack.pop()
+
+            memento: NodeMemento = graph.load_stateful_vertex(label = label)  # type: ignore loader interface
+
+            key: Hashable = self.__memento_key(memento)
+
+            digest: Any = blake2b(ids.setdefault((type(key), key), len(ids)).to_bytes(8, 'little'), digest_size = 16)
+
+            for child in children: digest.update(hashes[child])
+
+            hashes[label] = digest.digest()
+
+        return hashes
+
+
+'''
+Helper functions.
+'''
+
+def align_hashes(left: Sequence[Hashable], right: Sequence[Hashable]) -> Tuple[List[Tuple[int, int]], List[int], List[int]]:
+    '''
+    Aligns two sequences of subtree hashes, returning the aligned `(left, right)` index pairs in order, and the left and
+    right indices that were removed and inserted.
+
+    Common prefixes and suffixes are matched first. Then hashes that occur exactly once on each side are used as anchors,
+    keeping the longest run of them that is in order on both sides, and the gaps between anchors are aligned the same way.
+    A gap without anchors is paired by position, so a long run of identical steps with a few changes aligns in linear time
+    and reports only the changed pairs.
+    '''
+    aligned: List[Tuple[int, int]] = list()
+
+    removed: List[int] = list()
+
+    inserted: List[int] = list()
+
+    segments: List[Tuple[int, int, int, int]] = [(0, len(left), 0, len(right))]
+
+    while segments:
+        left_start, left_stop, right_start, right_stop = segments.pop()
+
+        while left_start < left_stop and right_start < right_stop and left[left_start] == right[right_start]:
+            aligned.append((left_start, right_start))
+
+            left_start += 1; right_start += 1
+
+        while left_start < left_stop and right_start < right_stop and left[left_stop - 1] == right[right_stop - 1]:
+            left_stop -= 1; right_stop -= 1
+
+            aligned.append((left_stop, right_stop))
+
+        anchors: List[Tuple[int, int]] = _unique_anchors(left = left, right = right, left_start = left_start, left_stop = left_stop, right_start = right_start, right_stop = right_stop)
+
+        if not anchors:
+            paired: int = min(left_stop - left_start, right_stop - right_start)
+
+            aligned.extend(zip(range(left_start, left_start + paired), range(right_start, right_start + paired)))
+
+            removed.extend(range(left_start + paired, left_stop))
+
+            inserted.extend(range(right_start + paired, right_stop))
+
+            continue
+
+        for left_index, right_index in anchors:
+            segments.append((left_start, left_index, right_start, right_index))
+
+            aligned.append((left_index, right_index))
+
+            left_start, right_start = left_index + 1, right_index + 1
+
+        segments.append((left_start, left_stop, right_start, right_stop))
+
+    aligned.sort(); removed.sort(); inserted.sort()
+
+    return aligned, removed, inserted
+
+
+def _unique_anchors(left: Sequence[Hashable], right: Sequence[Hashable], left_start: int, left_stop: int, right_start: int, right_stop: int) -> List[Tuple[int, int]]:
+    '''
+    Finds the longest in-order run of `(left, right)` index pairs whose hash occurs exactly once in each segment.
+    '''
+    left_positions: Dict[Hashable, int] = dict()
+
+    for index in range(left_start, left_stop): left_positions[left[index]] = -1 if left[index] in left_positions else index
+
+    right_positions: Dict[Hashable, int] = dict()
+
+    for index in range(right_start, right_stop):
+        if right[index] in left_positions: right_positions[right[index]] = -1 if right[index] in right_positions else index
+
+    candidates: List[Tuple[int, int]] = sorted((left_positions[value], index) for value, index in right_positions.items() if index >= 0 and left_positions[value] >= 0)
+
+    # patience sorting on the right indices finds the longest increasing run in O(k log k).
+
+    tails: List[int] = list()
+
+    tail_indices: List[int] = list()
+
+    previous: List[int] = list()
+
+    for position, (_, right_index) in enumerate(candidates):
+        pile: int = bisect_left(tails, right_index)
+
+        if pile == len(tails):
+            tails.append(right_index); tail_indices.append(position)
+
+        else:
+            tails[pile] = right_index; tail_indices[pile] = position
+
+        previous.append(tail_indices[pile - 1] if pile else -1)
+
+    anchors: List[Tuple[int, int]] = list()
+
+    position = tail_indices[-1] if tail_indices else -1
+
+    while position >= 0:
+        anchors.append(candidates[position])
+
+        position = previous[position]
+
+    anchors.reverse()
+
+    return anchors
+
+
+def _identity(memento: Any) -> Any:
+    '''
+    Returns this `memento` unchanged.
+    '''
+    return memento
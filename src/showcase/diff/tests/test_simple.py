@@ -0,0 +1,116 @@
+'''
+Tests the Simple* implementation of the diff module.
+'''
+
+# built-in imports
+from typing import List
+
+# library imports
+from ..simple import SimpleTraceDiffer, SimpleTraceDelta
+
+from ...database.simple import SimpleGraphDB
+from ...maker.simple import SimpleMakerFacade
+
+
+'''
+Mock-ups for testing.
+'''
+
+def mock_trace(calls: List[List[type]]) -> SimpleGraphDB[int, type]:
+    '''
+    Makes a trace where each item of `calls` is a top-level call followed by its nested calls.
+    '''
+    graph_db: SimpleGraphDB[int, type] = SimpleGraphDB()
+
+    facade: SimpleMakerFacade[type] = SimpleMakerFacade(graph = graph_db)
+
+    for outer, *inner in calls:
+        facade.trace_(data = outer)
+
+        for memento in inner:
+            facade.trace_(data = memento)
+
+            facade.untrace_()
+
+        facade.untrace_()
+
+    return graph_db
+
+
+'''
+Unit tests for diffing traces.
+'''
+
+def test_simple_trace_differ() -> None:
+    '''
+    Tests that a `SimpleTraceDiffer` reports inserted, removed and changed subtrees and skips identical ones.
+    '''
+    left: SimpleGraphDB[int, type] = mock_trace(calls = [[list, int, str], [dict]])
+
+    right: SimpleGraphDB[int, type] = mock_trace(calls = [[list, int, str], [set], [tuple]])
+
+    differ: SimpleTraceDiffer[int, type] = SimpleTraceDiffer()
+
+    # test that identical traces are skipped at the root
+
+    assert differ.diff(left = left, right = left) == SimpleTraceDelta(inserted = [ ], removed = [ ], changed = [ ], skipped = 1), 'expected <%s>.diff(..) to skip identical traces in one step.' % SimpleTraceDiffer.__name__
+
+    # test that differing traces report each kind of change
+
+    delta: SimpleTraceDelta = differ.diff(left = left, right = right)
+
+    assert delta.changed == [(4, 4)], 'expected <%s>.diff(..) to report an aligned pair with different mementos.' % SimpleTraceDiffer.__name__
+
+    assert delta.inserted == [5] and delta.removed == [ ], 'expected <%s>.diff(..) to report an inserted subtree.' % SimpleTraceDiffer.__name__
+
+    assert delta.skipped == 1, 'expected <%s>.diff(..) to skip the identical first subtree.' % SimpleTraceDiffer.__name__
+
+    assert differ.diff(left = right, right = left).removed == [5], 'expected <%s>.diff(..) to report a removed subtree.' % SimpleTraceDiffer.__name__
+
+    # test that mementos whose built-in hashes collide still differ
+
+    collided: SimpleTraceDelta = SimpleTraceDiffer(memento_key = lambda memento: -1 if memento is int else -2).diff(left = mock_trace(calls = [[int]]), right = mock_trace(calls = [[str]]))
+
+    assert collided.changed == [(1, 1)] and collided.skipped == 0, 'expected <%s>.diff(..) not to skip subtrees whose built-in hashes collide.' % SimpleTraceDiffer.__name__
+
+    # all tests passed
+
+    return None
+
+
+def test_simple_trace_differ_aligns_shifted_subtrees() -> None:
+    '''
+    Tests that a `SimpleTraceDiffer` matches identical subtrees even when a new call shifts them along.
+    '''
+    left: SimpleGraphDB[int, type] = mock_trace(calls = [[list, int], [dict, str]])
+
+    right: SimpleGraphDB[int, type] = mock_trace(calls = [[set], [list, int], [dict, str]])
+
+    delta: SimpleTraceDelta = SimpleTraceDiffer().diff(left = left, right = right)
+
+    assert delta == SimpleTraceDelta(inserted = [1], removed = [ ], changed = [ ], skipped = 2), 'expected <%s>.diff(..) to only report the new leading call.' % SimpleTraceDiffer.__name__
+
+    # all tests passed
+
+    return None
+
+
+def test_simple_trace_differ_aligns_wide_roots() -> None:
+    '''
+    Tests that a `SimpleTraceDiffer` only reports the changed steps of a wide root of otherwise identical steps.
+    '''
+    left_calls: List[List[type]] = [ [list, int] for _ in range(300) ]
+
+    right_calls: List[List[type]] = [ [list, int] for _ in range(300) ]
+
+    left_calls[50] = [dict, int]; right_calls[200] = [set, int]
+
+    delta: SimpleTraceDelta = SimpleTraceDiffer().diff(left = mock_trace(calls = left_calls), right = mock_trace(calls = right_calls))
+
+    assert delta.changed == [(101, 101), (401, 401)] and delta.inserted == delta.removed == [ ], 'expected <%s>.diff(..) to pair scattered single-step changes.' % SimpleTraceDiffer.__name__
+
+    assert delta.skipped == 298 + 2, 'expected <%s>.diff(..) to skip every identical step and the children of changed steps.' % SimpleTraceDiffer.__name__
+
+    # all tests passed
+
+    return None
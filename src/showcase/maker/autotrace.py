@@ -0,0 +1,194 @@
+'''
+AutoTrace* Collection.
+
+Drives a `SimpleMakerFacade` from forward hooks on a `torch.nn.Module` tree.
+'''
+
+# built-in imports
+from time import perf_counter
+from typing import Any, Callable, List, Optional, Tuple
+
+# library imports
+from .simple import SimpleMakerFacade, SimpleGraphMemento
+
+# external imports
+from torch import no_grad
+from torch.nn import Module
+from torch.utils.hooks import RemovableHandle
+
+
+'''
+Global switch.
+'''
+
+_TRACING_ENABLED: bool = True
+
+
+def enable_tracing() -> None:
+    '''
+    Turns tracing on for every `SimpleModuleTracer`.
+    '''
+    global _TRACING_ENABLED
+
+    _TRACING_ENABLED = True
+
+    return None
+
+
+def disable_tracing() -> None:
+    '''
+    Turns tracing off for every `SimpleModuleTracer`, leaving each hook with a single branch.
+
+    Only toggle between forward passes, otherwise a pre-hook and its post-hook disagree about the frontier.
+    '''
+    global _TRACING_ENABLED
+
+    _TRACING_ENABLED = False
+
+    return None
+
+
+'''
+Overhead budget.
+'''
+
+DEFAULT_OVERHEAD_BUDGET: float = 0.5
+
+
+'''
+Concrete classes.
+'''
+
+class SimpleModuleTracer:
+    '''
+    Class that can trace every module call in a `torch.nn.Module` tree into a `SimpleMakerFacade`.
+
+    Hooks are resolved once per module when attached: each pre-hook closes over its module's type and the strategy's
+    bound `.extend_fast_(..)` method, and each post-hook over the bound `.retreat_fast_(..)` method, so a call never walks
+    the facade, strategy and context chain. Post-hooks also run when a forward pass raises, which keeps the frontier intact.
+    '''
+
+    __facade: SimpleMakerFacade[SimpleGraphMemento]
+    __module: Module
+    __handles: List[RemovableHandle]
+
+    '''
+    Dunder and property methods.
+    '''
+
+    def __init__(self, facade: SimpleMakerFacade[SimpleGraphMemento], module: Module, *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up a tracer for every module in the tree under this `module`.
+        '''
+        self.__facade = facade
+
+        self.__module = module
+
+        self.__handles = list()
+
+        return None
+
+    def __enter__(self) -> 'SimpleModuleTracer': return self.attach_()
+
+    def __exit__(self, *args: Any) -> None: self.detach_()
+
+    @property
+    def facade(self) -> SimpleMakerFacade[SimpleGraphMemento]: return self.__facade
+
+    @property
+    def module(self) -> Module: return self.__module
+
+    '''
+    Tracer logic.
+    '''
+
+    def attach_(self, *args: Any, **kwargs: Any) -> 'SimpleModuleTracer':
+        '''
+        Installs a forward pre-hook and post-hook on every module in the tree.
+        '''
+        if self.__handles: return self
+
+        extend: Callable[..., None] = self.__facade._strategy.extend_fast_  # type: ignore private usage
+
+        retreat: Callable[..., None] = self.__facade._strategy.retreat_fast_  # type: ignore private usage
+
+        post_hook: Callable[..., None] = _make_post_hook(retreat = retreat)
+
+        for module in self.__module.modules():
+            self.__handles.append(module.register_forward_pre_hook(_make_pre_hook(extend = extend, memento = type(module))))
+
+            self.__handles.append(module.register_forward_hook(post_hook, always_call = True))
+
+        return self
+
+    def detach_(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Removes every hook that this tracer installed.
+        '''
+        for handle in self.__handles: handle.remove()
+
+        self.__handles = list()
+
+        return None
+
+
+'''
+Helper functions.
+'''
+
+def _make_pre_hook(extend: Callable[..., None], memento: SimpleGraphMemento) -> Callable[..., None]:
+    '''
+    Makes a forward pre-hook that extends the trace to this `memento`.
+    '''
+    def pre_hook(module: Module, inputs: Any) -> None:
+        if _TRACING_ENABLED: extend(memento)
+
+    return pre_hook
+
+
+def _make_post_hook(retreat: Callable[..., None]) -> Callable[..., None]:
+    '''
+    Makes a forward post-hook that retreats from the current frontier.
+    '''
+    def post_hook(module: Module, inputs: Any, outputs: Any) -> None:
+        if _TRACING_ENABLED: retreat()
+
+    return post_hook
+
+
+def measure_tracing_overhead(module: Module, inputs: Tuple[Any, ...], repeats: int = 100, max_overhead: Optional[float] = DEFAULT_OVERHEAD_BUDGET) -> float:
+    '''
+    Measures the fractional latency that tracing adds to a forward pass of this `module` on these `inputs`.
+
+    The `module` must already have a `SimpleModuleTracer` attached; the traced passes are written to its graph. Traced
+    and untraced passes alternate and the best of each is compared, so both see the same machine load; the untraced
+    passes still dispatch the hooks, which only take their single branch. Raises a `RuntimeError` if the overhead is over
+    the `max_overhead` budget, 50% of a forward pass unless another is given or `None` turns the check off.
+    '''
+    best: List[float] = [float('inf'), float('inf')]
+
+    previous: bool = _TRACING_ENABLED
+
+    try:
+        with no_grad():
+            for _ in range(repeats):
+                for enabled in (False, True):
+                    (enable_tracing if enabled else disable_tracing)()
+
+                    start: float = perf_counter()
+
+                    module(*inputs)
+
+                    best[enabled] = min(best[enabled], perf_counter() - start)
+
+    finally:
+        (enable_tracing if previous else disable_tracing)()
+
+    baseline, traced = best if repeats > 0 else (0.0, 0.0)
+
+    overhead: float = traced / baseline - 1.0 if baseline else 0.0
+
+    if max_overhead is not None and overhead > max_overhead:
+        raise RuntimeError('tracing added %.1f%% to a forward pass, over the %.1f%% budget.' % (100 * overhead, 100 * max_overhead))
+
+    return overhead
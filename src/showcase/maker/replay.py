@@ -0,0 +1,174 @@
+'''
+Replay* Collection.
+
+Records the steps a strategy takes with periodic checkpoints of its path, so that any step can be reconstructed quickly.
+'''
+
+# built-in imports
+from array import array
+from bisect import bisect_right
+from typing import Any, List, Tuple
+from typing_extensions import TypeAlias
+
+
+'''
+Types.
+'''
+
+ReplayKey: TypeAlias = int
+
+ReplayStack: TypeAlias = Tuple[ReplayKey, ...]
+
+_RETREAT: ReplayKey = -1
+
+
+'''
+Concrete classes.
+'''
+
+class SimpleTraceRecorder:
+    '''
+    Class that can record each extend and retreat of a `SimpleBufferedGraphColouringStrategy` as a compact event stream.
+
+    An extend is recorded as the new frontier's key and a retreat as `-1`. Every `interval` steps, the recorder also stores
+    a checkpoint of the whole path stack, ending with the frontier.
+    '''
+
+    __interval: int
+    __events: 'array[int]'
+    __stack: List[ReplayKey]
+    __checkpoint_steps: List[int]
+    __checkpoints: List['array[int]']
+
+    '''
+    Dunder and property methods.
+    '''
+
+    def __init__(self, interval: int = 1024, root: ReplayKey = 0, *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up an empty event stream at this `root` with a checkpoint every `interval` steps.
+        '''
+        self.__interval = interval
+
+        self.__events = array('q')
+
+        self.__stack = [root]
+
+        self.__checkpoint_steps = [0]
+
+        self.__checkpoints = [array('q', self.__stack)]
+
+        return None
+
+    def __len__(self) -> int: return len(self.__events)
+
+    @property
+    def interval(self) -> int: return self.__interval
+
+    @property
+    def events(self) -> 'array[int]': return self.__events
+
+    @property
+    def checkpoint_steps(self) -> List[int]: return self.__checkpoint_steps
+
+    @property
+    def checkpoints(self) -> List['array[int]']: return self.__checkpoints
+
+    '''
+    Recorder logic.
+    '''
+
+    def record_extend_(self, label: ReplayKey, *args: Any, **kwargs: Any) -> None:
+        '''
+        Records a step that extends the frontier to this `label`.
+        '''
+        self.__events.append(label)
+
+        self.__stack.append(label)
+
+        if not len(self.__events) % self.__interval: self.__checkpoint_()
+
+        return None
+
+    def record_retreat_(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Records a step that retreats the frontier to the previous key on the path.
+        '''
+        self.__events.append(_RETREAT)
+
+        self.__stack.pop()
+
+        if not len(self.__events) % self.__interval: self.__checkpoint_()
+
+        return None
+
+    def record_restore_(self, levels: int, *args: Any, **kwargs: Any) -> None:
+        '''
+        Records a step that retreats the frontier by this many `levels` at once, as that many retreats.
+        '''
+        self.__events.extend(array('q', (_RETREAT,)) * levels)
+
+        del self.__stack[len(self.__stack) - levels:]
+
+        if len(self.__events) // self.__interval > (len(self.__events) - levels) // self.__interval: self.__checkpoint_()
+
+        return None
+
+    def __checkpoint_(self) -> None:
+        '''
+        Stores the current path stack against the current step.
+        '''
+        self.__checkpoint_steps.append(len(self.__events))
+
+        self.__checkpoints.append(array('q', self.__stack))
+
+
+class SimpleTraceReplay:
+    '''
+    Class that can seek to any step of a `SimpleTraceRecorder` in O(log n + interval) time.
+    '''
+
+    __recorder: SimpleTraceRecorder
+
+    '''
+    Dunder and property methods.
+    '''
+
+    def __init__(self, recorder: SimpleTraceRecorder, *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up a replay over the events and checkpoints of this `recorder`.
+        '''
+        self.__recorder = recorder
+
+        return None
+
+    def __len__(self) -> int: return len(self.__recorder)
+
+    '''
+    Replay logic.
+    '''
+
+    def seek(self, step: int, *args: Any, **kwargs: Any) -> ReplayStack:
+        '''
+        Reconstructs the path stack, ending with the frontier, as it was after this many steps.
+
+        Finds the last checkpoint at or before `step` by bisection and replays at most `interval` events from there.
+        '''
+        if not 0 <= step <= len(self.__recorder): raise IndexError('%s can only seek to steps 0 to %d, but got %d.' % (SimpleTraceReplay.__name__, len(self.__recorder), step))
+
+        index: int = bisect_right(self.__recorder.checkpoint_steps, step) - 1
+
+        stack: List[ReplayKey] = self.__recorder.checkpoints[index].tolist()
+
+        for event in self.__recorder.events[self.__recorder.checkpoint_steps[index]:step]:
+            if event == _RETREAT: stack.pop()
+
+            else: stack.append(event)
+
+        return tuple(stack)
+
+    def frontier(self, step: int, *args: Any, **kwargs: Any) -> ReplayKey:
+        '''
+        Reconstructs the frontier as it was after this many steps.
+        '''
+        return self.seek(step = step)[-1]
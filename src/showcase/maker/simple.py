@@ -4,13 +4,15 @@ Simple* Collection.
 
 # built-in imports
 from abc import abstractmethod, ABC
-from typing import Any, Generic, List
+from contextlib import ContextDecorator
+from typing import Any, Generic, List, Optional
 from typing_extensions import TypeAlias
 
 # library imports
 from ._types import NodeKey, NodeMemento
+from .replay import SimpleTraceRecorder
 
-from ..database import PartiallyStatefulDirectedGraphInterface
+from ..database import EpochPublishingGraphInterface, PartiallyStatefulDirectedGraphInterface
 
 
 '''
@@ -23,6 +25,8 @@ SimpleConnectedGraphKeyCollection: TypeAlias = List[NodeKey]
 
 SimpleGraphMemento: TypeAlias = type
 
+_UNSET: Any = object()
+
 
 '''
 ABC definitions for this module.
@@ -66,6 +70,7 @@ class SimpleBufferedGraphColouringContext\
     '''
 
     __writer: PartiallyStatefulDirectedGraphInterface[NodeKey, NodeMemento]
+    __publisher: Optional[EpochPublishingGraphInterface]
     __path: SimpleConnectedGraphKeyCollection[NodeKey]
 
     '''
@@ -81,6 +86,8 @@ class SimpleBufferedGraphColouringContext\
 
         self.__writer = writer
 
+        self.__publisher = writer if isinstance(writer, EpochPublishingGraphInterface) else None
+
         return None
 
     @property
@@ -89,6 +96,12 @@ class SimpleBufferedGraphColouringContext\
     @property
     def writer(self) -> PartiallyStatefulDirectedGraphInterface[NodeKey, NodeMemento]: return self.__writer
 
+    @property
+    def publisher(self) -> Optional[EpochPublishingGraphInterface]: return self.__publisher
+
+    @property
+    def depth(self) -> int: return len(self.__path)
+
     '''
     ABC extensions.
     '''
@@ -125,6 +138,24 @@ class SimpleBufferedGraphColouringContext\
         '''
         return self.__path.pop()
 
+    def truncate_path_(self, depth: int, *args: Any, **kwargs: Any) -> NodeKey:
+        '''
+        Truncates a `SimpleVertexPath` type to this `depth` with one slice deletion, returning the label at `depth`.
+        '''
+        label: NodeKey = self.__path[depth]
+
+        del self.__path[depth:]
+
+        return label
+
+    def publish_(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Publishes the writes made so far as a new epoch if the writer is an `EpochPublishingGraphInterface` type.
+        '''
+        if self.__publisher is not None: self.__publisher.publish_epoch_()
+
+        return None
+
 
 class SimpleBufferedGraphColouringStrategy\
 (
@@ -139,14 +170,19 @@ class SimpleBufferedGraphColouringStrategy\
     __frontier: SimpleGraphKey
 
     __context: SimpleBufferedGraphColouringContext[SimpleGraphKey, NodeMemento]
+    __recorder: Optional[SimpleTraceRecorder]
+
+    __writer: PartiallyStatefulDirectedGraphInterface[SimpleGraphKey, NodeMemento]
+    __publisher: Optional[EpochPublishingGraphInterface]
+    __path: SimpleConnectedGraphKeyCollection[SimpleGraphKey]
 
     '''
     Dunder and property methods.
     '''
     
-    def __init__(self, context: SimpleBufferedGraphColouringContext[SimpleGraphKey, NodeMemento], *args: Any, **kwargs: Any) -> None:
+    def __init__(self, context: SimpleBufferedGraphColouringContext[SimpleGraphKey, NodeMemento], recorder: Optional[SimpleTraceRecorder] = None, *args: Any, **kwargs: Any) -> None:
         '''
-        Sets up a `SimpleBufferedGraphColouringStrategy` in this `context`.
+        Sets up a `SimpleBufferedGraphColouringStrategy` in this `context`, recording each step with this `recorder` if given.
         '''
         self.__nodes = 0
         
@@ -154,6 +190,14 @@ class SimpleBufferedGraphColouringStrategy\
 
         self.__context = context
 
+        self.__recorder = recorder
+
+        self.__writer = context.writer
+
+        self.__publisher = context.publisher
+
+        self.__path = context._path  # type: ignore private usage
+
         return None
 
     @property
@@ -165,6 +209,12 @@ class SimpleBufferedGraphColouringStrategy\
     @property
     def context(self) -> SimpleBufferedGraphColouringContext[SimpleGraphKey, NodeMemento]: return self.__context
 
+    @property
+    def recorder(self) -> Optional[SimpleTraceRecorder]: return self.__recorder
+
+    @property
+    def depth(self) -> int: return len(self.__path)
+
     '''
     ABC extensions.
     '''
@@ -185,16 +235,85 @@ class SimpleBufferedGraphColouringStrategy\
 
         self.__frontier = self.__nodes
 
+        if self.__recorder is not None: self.__recorder.record_extend_(label = self.__nodes)
+
         return None
 
     def retreat_(self, *args: Any, **kwargs: Any) -> None:
         '''
         Retreats the current frontier of the graph-like context to the previous vertex on the current path.
 
+        The end of a subtree is a consistent boundary, so the context publishes the writes made so far.
+
         See https://github.com/ZaliaFlow/decode-py/issues/2 for details.
         '''
         self.__frontier = self.__context.pop_from_path_()
 
+        self.__context.publish_()
+
+        if self.__recorder is not None: self.__recorder.record_retreat_()
+
+        return None
+
+    '''
+    Unwinding and fast-path logic.
+    '''
+
+    def restore_(self, depth: int, *args: Any, **kwargs: Any) -> None:
+        '''
+        Retreats the frontier to the vertex at this `depth` on the current path in a single step, as if by retreating once
+        for each level above it.
+
+        Raises a `ValueError` if the frontier is not at or below this `depth`.
+        '''
+        levels: int = len(self.__path) - depth
+
+        if levels < 0 or depth < 0: raise ValueError('%s cannot restore to depth %d from depth %d.' % (SimpleBufferedGraphColouringStrategy.__name__, depth, len(self.__path)))
+
+        if not levels: return None
+
+        self.__frontier = self.__context.truncate_path_(depth = depth)
+
+        self.__context.publish_()
+
+        if self.__recorder is not None: self.__recorder.record_restore_(levels = levels)
+
+        return None
+
+    def extend_fast_(self, data: NodeMemento) -> None:
+        '''
+        Extends the frontier like `.extend_(..)`, but writes straight to the context's writer and path with positional calls.
+
+        Overrides of the context's methods are bypassed.
+        '''
+        nodes: SimpleGraphKey = self.__nodes + 1
+
+        self.__nodes = nodes
+
+        self.__writer.write_stateful_vertex_(nodes, data)
+
+        self.__writer.write_stateless_directed_edge_(self.__frontier, nodes)
+
+        self.__path.append(self.__frontier)
+
+        self.__frontier = nodes
+
+        if self.__recorder is not None: self.__recorder.record_extend_(nodes)
+
+        return None
+
+    def retreat_fast_(self) -> None:
+        '''
+        Retreats the frontier like `.retreat_(..)`, but pops straight from the context's path.
+
+        Overrides of the context's methods are bypassed.
+        '''
+        self.__frontier = self.__path.pop()
+
+        if self.__publisher is not None: self.__publisher.publish_epoch_()
+
+        if self.__recorder is not None: self.__recorder.record_retreat_()
+
         return None
 
 
@@ -212,13 +331,13 @@ class SimpleMakerFacade\
     Dunder and property methods.
     '''
 
-    def __init__(self, graph: PartiallyStatefulDirectedGraphInterface[SimpleGraphKey, NodeMemento], *args: Any, **kwargs: Any) -> None:
+    def __init__(self, graph: PartiallyStatefulDirectedGraphInterface[SimpleGraphKey, NodeMemento], recorder: Optional[SimpleTraceRecorder] = None, *args: Any, **kwargs: Any) -> None:
         '''
-        Sets up a strategy and context for this instance.
+        Sets up a strategy and context for this instance, recording each step with this `recorder` if given.
         '''
         context: SimpleBufferedGraphColouringContext[SimpleGraphKey, NodeMemento] = SimpleBufferedGraphColouringContext(writer = graph)
 
-        self.__strategy = SimpleBufferedGraphColouringStrategy(context = context)
+        self.__strategy = SimpleBufferedGraphColouringStrategy(context = context, recorder = recorder)
 
         return None
 
@@ -231,6 +350,12 @@ class SimpleMakerFacade\
     @property
     def graph(self) -> PartiallyStatefulDirectedGraphInterface[SimpleGraphKey, NodeMemento]: return self.context.writer
 
+    @property
+    def recorder(self) -> Optional[SimpleTraceRecorder]: return self.__strategy.recorder
+
+    @property
+    def depth(self) -> int: return self.__strategy.depth
+
     '''
     Facade logic.
     '''
@@ -250,3 +375,65 @@ class SimpleMakerFacade\
         self.__strategy.retreat_()
 
         return None
+
+    def restore_(self, depth: int, *args: Any, **kwargs: Any) -> None:
+        '''
+        Stops every trace above this `depth` in one step.
+        '''
+        self.__strategy.restore_(depth = depth)
+
+        return None
+
+    def scope(self, data: NodeMemento = _UNSET, *args: Any, **kwargs: Any) -> 'SimpleTraceScope[NodeMemento]':
+        '''
+        Gets a `SimpleTraceScope` that traces this `data`, if given, and unwinds to the current depth of the trace on exit.
+        '''
+        return SimpleTraceScope(facade = self, data = data)
+
+
+class SimpleTraceScope\
+(
+    Generic[NodeMemento],
+    ContextDecorator
+):
+    '''
+    Class that can record the depth of a trace on entry and restore it on exit, even if an exception skipped an `.untrace_(..)`.
+
+    It can be used as a context manager or as a decorator, and re-entering it, for example through recursion, nests
+    correctly. If `data` is given, it is traced on entry. A body that untraces past the depth it was entered at is left
+    where it is on exit, so that restoring cannot mask an exception the body raised.
+    '''
+
+    __facade: SimpleMakerFacade[NodeMemento]
+    __data: NodeMemento
+    __depths: List[int]
+
+    '''
+    Dunder and property methods.
+    '''
+
+    def __init__(self, facade: SimpleMakerFacade[NodeMemento], data: NodeMemento = _UNSET, *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up a scope over the trace of this `facade` that traces this `data` if given.
+        '''
+        self.__facade = facade
+
+        self.__data = data
+
+        self.__depths = list()
+
+        return None
+
+    def __enter__(self) -> 'SimpleTraceScope[NodeMemento]':
+        self.__depths.append(self.__facade.depth)
+
+        if self.__data is not _UNSET: self.__facade.trace_(data = self.__data)
+
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        depth: int = self.__depths.pop()
+
+        if self.__facade.depth > depth: self.__facade.restore_(depth = depth)
+
+        return None
@@ -0,0 +1,126 @@
+'''
+Tests the AutoTrace* integration of a maker module.
+'''
+
+# built-in imports
+from typing import Any
+
+# library imports
+from ..autotrace import DEFAULT_OVERHEAD_BUDGET, SimpleModuleTracer, enable_tracing, disable_tracing, measure_tracing_overhead
+from ..simple import SimpleMakerFacade, SimpleGraphMemento
+
+from ...database.simple import SimpleGraphDB
+
+# external imports
+from torch import Tensor, zeros
+from torch.nn import Linear, Module, ReLU, Sequential
+
+
+'''
+Mock-ups for testing.
+'''
+
+class MockFailingModule(Module):
+    '''
+    Module that always raises during a forward pass.
+    '''
+
+    def forward(self, inputs: Tensor) -> Any: raise RuntimeError('forward pass failed.')
+
+
+'''
+Unit tests for module auto-tracing.
+'''
+
+def test_simple_module_tracer() -> None:
+    '''
+    Tests that a `SimpleModuleTracer` traces each module call as a nested vertex.
+    '''
+    graph: SimpleGraphDB[int, SimpleGraphMemento] = SimpleGraphDB()
+
+    facade: SimpleMakerFacade[SimpleGraphMemento] = SimpleMakerFacade(graph = graph)
+
+    network: Sequential = Sequential(Linear(4, 4), ReLU(), Linear(4, 2))
+
+    with SimpleModuleTracer(facade = facade, module = network):
+        network(zeros(1, 4))
+
+        # test that the forward pass grew the expected tree
+
+        assert set(graph._graph.edges) == { (0, 1), (1, 2), (1, 3), (1, 4) }, 'expected <%s> to nest each layer under its container.' % SimpleModuleTracer.__name__ # type: ignore private usage
+
+        assert [ graph.load_stateful_vertex(label = label) for label in range(1, 5) ] == [Sequential, Linear, ReLU, Linear], 'expected <%s> to store the type of each module.' % SimpleModuleTracer.__name__
+
+        assert facade._strategy._frontier == 0, 'expected <%s> to retreat to the root after a forward pass.' % SimpleModuleTracer.__name__ # type: ignore private usage
+
+        # test that tracing can be disabled globally
+
+        disable_tracing()
+
+        network(zeros(1, 4))
+
+        enable_tracing()
+
+        assert graph._graph.number_of_nodes() == 5, 'expected %s(..) to stop every tracer.' % disable_tracing.__name__ # type: ignore private usage
+
+        # test that the overhead can be measured
+
+        assert isinstance(measure_tracing_overhead(module = network, inputs = (zeros(1, 4),), repeats = 2, max_overhead = None), float), 'expected %s(..) to measure a fraction.' % measure_tracing_overhead.__name__
+
+        try:
+            measure_tracing_overhead(module = network, inputs = (zeros(1, 4),), repeats = 2, max_overhead = -1.0)
+
+            raise AssertionError('expected %s(..) to raise an error over budget.' % measure_tracing_overhead.__name__) # pragma: no cover
+
+        except RuntimeError: pass # check passed
+
+    # test that detaching removes every hook
+
+    nodes: int = graph._graph.number_of_nodes() # type: ignore private usage
+
+    network(zeros(1, 4))
+
+    assert graph._graph.number_of_nodes() == nodes, 'expected <%s>.detach(..) to remove every hook.' % SimpleModuleTracer.__name__ # type: ignore private usage
+
+    # all tests passed
+
+    return None
+
+
+def test_simple_module_tracer_overhead() -> None:
+    '''
+    Tests that a `SimpleModuleTracer` stays within the default overhead budget on an 8-layer MLP.
+    '''
+    network: Sequential = Sequential(*[ layer for _ in range(8) for layer in (Linear(64, 64), ReLU()) ])
+
+    with SimpleModuleTracer(facade = SimpleMakerFacade(graph = SimpleGraphDB()), module = network):
+        overhead: float = measure_tracing_overhead(module = network, inputs = (zeros(1, 64),), repeats = 500)
+
+    assert 0.0 < overhead <= DEFAULT_OVERHEAD_BUDGET <= 0.5, 'expected %s(..) to measure an overhead within a 50%% budget, but got %.1f%%.' % (measure_tracing_overhead.__name__, 100 * overhead)
+
+    # all tests passed
+
+    return None
+
+
+def test_simple_module_tracer_on_failure() -> None:
+    '''
+    Tests that a `SimpleModuleTracer` keeps the frontier intact when a forward pass raises.
+    '''
+    facade: SimpleMakerFacade[SimpleGraphMemento] = SimpleMakerFacade(graph = SimpleGraphDB())
+
+    network: Sequential = Sequential(Linear(4, 4), MockFailingModule())
+
+    with SimpleModuleTracer(facade = facade, module = network):
+        try:
+            network(zeros(1, 4))
+
+            raise AssertionError('expected the forward pass to raise an error.') # pragma: no cover
+
+        except RuntimeError: pass
+
+    assert facade._strategy._frontier == 0 and facade.context._path == [ ], 'expected <%s> to retreat from modules that raised.' % SimpleModuleTracer.__name__ # type: ignore private usage
+
+    # all tests passed
+
+    return None
@@ -0,0 +1,67 @@
+'''
+Tests the Replay* Collection of a maker module.
+'''
+
+# built-in imports
+from typing import List, Tuple
+
+# library imports
+from ..replay import SimpleTraceRecorder, SimpleTraceReplay
+from ..simple import SimpleMakerFacade
+
+from ...database.simple import SimpleGraphDB
+
+
+'''
+Unit tests for seekable replay.
+'''
+
+def test_simple_trace_replay() -> None:
+    '''
+    Tests that a `SimpleTraceReplay` reconstructs the path at every step of a trace recorded by a `SimpleMakerFacade`.
+    '''
+    recorder: SimpleTraceRecorder = SimpleTraceRecorder(interval = 3)
+
+    facade: SimpleMakerFacade[type] = SimpleMakerFacade(graph = SimpleGraphDB(), recorder = recorder)
+
+    # record the path after every step as the expected timeline
+
+    expected: List[Tuple[int, ...]] = [(0,)]
+
+    for i in range(0, 3):
+        facade.trace_(data = int); expected.append(tuple(facade.context._path) + (facade._strategy._frontier,)) # type: ignore private usage
+
+        for _ in range(i + 1, 3):
+            facade.trace_(data = str); expected.append(tuple(facade.context._path) + (facade._strategy._frontier,)) # type: ignore private usage
+
+            facade.untrace_(); expected.append(tuple(facade.context._path) + (facade._strategy._frontier,)) # type: ignore private usage
+
+        facade.untrace_(); expected.append(tuple(facade.context._path) + (facade._strategy._frontier,)) # type: ignore private usage
+
+    # test the recorded stream and its checkpoints
+
+    assert facade.recorder is recorder and len(recorder) == 12, 'expected <%s> to record every step.' % SimpleTraceRecorder.__name__
+
+    assert recorder.checkpoint_steps == [0, 3, 6, 9, 12], 'expected <%s> to checkpoint every interval.' % SimpleTraceRecorder.__name__
+
+    # test seeking to every step, in any order
+
+    replay: SimpleTraceReplay = SimpleTraceReplay(recorder = recorder)
+
+    for step in reversed(range(len(expected))):
+        assert replay.seek(step = step) == expected[step], 'expected <%s>.seek(..) to reconstruct the path at step %d.' % (SimpleTraceReplay.__name__, step)
+
+    assert replay.frontier(step = 2) == 2, 'expected <%s>.frontier(..) to reconstruct the frontier.' % SimpleTraceReplay.__name__
+
+    # test that seeking past the end raises an error
+
+    try:
+        replay.seek(step = 13)
+
+        raise AssertionError('expected <%s>.seek(..) to raise an error past the end.' % SimpleTraceReplay.__name__) # pragma: no cover
+
+    except IndexError: pass
+
+    # all tests passed
+
+    return None
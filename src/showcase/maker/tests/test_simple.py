@@ -6,7 +6,10 @@ Tests the Simple* implementation of a maker module.
 from typing import Any, Generic, TypeVar
 
 # library imports
-from ..simple import SimpleMakerFacade, SimpleBufferedGraphColouringContext, SimpleBufferedGraphColouringStrategy, PartiallyStatefulDirectedGraphInterface, SimpleGraphKey, SimpleGraphMemento
+from ..replay import SimpleTraceRecorder, SimpleTraceReplay
+from ..simple import SimpleMakerFacade, SimpleBufferedGraphColouringContext, SimpleBufferedGraphColouringStrategy, SimpleTraceScope, PartiallyStatefulDirectedGraphInterface, SimpleGraphKey, SimpleGraphMemento
+
+from ...database.snapshot import SnapshotGraphDB
 
 # external imports
 from networkx.classes.digraph import DiGraph
@@ -214,3 +217,95 @@ def test_simple_maker_facade() -> None:
     # all tests passed
 
     return None
+
+
+def test_fast_path_buffered_graph_colouring_strategy() -> None:
+    '''
+    Tests that the fast paths of a `SimpleBufferedGraphColouringStrategy` write the same trace as `.extend_(..)` and `.retreat_(..)`.
+    '''
+    slow: SimpleMakerFacade[SimpleGraphMemento] = SimpleMakerFacade(graph = MockSimpleGraphDB(), recorder = SimpleTraceRecorder())
+
+    fast: SimpleMakerFacade[SimpleGraphMemento] = SimpleMakerFacade(graph = MockSimpleGraphDB(), recorder = SimpleTraceRecorder())
+
+    for memento in (int, str, float):
+        slow.trace_(data = memento); slow.trace_(data = memento); slow.untrace_(); slow.untrace_()
+
+        fast._strategy.extend_fast_(memento); fast._strategy.extend_fast_(memento); fast._strategy.retreat_fast_(); fast._strategy.retreat_fast_()  # type: ignore private usage
+
+    assert list(fast.graph.data.nodes(data = True)) == list(slow.graph.data.nodes(data = True)) and list(fast.graph.data.edges) == list(slow.graph.data.edges), 'expected <%s> fast paths to write the same trace.' % SimpleBufferedGraphColouringStrategy.__name__  # type: ignore unknown members
+
+    assert fast.recorder.events == slow.recorder.events and fast.depth == 0, 'expected <%s> fast paths to record the same steps.' % SimpleBufferedGraphColouringStrategy.__name__  # type: ignore optional member
+
+    # all tests passed
+
+    return None
+
+
+def test_simple_trace_scope() -> None:
+    '''
+    Tests that `SimpleMakerFacade.restore_(..)` and a `SimpleTraceScope` unwind a trace in one step.
+    '''
+    graph: SnapshotGraphDB[int, SimpleGraphMemento] = SnapshotGraphDB()
+
+    recorder: SimpleTraceRecorder = SimpleTraceRecorder(interval = 4)
+
+    facade: SimpleMakerFacade[SimpleGraphMemento] = SimpleMakerFacade(graph = graph, recorder = recorder)
+
+    # test restoring to an absolute depth
+
+    for memento in (int, str, float): facade.trace_(data = memento)
+
+    facade.restore_(depth = 1)
+
+    assert facade.depth == 1 and facade._strategy._frontier == 1 and facade.context._path == [0], 'expected <%s>.restore_(..) to truncate the path.' % SimpleMakerFacade.__name__  # type: ignore private usage
+
+    assert graph.epoch == 1 and len(recorder) == 5 and recorder.checkpoint_steps == [0, 5], 'expected <%s>.restore_(..) to publish once and record a retreat a level, checkpointing after the batch.' % SimpleMakerFacade.__name__
+
+    assert SimpleTraceReplay(recorder = recorder).seek(step = 5) == (0, 1), 'expected <%s>.restore_(..) to replay as retreats.' % SimpleMakerFacade.__name__
+
+    try:
+        facade.restore_(depth = 2)
+
+        raise AssertionError('expected <%s>.restore_(..) to refuse to restore to a deeper depth.' % SimpleMakerFacade.__name__) # pragma: no cover
+
+    except ValueError: pass # check passed
+
+    # test that a scope unwinds after an exception skipped an untrace
+
+    try:
+        with facade.scope(data = int):
+            facade.trace_(data = str)
+
+            raise RuntimeError
+
+    except RuntimeError: pass # check passed
+
+    assert facade.depth == 1 and facade._strategy._frontier == 1, 'expected <%s> to restore the depth on an exception.' % SimpleTraceScope.__name__  # type: ignore private usage
+
+    # test that a scope does not mask an exception from a body that untraced past it
+
+    try:
+        with facade.scope():
+            facade.untrace_()
+
+            raise KeyError
+
+    except KeyError: pass # check passed
+
+    assert facade.depth == 0, 'expected <%s> to leave a body that untraced past its entry depth.' % SimpleTraceScope.__name__
+
+    facade.trace_(data = int)
+
+    # test that a scope can decorate a recursive function
+
+    @facade.scope()
+    def recurse(level: int) -> int:
+        facade.trace_(data = int)
+
+        return facade.depth if level == 0 else recurse(level = level - 1)
+
+    assert recurse(level = 3) == 5 and facade.depth == 1, 'expected <%s> to restore the depth as a decorator.' % SimpleTraceScope.__name__
+
+    # all tests passed
+
+    return None
@@ -0,0 +1,20 @@
+'''
+ABC types for the metrics module.
+'''
+
+# built-in imports
+from abc import abstractmethod, ABC
+from typing import Any
+
+
+class LatencyHookInterface(ABC):
+    '''
+    ABC for objects that can observe how long an instrumented call took, such as an attached profiler.
+    '''
+
+    @abstractmethod
+    def observe_latency_(self, name: str, seconds: float, *args: Any, **kwargs: Any) -> None:
+        '''
+        Observes that the instrumented call with this `name` took this many `seconds`.
+        '''
+        raise NotImplementedError('%s requires an .observe_latency(..) abstract method.' % LatencyHookInterface.__name__)
@@ -0,0 +1,338 @@
+'''
+Simple* Collection for the metrics module.
+'''
+
+# built-in imports
+from bisect import bisect_left
+from functools import wraps
+from os import replace
+from re import sub
+from threading import local
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Sequence, Set, Tuple
+from typing_extensions import TypeAlias
+
+# library imports
+from ._interface import LatencyHookInterface
+
+from ..assembler.simple import SimpleAssembler
+from ..database.columnar import ColumnarGraphDB
+from ..database.csr import CSRGraphDB
+from ..database.interning import InterningGraphDB
+from ..database.remote import RemoteGraphDB
+from ..database.simple import SimpleGraphDB
+from ..database.snapshot import SnapshotGraphDB
+from ..database.tiered import TieredGraphDB
+from ..maker.simple import SimpleBufferedGraphColouringStrategy, SimpleMakerFacade
+
+
+'''
+Types.
+'''
+
+InstrumentationTarget: TypeAlias = Tuple[type, str, str]
+
+DEFAULT_BUCKETS: Tuple[float, ...] = tuple(base * 10.0 ** exponent for exponent in range(-7, 1) for base in (1.0, 2.5, 5.0))
+
+DEFAULT_TARGETS: Tuple[InstrumentationTarget, ...] = \
+(
+    (SimpleMakerFacade, 'trace_', 'maker.trace'),
+    (SimpleMakerFacade, 'untrace_', 'maker.untrace'),
+    (SimpleBufferedGraphColouringStrategy, 'extend_fast_', 'maker.trace'),
+    (SimpleBufferedGraphColouringStrategy, 'retreat_fast_', 'maker.untrace'),
+    *[
+        (backend, method, name)
+        for backend in (SimpleGraphDB, SnapshotGraphDB, TieredGraphDB, InterningGraphDB, RemoteGraphDB)
+        for method, name in (('write_stateful_vertex_', 'database.write_vertex'), ('write_stateless_directed_edge_', 'database.write_edge'), ('load_stateful_vertex', 'database.load_vertex'))
+    ],
+    (ColumnarGraphDB, 'write_stateful_vertex_', 'database.write_vertex'),
+    (CSRGraphDB, 'write_stateless_directed_edge_', 'database.write_edge'),
+    (SimpleAssembler, 'get_component', 'assembler.get_component'),
+)
+
+_ORIGINAL: str = '__metrics_original__'
+
+
+'''
+Concrete classes.
+'''
+
+class SimpleLatencyHistogram:
+    '''
+    Class that can count latencies into fixed buckets and keep their running sum.
+
+    Updates are two list writes and a bisection, with no locking, so concurrent writers may occasionally lose a count.
+    '''
+
+    __bounds: Tuple[float, ...]
+    __counts: List[int]
+    __sum: float
+
+    '''
+    Dunder and property methods.
+    '''
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS, *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up a bucket for each of these ascending upper `bounds` and one for anything slower.
+        '''
+        self.__bounds = tuple(bounds)
+
+        self.__counts = [0] * (len(self.__bounds) + 1)
+
+        self.__sum = 0.0
+
+        return None
+
+    @property
+    def bounds(self) -> Tuple[float, ...]: return self.__bounds
+
+    @property
+    def counts(self) -> List[int]: return list(self.__counts)
+
+    @property
+    def count(self) -> int: return sum(self.__counts)
+
+    @property
+    def total(self) -> float: return self.__sum
+
+    '''
+    Histogram logic.
+    '''
+
+    def observe_(self, seconds: float, *args: Any, **kwargs: Any) -> None:
+        '''
+        Counts a latency of this many `seconds`.
+        '''
+        self.__counts[bisect_left(self.__bounds, seconds)] += 1
+
+        self.__sum += seconds
+
+        return None
+
+    def quantile(self, fraction: float, *args: Any, **kwargs: Any) -> float:
+        '''
+        Estimates this `fraction` quantile as the upper bound of the bucket it falls in.
+        '''
+        rank: float = fraction * self.count
+
+        seen: int = 0
+
+        for bound, count in zip(self.__bounds + (float('inf'),), self.__counts):
+            seen += count
+
+            if count and seen >= rank: return bound
+
+        return 0.0
+
+
+class SimpleMetricsRegistry:
+    '''
+    Class that can time calls to maker, database and assembler methods and export what it saw.
+
+    Instrumenting a method swaps a timing wrapper onto its class and uninstrumenting swaps the original back, so a
+    disabled registry costs nothing. Each timing is also passed to every attached `LatencyHookInterface` type.
+
+    Every database backend is timed under the same names, and a call made while a call with the same name is timing on
+    the same thread, such as an override calling `super()` or `InterningGraphDB` calling its backend, is not timed again.
+    A `GraphServer` in the same process still times its graph on its own threads.
+
+    The strategy's fast paths are timed under the maker names too, but a `SimpleModuleTracer` binds them when it attaches,
+    so enable the registry before attaching a tracer for its calls to be timed.
+    '''
+
+    __histograms: Dict[str, SimpleLatencyHistogram]
+    __counters: Dict[str, float]
+    __hooks: List[LatencyHookInterface]
+    __instrumented: List[InstrumentationTarget]
+    __active: local
+
+    '''
+    Dunder and property methods.
+    '''
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up an empty registry with nothing instrumented.
+        '''
+        self.__histograms = dict()
+
+        self.__counters = dict()
+
+        self.__hooks = list()
+
+        self.__instrumented = list()
+
+        self.__active = local()
+
+        return None
+
+    def __enter__(self) -> 'SimpleMetricsRegistry': return self.enable_()
+
+    def __exit__(self, *args: Any) -> None: self.disable_()
+
+    @property
+    def enabled(self) -> bool: return bool(self.__instrumented)
+
+    @property
+    def hooks(self) -> List[LatencyHookInterface]: return self.__hooks
+
+    '''
+    Instrumentation logic.
+    '''
+
+    def enable_(self, targets: Sequence[InstrumentationTarget] = DEFAULT_TARGETS, *args: Any, **kwargs: Any) -> 'SimpleMetricsRegistry':
+        '''
+        Instruments each `(owner, method, name)` in these `targets`, by default the maker, database and assembler hot paths.
+        '''
+        for owner, method, name in targets: self.instrument_(owner = owner, method = method, name = name)
+
+        return self
+
+    def disable_(self, *args: Any, **kwargs: Any) -> None:
+        '''
+        Restores every method that this registry instrumented.
+        '''
+        for owner, method, _ in reversed(self.__instrumented):
+            setattr(owner, method, getattr(getattr(owner, method), _ORIGINAL))
+
+        self.__instrumented = list()
+
+        return None
+
+    def instrument_(self, owner: type, method: str, name: str, *args: Any, **kwargs: Any) -> None:
+        '''
+        Swaps a wrapper onto the `method` of this `owner` class that times each call into the histogram with this `name`.
+        '''
+        original: Callable[..., Any] = owner.__dict__.get(method)  # type: ignore optional lookup
+
+        if original is None: raise AttributeError('%s cannot instrument %s.%s, which it does not define.' % (SimpleMetricsRegistry.__name__, owner.__name__, method))
+
+        if hasattr(original, _ORIGINAL): raise RuntimeError('%s.%s is already instrumented.' % (owner.__name__, method))
+
+        histogram: SimpleLatencyHistogram = self.__histograms.setdefault(name, SimpleLatencyHistogram())
+
+        observe: Callable[..., None] = histogram.observe_
+
+        hooks: List[LatencyHookInterface] = self.__hooks
+
+        active: local = self.__active
+
+        @wraps(original)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            timing: Set[str] = active.__dict__.setdefault('names', set())
+
+            if name in timing: return original(*args, **kwargs)
+
+            timing.add(name)
+
+            start: float = perf_counter()
+
+            try: return original(*args, **kwargs)
+
+            finally:
+                elapsed: float = perf_counter() - start
+
+                timing.discard(name)
+
+                observe(elapsed)
+
+                for hook in hooks: hook.observe_latency_(name, elapsed)
+
+        setattr(timed, _ORIGINAL, original)
+
+        setattr(owner, method, timed)
+
+        self.__instrumented.append((owner, method, name))
+
+        return None
+
+    def attach_hook_(self, hook: LatencyHookInterface, *args: Any, **kwargs: Any) -> None:
+        '''
+        Attaches this `hook` so that it observes every timed call.
+        '''
+        self.__hooks.append(hook)
+
+        return None
+
+    def increment_(self, name: str, amount: float = 1.0, *args: Any, **kwargs: Any) -> None:
+        '''
+        Adds this `amount` to the counter with this `name`.
+        '''
+        self.__counters[name] = self.__counters.get(name, 0.0) + amount
+
+        return None
+
+    '''
+    Export logic.
+    '''
+
+    def stats(self, *args: Any, **kwargs: Any) -> Dict[str, Dict[str, Any]]:
+        '''
+        Takes a snapshot of every counter and of the count, sum, mean and estimated quantiles of every histogram.
+        '''
+        histograms: Dict[str, Any] = dict()
+
+        for name, histogram in self.__histograms.items():
+            count: int = histogram.count
+
+            histograms[name] = \
+            {
+                'count': count,
+                'sum': histogram.total,
+                'mean': histogram.total / count if count else 0.0,
+                'p50': histogram.quantile(fraction = 0.5),
+                'p99': histogram.quantile(fraction = 0.99),
+            }
+
+        return { 'counters': dict(self.__counters), 'histograms': histograms }
+
+    def to_prometheus(self, prefix: str = 'decode', *args: Any, **kwargs: Any) -> str:
+        '''
+        Renders every counter and histogram in the Prometheus text exposition format.
+        '''
+        lines: List[str] = list()
+
+        for name, value in sorted(self.__counters.items()):
+            metric: str = _metric_name(prefix = prefix, name = name) + '_total'
+
+            lines.extend(['# TYPE %s counter' % metric, '%s %r' % (metric, value)])
+
+        for name, histogram in sorted(self.__histograms.items()):
+            metric = _metric_name(prefix = prefix, name = name) + '_seconds'
+
+            lines.append('# TYPE %s histogram' % metric)
+
+            cumulative: int = 0
+
+            for bound, count in zip(histogram.bounds + (float('inf'),), histogram.counts):
+                cumulative += count
+
+                lines.append('%s_bucket{le="%s"} %d' % (metric, '+Inf' if bound == float('inf') else repr(bound), cumulative))
+
+            lines.extend(['%s_sum %r' % (metric, histogram.total), '%s_count %d' % (metric, cumulative)])
+
+        return '\n'.join(lines) + '\n'
+
+    def export_prometheus_(self, path: str, prefix: str = 'decode', *args: Any, **kwargs: Any) -> None:
+        '''
+        Writes the Prometheus text format to this `path` atomically, for a node exporter's textfile collector.
+        '''
+        staging: str = path + '.tmp'
+
+        with open(staging, 'w') as stream: stream.write(self.to_prometheus(prefix = prefix))
+
+        replace(staging, path)
+
+        return None
+
+
+'''
+Helper functions.
+'''
+
+def _metric_name(prefix: str, name: str) -> str:
+    '''
+    Joins this `prefix` and `name` into a valid Prometheus metric name.
+    '''
+    return sub(r'[^a-zA-Z0-9_]', '_', '%s_%s' % (prefix, name))
@@ -0,0 +1,169 @@
+'''
+Tests the Simple* implementation of the metrics module.
+'''
+
+# built-in imports
+from os.path import join
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, List, Tuple
+
+# library imports
+from ..simple import SimpleLatencyHistogram, SimpleMetricsRegistry, LatencyHookInterface
+
+from ...assembler.simple import SimpleAssembler
+from ...database.columnar import ColumnarGraphDB
+from ...database.csr import CSRGraphDB
+from ...database.interning import InterningGraphDB
+from ...database.simple import SimpleGraphDB
+from ...database.snapshot import SnapshotGraphDB
+from ...database.tiered import TieredGraphDB
+from ...maker.autotrace import SimpleModuleTracer
+from ...maker.simple import SimpleMakerFacade
+
+# external imports
+from torch import zeros
+from torch.nn import Linear, ReLU, Sequential
+
+
+'''
+Mock-ups for testing.
+'''
+
+class MockProfilerHook(LatencyHookInterface):
+    '''
+    Hook that keeps every timing it observes.
+    '''
+
+    def __init__(self) -> None: self.observed: List[Tuple[str, float]] = list()
+
+    def observe_latency_(self, name: str, seconds: float, *args: Any, **kwargs: Any) -> None: self.observed.append((name, seconds))
+
+
+'''
+Unit tests for histograms.
+'''
+
+def test_simple_latency_histogram() -> None:
+    '''
+    Tests that a `SimpleLatencyHistogram` buckets latencies and estimates quantiles.
+    '''
+    histogram: SimpleLatencyHistogram = SimpleLatencyHistogram(bounds = [0.1, 1.0])
+
+    for seconds in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe_(seconds = seconds)
+
+    assert histogram.counts == [1, 2, 1] and histogram.total == 6.05, 'expected <%s>.observe(..) to bucket each latency.' % SimpleLatencyHistogram.__name__
+
+    assert histogram.quantile(fraction = 0.5) == 1.0 and histogram.quantile(fraction = 1.0) == float('inf'), 'expected <%s>.quantile(..) to return bucket bounds.' % SimpleLatencyHistogram.__name__
+
+    # all tests passed
+
+    return None
+
+
+'''
+Unit tests for the metrics registry.
+'''
+
+def test_simple_metrics_registry() -> None:
+    '''
+    Tests that a `SimpleMetricsRegistry` times the hot paths only while it is enabled.
+    '''
+    registry: SimpleMetricsRegistry = SimpleMetricsRegistry()
+
+    hook: MockProfilerHook = MockProfilerHook()
+
+    registry.attach_hook_(hook = hook)
+
+    original = SimpleMakerFacade.trace_
+
+    graph: SimpleGraphDB[int, type] = SimpleGraphDB()
+
+    facade: SimpleMakerFacade[type] = SimpleMakerFacade(graph = graph)
+
+    with registry:
+        facade.trace_(data = int)
+
+        facade.untrace_()
+
+        SimpleAssembler(database = graph).get_component(key = 1)
+
+        registry.increment_(name = 'episodes')
+
+    # test that every hot path was timed
+
+    stats = registry.stats()
+
+    assert { name: value['count'] for name, value in stats['histograms'].items() } == { 'maker.trace': 1, 'maker.untrace': 1, 'database.write_vertex': 1, 'database.write_edge': 1, 'database.load_vertex': 1, 'assembler.get_component': 1 }, 'expected <%s> to time each hot path once.' % SimpleMetricsRegistry.__name__
+
+    assert stats['counters'] == { 'episodes': 1.0 }, 'expected <%s>.increment(..) to count.' % SimpleMetricsRegistry.__name__
+
+    assert [ name for name, _ in hook.observed ][:2] == ['database.write_vertex', 'database.write_edge'], 'expected <%s> to pass every timing to its hooks.' % SimpleMetricsRegistry.__name__
+
+    # test that disabling restores the original methods
+
+    assert SimpleMakerFacade.trace_ is original and not registry.enabled, 'expected <%s>.disable(..) to restore the original methods.' % SimpleMetricsRegistry.__name__
+
+    facade.trace_(data = str)
+
+    assert registry.stats()['histograms']['maker.trace']['count'] == 1, 'expected <%s> to stop timing once disabled.' % SimpleMetricsRegistry.__name__
+
+    # test the prometheus exporter
+
+    with TemporaryDirectory() as directory:
+        registry.export_prometheus_(path = join(directory, 'decode.prom'))
+
+        with open(join(directory, 'decode.prom')) as stream: text: str = stream.read()
+
+    assert 'decode_episodes_total 1.0' in text and 'decode_maker_trace_seconds_count 1' in text and 'decode_maker_trace_seconds_bucket{le="+Inf"} 1' in text, 'expected <%s>.export_prometheus(..) to write the text format.' % SimpleMetricsRegistry.__name__
+
+    # all tests passed
+
+    return None
+
+
+def test_simple_metrics_registry_backends() -> None:
+    '''
+    Tests that a `SimpleMetricsRegistry` times every database backend once a call, even through overrides and wrappers.
+    '''
+    registry: SimpleMetricsRegistry = SimpleMetricsRegistry()
+
+    backends: List[Any] = [SnapshotGraphDB(), TieredGraphDB(), CSRGraphDB(), ColumnarGraphDB(fields = { 'real': 'real' }), InterningGraphDB(backend = SimpleGraphDB())]
+
+    with registry:
+        for backend in backends:
+            backend.write_stateful_vertex_(label = 0, data = 1); backend.write_stateful_vertex_(label = 1, data = 2)
+
+            backend.write_stateless_directed_edge_(source = 0, destination = 1)
+
+            if hasattr(backend, 'publish_epoch_'): backend.publish_epoch_()
+
+            backend.load_stateful_vertex(label = 1)
+
+    counts: Dict[str, int] = { name: value['count'] for name, value in registry.stats()['histograms'].items() if name.startswith('database.') }
+
+    assert counts == { 'database.write_vertex': 2 * len(backends), 'database.write_edge': len(backends), 'database.load_vertex': len(backends) }, 'expected <%s> to time each backend call once.' % SimpleMetricsRegistry.__name__
+
+    # all tests passed
+
+    return None
+
+
+def test_simple_metrics_registry_autotrace() -> None:
+    '''
+    Tests that a `SimpleMetricsRegistry` times the fast paths that a `SimpleModuleTracer` calls.
+    '''
+    registry: SimpleMetricsRegistry = SimpleMetricsRegistry()
+
+    network: Sequential = Sequential(Linear(4, 4), ReLU(), Linear(4, 2))
+
+    with registry, SimpleModuleTracer(facade = SimpleMakerFacade(graph = SimpleGraphDB()), module = network):
+        network(zeros(1, 4))
+
+    counts: Dict[str, int] = { name: value['count'] for name, value in registry.stats()['histograms'].items() if name.startswith('maker.') }
+
+    assert counts == { 'maker.trace': 4, 'maker.untrace': 4 }, 'expected <%s> to time each traced module call once.' % SimpleMetricsRegistry.__name__
+
+    # all tests passed
+
+    return None
@@ -0,0 +1,62 @@
+'''
+Runs a synthetic stress workload against database backends from the command line.
+
+For example, `python -m src.showcase.stress --backends simple snapshot --episodes 1000 --read-ratio 4`.
+'''
+
+# built-in imports
+from argparse import ArgumentParser, Namespace
+from json import dump
+from typing import Any, Dict, List
+
+# library imports
+from .simple import STRESS_BACKENDS, SimpleStressHarness, StressReport, StressWorkload, format_reports
+
+
+def main() -> None:
+    '''
+    Parses a workload from the command line, runs it and prints a report, optionally writing the samples as JSON.
+    '''
+    defaults: StressWorkload = StressWorkload()
+
+    parser: ArgumentParser = ArgumentParser(prog = 'python -m src.showcase.stress', description = 'Stress the decode pipeline with synthetic RL-shaped traces.')
+
+    parser.add_argument('--backends', nargs = '+', choices = list(STRESS_BACKENDS), default = list(STRESS_BACKENDS))
+
+    for field in StressWorkload._fields:
+        parser.add_argument('--%s' % field.replace('_', '-'), type = type(getattr(defaults, field)), default = getattr(defaults, field))
+
+    parser.add_argument('--json', default = None, help = 'a path to write every report and its samples to.')
+
+    arguments: Namespace = parser.parse_args()
+
+    workload: StressWorkload = StressWorkload(**{ field: getattr(arguments, field) for field in StressWorkload._fields })
+
+    reports: List[StressReport] = SimpleStressHarness(workload = workload).run_all(names = arguments.backends)
+
+    print(format_reports(reports = reports))
+
+    if arguments.json is not None:
+        documents: List[Dict[str, Any]] = \
+        [
+            {
+                'backend': report.backend,
+                'workload': workload._asdict(),
+                'seconds': report.seconds,
+                'writes': report.writes,
+                'reads': report.reads,
+                'misses': report.misses,
+                'errors': report.errors,
+                'write_latency': { 'bounds': report.write_latency.bounds, 'counts': report.write_latency.counts },
+                'read_latency': { 'bounds': report.read_latency.bounds, 'counts': report.read_latency.counts },
+                'samples': [ sample._asdict() for sample in report.samples ],
+            }
+            for report in reports
+        ]
+
+        with open(arguments.json, 'w') as stream: dump(documents, stream, indent = 2)
+
+    return None
+
+
+if __name__ == '__main__': main()
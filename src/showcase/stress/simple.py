@@ -0,0 +1,438 @@
+'''
+Simple* Collection for the stress module.
+
+Drives every database backend with synthetic, RL-shaped tracing workloads and a simulated front-end reader.
+'''
+
+# built-in imports
+from os import sysconf
+from random import Random
+from threading import Event, Thread
+from time import perf_counter, sleep
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from typing_extensions import TypeAlias
+
+# library imports
+from ..assembler.simple import SimpleAssembler
+from ..database.columnar import ColumnarGraphDB
+from ..database.csr import CSRGraphDB
+from ..database.interning import InterningGraphDB
+from ..database.remote import GraphServer, RemoteGraphDB
+from ..database.simple import SimpleGraphDB
+from ..database.snapshot import SnapshotGraphDB
+from ..database.tiered import TieredGraphDB
+from ..maker.simple import SimpleMakerFacade
+from ..metrics.simple import SimpleLatencyHistogram
+
+
+'''
+Types.
+'''
+
+StressBackend: TypeAlias = Tuple[Any, Callable[[], None]]
+
+
+class SyntheticEpisode:
+    '''
+    Memento for the start of an episode.
+    '''
+
+    cost: float = 0.0
+
+
+class SyntheticStep:
+    '''
+    Memento for a policy forward pass at one environment step.
+    '''
+
+    cost: float = 0.0
+
+
+class SyntheticLinear:
+    '''
+    Memento for a linear layer.
+    '''
+
+    cost: float = 4.0
+
+
+class SyntheticActivation:
+    '''
+    Memento for an activation layer.
+    '''
+
+    cost: float = 1.0
+
+
+class SyntheticNorm:
+    '''
+    Memento for a normalisation layer.
+    '''
+
+    cost: float = 2.0
+
+
+SYNTHETIC_LAYERS: Tuple[type, ...] = (SyntheticLinear, SyntheticActivation, SyntheticNorm)
+
+
+class StressWorkload(NamedTuple):
+    '''
+    The shape of a synthetic workload.
+
+    Each of `writers` tracing workers runs `episodes` episodes of `steps` environment steps. Each step traces a policy
+    forward pass as a tree of `depth` levels below the step, where every layer has between one and `fan_out` children. An
+    episode terminates early at any layer with probability `termination`, unwinding through a scope. `readers` simulated
+    front-end readers keep their combined reads at `read_ratio` times the writes so far. A sample is taken every
+    `sample_interval` seconds and every worker's randomness follows from `seed`.
+    '''
+
+    episodes: int = 50
+    steps: int = 8
+    depth: int = 3
+    fan_out: int = 3
+    termination: float = 0.01
+    writers: int = 2
+    readers: int = 2
+    read_ratio: float = 1.0
+    seed: int = 0
+    sample_interval: float = 0.1
+
+
+class StressSample(NamedTuple):
+    '''
+    The totals and resident memory of a run at `elapsed` seconds.
+    '''
+
+    elapsed: float
+    writes: int
+    reads: int
+    resident_bytes: int
+
+
+class StressReport(NamedTuple):
+    '''
+    The throughput, latency and memory of one workload against one backend.
+
+    Reads of a vertex that is not visible yet, such as in an unpublished epoch, are counted as `misses`. Anything else a
+    read raises is counted in `errors`.
+    '''
+
+    backend: str
+    seconds: float
+    writes: int
+    reads: int
+    misses: int
+    errors: int
+    write_latency: SimpleLatencyHistogram
+    read_latency: SimpleLatencyHistogram
+    samples: List[StressSample]
+
+    @property
+    def write_throughput(self) -> float: return self.writes / self.seconds if self.seconds else 0.0
+
+    @property
+    def read_throughput(self) -> float: return self.reads / self.seconds if self.seconds else 0.0
+
+
+class _EpisodeTerminated(Exception):
+    '''
+    Raised inside a traced episode to end it early.
+    '''
+
+    pass
+
+
+'''
+Concrete classes.
+'''
+
+class SimpleStressHarness:
+    '''
+    Class that can run a `StressWorkload` against database backends and report on each run.
+
+    Every tracing worker writes into its own backend instance through its own `SimpleMakerFacade`, since facades number
+    their vertices from zero and would collide in a shared graph. Readers pick a worker's backend and a vertex it has
+    already written at random, then load it through a `SimpleAssembler`. A worker's write count only goes up once
+    `.trace_(..)` has returned, so readers never sample a vertex that is still being written.
+    '''
+
+    __workload: StressWorkload
+
+    '''
+    Dunder and property methods.
+    '''
+
+    def __init__(self, workload: StressWorkload = StressWorkload(), *args: Any, **kwargs: Any) -> None:
+        '''
+        Sets up a harness for this `workload`.
+        '''
+        self.__workload = workload
+
+        return None
+
+    @property
+    def workload(self) -> StressWorkload: return self.__workload
+
+    '''
+    Harness logic.
+    '''
+
+    def run(self, name: str, factory: Callable[[], StressBackend], *args: Any, **kwargs: Any) -> StressReport:
+        '''
+        Runs the workload against backends made by this `factory`, reporting under this `name`.
+        '''
+        workload: StressWorkload = self.__workload
+
+        backends: List[StressBackend] = [ factory() for _ in range(workload.writers) ]
+
+        facades: List[SimpleMakerFacade[type]] = [ SimpleMakerFacade(graph = graph) for graph, _ in backends ]
+
+        assemblers: List[SimpleAssembler[type]] = [ SimpleAssembler(database = graph) for graph, _ in backends ]
+
+        # each worker only writes its own slot, so the totals need no lock. a writer's vertices are numbered from one, so
+        # its write count is also the highest label it has finished writing.
+
+        writes: List[int] = [0] * workload.writers
+
+        reads: List[int] = [0] * workload.readers
+
+        misses: List[int] = [0] * workload.readers
+
+        errors: List[int] = [0] * workload.readers
+
+        write_latency: SimpleLatencyHistogram = SimpleLatencyHistogram()
+
+        read_latency: SimpleLatencyHistogram = SimpleLatencyHistogram()
+
+        samples: List[StressSample] = list()
+
+        writing: Event = Event(); sampling: Event = Event()
+
+        start: float = perf_counter()
+
+        def write(index: int) -> None:
+            rng: Random = Random(workload.seed * 7919 + index)
+
+            facade: SimpleMakerFacade[type] = facades[index]
+
+            observe: Callable[..., None] = write_latency.observe_
+
+            def trace(memento: type) -> None:
+                began: float = perf_counter()
+
+                facade.trace_(data = memento)
+
+                observe(perf_counter() - began)
+
+                writes[index] += 1
+
+            def forward(level: int) -> None:
+                if rng.random() < workload.termination: raise _EpisodeTerminated
+
+                for _ in range(rng.randint(1, workload.fan_out)):
+                    trace(memento = rng.choice(SYNTHETIC_LAYERS))
+
+                    if level < workload.depth: forward(level = level + 1)
+
+                    facade.untrace_()
+
+            for _ in range(workload.episodes):
+                try:
+                    with facade.scope():
+                        trace(memento = SyntheticEpisode)
+
+                        for _ in range(workload.steps):
+                            trace(memento = SyntheticStep)
+
+                            forward(level = 1)
+
+                            facade.untrace_()
+
+                except _EpisodeTerminated: pass
+
+        def read(index: int) -> None:
+            rng: Random = Random(workload.seed * 7919 + workload.writers + index)
+
+            observe: Callable[..., None] = read_latency.observe_
+
+            while True:
+                if sum(reads) >= workload.read_ratio * sum(writes):
+                    if not writing.is_set(): return
+
+                    sleep(0.0005); continue
+
+                writer: int = rng.randrange(workload.writers)
+
+                nodes: int = writes[writer]
+
+                if not nodes: continue
+
+                began: float = perf_counter()
+
+                try: assemblers[writer].get_component(key = rng.randint(1, nodes))
+
+                except KeyError: misses[index] += 1
+
+                except Exception: errors[index] += 1
+
+                observe(perf_counter() - began)
+
+                reads[index] += 1
+
+        def sample() -> None:
+            while not sampling.wait(timeout = workload.sample_interval):
+                samples.append(StressSample(elapsed = perf_counter() - start, writes = sum(writes), reads = sum(reads), resident_bytes = resident_bytes()))
+
+        writing.set(); sampling.clear()
+
+        writer_threads: List[Thread] = [ Thread(target = write, args = (index,)) for index in range(workload.writers) ]
+
+        reader_threads: List[Thread] = [ Thread(target = read, args = (index,)) for index in range(workload.readers) ]
+
+        sampler: Thread = Thread(target = sample, daemon = True)
+
+        try:
+            for thread in writer_threads + reader_threads + [sampler]: thread.start()
+
+            for thread in writer_threads: thread.join()
+
+            writing.clear()
+
+            for thread in reader_threads: thread.join()
+
+            seconds: float = perf_counter() - start
+
+            sampling.set(); sampler.join()
+
+            samples.append(StressSample(elapsed = seconds, writes = sum(writes), reads = sum(reads), resident_bytes = resident_bytes()))
+
+        finally:
+            writing.clear(); sampling.set()
+
+            for _, close in backends: close()
+
+        return StressReport\
+        (
+            backend = name,
+            seconds = seconds,
+            writes = sum(writes),
+            reads = sum(reads),
+            misses = sum(misses),
+            errors = sum(errors),
+            write_latency = write_latency,
+            read_latency = read_latency,
+            samples = samples
+        )
+
+    def run_all(self, names: Optional[Iterable[str]] = None, *args: Any, **kwargs: Any) -> List[StressReport]:
+        '''
+        Runs the workload against each backend in `STRESS_BACKENDS` with one of these `names`, or against all of them.
+        '''
+        return [ self.run(name = name, factory = STRESS_BACKENDS[name]) for name in (names if names is not None else STRESS_BACKENDS) ]
+
+
+'''
+Helper functions.
+'''
+
+def resident_bytes() -> int:
+    '''
+    Measures the resident memory of this process, or its peak resident memory where `/proc` is not available.
+    '''
+    try:
+        with open('/proc/self/statm') as stream: return int(stream.read().split()[1]) * sysconf('SC_PAGE_SIZE')
+
+    except (OSError, ValueError):
+        from resource import getrusage, RUSAGE_SELF
+
+        return getrusage(RUSAGE_SELF).ru_maxrss * 1024
+
+
+def format_reports(reports: Iterable[StressReport]) -> str:
+    '''
+    Formats these `reports` as a table of throughput, tail latency and memory growth.
+    '''
+    lines: List[str] = ['%-10s %12s %12s %10s %10s %10s %10s %8s %8s %12s' % ('backend', 'writes/s', 'reads/s', 'w-p50', 'w-p99', 'r-p50', 'r-p99', 'misses', 'errors', 'memory')]
+
+    for report in reports:
+        growth: int = report.samples[-1].resident_bytes - report.samples[0].resident_bytes if report.samples else 0
+
+        lines.append\
+        (
+            '%-10s %12.0f %12.0f %10s %10s %10s %10s %8d %8d %11.1fM' %
+            (
+                report.backend,
+                report.write_throughput,
+                report.read_throughput,
+                _format_seconds(report.write_latency.quantile(fraction = 0.5)),
+                _format_seconds(report.write_latency.quantile(fraction = 0.99)),
+                _format_seconds(report.read_latency.quantile(fraction = 0.5)),
+                _format_seconds(report.read_latency.quantile(fraction = 0.99)),
+                report.misses,
+                report.errors,
+                growth / 2 ** 20
+            )
+        )
+
+    return '\n'.join(lines)
+
+
+def _format_seconds(seconds: float) -> str:
+    '''
+    Formats a latency bucket bound in the largest unit that keeps it above one.
+    '''
+    if seconds == float('inf'): return '>1s'
+
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale: return '<=%g%s' % (seconds / scale, unit)
+
+    return '<=%gns' % (seconds / 1e-9)
+
+
+def _simple_backend() -> StressBackend: return SimpleGraphDB(), _close_nothing
+
+
+def _snapshot_backend() -> StressBackend: return SnapshotGraphDB(), _close_nothing
+
+
+def _tiered_backend() -> StressBackend: return TieredGraphDB(), _close_nothing
+
+
+def _columnar_backend() -> StressBackend: return ColumnarGraphDB(fields = { 'cost': 'cost' }), _close_nothing
+
+
+def _csr_backend() -> StressBackend: return CSRGraphDB(), _close_nothing
+
+
+def _interning_backend() -> StressBackend: return InterningGraphDB(backend = SimpleGraphDB()), _close_nothing
+
+
+def _remote_backend() -> StressBackend:
+    '''
+    Serves a `SimpleGraphDB` over loopback TCP and connects a `RemoteGraphDB` to it.
+    '''
+    server: GraphServer[int, type] = GraphServer(graph = SimpleGraphDB(), address = ('127.0.0.1', 0)).start_()
+
+    remote: RemoteGraphDB[int, type] = RemoteGraphDB(address = server.address)
+
+    def close() -> None:
+        remote.close_()
+
+        server.shutdown_()
+
+    return remote, close
+
+
+def _close_nothing() -> None: return None
+
+
+STRESS_BACKENDS: Dict[str, Callable[[], StressBackend]] = \
+{
+    'simple': _simple_backend,
+    'snapshot': _snapshot_backend,
+    'tiered': _tiered_backend,
+    'columnar': _columnar_backend,
+    'csr': _csr_backend,
+    'interning': _interning_backend,
+    'remote': _remote_backend,
+}
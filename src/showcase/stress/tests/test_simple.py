@@ -0,0 +1,44 @@
+'''
+Tests the Simple* Collection of the stress module.
+'''
+
+# built-in imports
+from typing import List
+
+# library imports
+from ..simple import STRESS_BACKENDS, SimpleStressHarness, StressReport, StressWorkload, format_reports
+
+
+'''
+Unit tests for the stress harness.
+'''
+
+def test_simple_stress_harness() -> None:
+    '''
+    Tests that a `SimpleStressHarness` runs a small workload against every backend and reports on it.
+    '''
+    workload: StressWorkload = StressWorkload(episodes = 3, steps = 2, depth = 2, fan_out = 2, termination = 0.0, read_ratio = 2.0, sample_interval = 0.01)
+
+    reports: List[StressReport] = SimpleStressHarness(workload = workload).run_all()
+
+    assert [ report.backend for report in reports ] == list(STRESS_BACKENDS), 'expected <%s>.run_all(..) to run every backend.' % SimpleStressHarness.__name__
+
+    for report in reports:
+        assert report.writes > 0 and report.write_latency.count == report.writes, 'expected <%s> to time every write to %s.' % (SimpleStressHarness.__name__, report.backend)
+
+        assert report.reads >= 2.0 * report.writes and report.read_latency.count == report.reads, 'expected <%s> to keep to the read ratio on %s.' % (SimpleStressHarness.__name__, report.backend)
+
+        assert report.errors == 0 and report.samples[-1].writes == report.writes, 'expected <%s> to read without errors and sample the totals on %s.' % (SimpleStressHarness.__name__, report.backend)
+
+        if report.backend in ('simple', 'tiered', 'columnar', 'csr', 'interning'):
+            assert report.misses == 0, 'expected <%s> to only read vertices that are written on %s.' % (SimpleStressHarness.__name__, report.backend)
+
+    # test that runs are reproducible
+
+    assert SimpleStressHarness(workload = workload).run(name = 'simple', factory = STRESS_BACKENDS['simple']).writes == reports[0].writes, 'expected <%s> to seed its workload.' % SimpleStressHarness.__name__
+
+    assert len(format_reports(reports = reports).splitlines()) == len(reports) + 1, 'expected format_reports(..) to write a row a report.'
+
+    # all tests passed
+
+    return None